@@ -0,0 +1,52 @@
+# benchmarks/__init__.py
+"""
+Micro and load benchmarks for the HydroDrags backend.
+
+Run modules directly, e.g. `python -m benchmarks.settings_provider`.
+"""
+import os
+import time
+from typing import Callable
+
+# Dummy values so Settings() validates without a real .env
+BENCH_ENV = {
+    "API_BASE_URL": "http://localhost:8000",
+    "DATABASE_URL": "mongodb://localhost:27017/hydrodrags_bench",
+    "SMTP_HOST": "localhost",
+    "SMTP_PORT": "25",
+    "SMTP_USERNAME": "bench",
+    "SMTP_PASSWORD": "bench",
+    "SMTP_FROM_EMAIL": "bench@example.com",
+    "JWT_SECRET": "bench-secret",
+    "ADMIN_API_KEY": "bench-admin-key",
+    "PAYPAL_BASE_URL": "http://localhost:9999",
+    "PAYPAL_CLIENT_ID": "bench",
+    "PAYPAL_SECRET": "bench",
+}
+
+
+def ensure_env() -> None:
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
+
+
+def per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    """
+    Average wall time of `fn` in microseconds.
+    """
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of `values` (need not be sorted); 0.0 if empty.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
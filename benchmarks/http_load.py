@@ -0,0 +1,414 @@
+# benchmarks/http_load.py
+"""
+Race-day HTTP endpoints under fixed concurrency: event page, brackets, live
+speed session, event registrations, gate ticket scans and a racer's own
+registrations.
+
+The child server (see benchmarks.server) seeds a synthetic event with Faker:
+every class, a few hundred racers and registrations, and spectator tickets.
+Rounds, winners and speed sessions are then set up through the admin API.
+Each endpoint gets a warm-up and then a fixed number of requests. Latency
+histograms, percentiles, throughput and server CPU per request are written
+to a JSON file tagged with the commit.
+
+    python -m benchmarks.http_load
+    python -m benchmarks.http_load --compare http_load-<old sha>.json
+
+Runs are comparable between commits: fixed seeds, fixed request counts and
+fixed histogram buckets. mongomock is single-threaded and slower than a real
+server, so compare runs made against the same backend; use --mongo-url for
+numbers that mean something in absolute terms.
+"""
+from benchmarks import ensure_env, percentile
+
+ensure_env()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import platform  # noqa: E402
+import random  # noqa: E402
+import subprocess  # noqa: E402
+import time  # noqa: E402
+from collections import Counter  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from benchmarks.server import REPO, BenchServer, add_arguments, cpu_seconds, memory_kb, serve  # noqa: E402
+
+# Upper bounds in ms; the last bucket is everything slower
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+TOKENS = 50
+
+
+# -------------------------
+# Seed data (child process)
+# -------------------------
+
+def seed(args) -> dict:
+    import jwt
+    from faker import Faker
+
+    from core.config.settings import get_settings
+    from core.models import build_default_event_classes, build_default_event_info, build_default_event_rules
+    from core.models.event import Event, EventLocation, EventScheduleItem
+    from core.models.racer import Racer
+    from core.models.registration import EventRegistration
+    from core.models.spectator_ticket import SpectatorTicket
+
+    fake = Faker()
+    fake.seed_instance(args.seed)
+    rng = random.Random(args.seed)
+
+    start = datetime.now(timezone.utc).replace(hour=9, minute=0, second=0, microsecond=0)
+    classes = build_default_event_classes()
+    event = Event(
+        name=f"{fake.city()} Hydrodrags",
+        description=fake.paragraph(nb_sentences=5),
+        start_date=start,
+        end_date=start.replace(hour=18),
+        location=EventLocation(
+            name=f"Lake {fake.last_name()}",
+            city=fake.city(),
+            state=fake.state_abbr(),
+            latitude=float(fake.latitude()),
+            longitude=float(fake.longitude()),
+        ),
+        event_info=build_default_event_info(),
+        schedule=[
+            EventScheduleItem(day="Saturday", start_time=start, description=fake.sentence())
+            for _ in range(4)
+        ],
+        classes=classes,
+        rules=build_default_event_rules(),
+        is_published=True,
+    ).save()
+
+    registrations = []
+    for i in range(args.racers):
+        racer = Racer(
+            email=f"{i}.{fake.email()}",
+            first_name=fake.first_name(),
+            last_name=fake.last_name(),
+            date_of_birth=fake.date_of_birth(minimum_age=16, maximum_age=70),
+            phone=fake.numerify("612-###-####"),
+            emergency_contact_name=fake.name(),
+            emergency_contact_phone=fake.numerify("612-###-####"),
+            street=fake.street_address(),
+            city=fake.city(),
+            state_province=fake.state_abbr(),
+            country="US",
+            zip_postal_code=fake.zipcode(),
+            bio=fake.sentence(),
+            sponsors=[fake.company() for _ in range(rng.randint(0, 3))],
+        ).save()
+
+        # Everyone races one class, some a second
+        entered = rng.sample(classes, 2 if rng.random() < 0.2 else 1)
+        for event_class in entered:
+            registrations.append(EventRegistration(
+                event=event,
+                racer=racer,
+                pwc_identifier=f"{rng.choice(['Yamaha', 'Sea-Doo', 'Kawasaki'])} #{rng.randint(1, 999)}",
+                class_key=event_class.key,
+                class_name=event_class.name,
+                price=event_class.price,
+                is_paid=rng.random() < 0.95,
+            ))
+    registrations = EventRegistration.objects.insert(registrations)
+
+    tickets = [
+        SpectatorTicket(
+            event=event,
+            purchaser_name=fake.name(),
+            purchaser_phone=fake.numerify("612-###-####"),
+            ticket_code=f"{rng.getrandbits(128):032x}",
+            ticket_type=rng.choice(["single_day", "weekend"]),
+        )
+        for _ in range(args.tickets)
+    ]
+    for ticket in tickets:
+        ticket.clean()
+    SpectatorTicket.objects.insert(tickets)
+
+    settings = get_settings()
+    registered = list(dict.fromkeys(str(r.racer.id) for r in registrations))
+
+    return {
+        "event_id": str(event.id),
+        "registration_ids": {
+            key: [str(r.id) for r in registrations if r.class_key == key and r.is_paid]
+            for key in (c.key for c in classes)
+        },
+        "ticket_codes": [t.ticket_code for t in tickets],
+        "tokens": [
+            jwt.encode({"sub": racer_id}, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+            for racer_id in registered[:TOKENS]
+        ],
+    }
+
+
+def unseed(seeded: dict) -> None:
+    from core.models.event import Event
+    from core.models.racer import Racer
+    from core.models.registration import EventRegistration
+    from core.models.round import Round
+    from core.models.spectator_ticket import SpectatorTicket
+    from core.models.speed_session import SpeedSession
+
+    event = Event.objects(id=seeded["event_id"]).first()
+    racer_ids = [r.racer.id for r in EventRegistration.objects(event=event).only("racer").no_dereference()]
+    EventRegistration.objects(event=event).delete()
+    Round.objects(event=event).delete()
+    SpeedSession.objects(event=event).delete()
+    SpectatorTicket.objects(event=event).delete()
+    Racer.objects(id__in=racer_ids).delete()
+    event.delete()
+
+
+async def prepare(http, seeded: dict) -> None:
+    """
+    First-round brackets with half the results in, and a running speed
+    session with some times, for every class.
+    """
+    event_id = seeded["event_id"]
+
+    for class_key, registration_ids in seeded["registration_ids"].items():
+        if len(registration_ids) < 2:
+            continue
+
+        response = await http.post(f"/admin/events/{event_id}/matchups/rounds", json={"class_key": class_key})
+        response.raise_for_status()
+        round_ = response.json()
+
+        for matchup in round_["matchups"][::2]:
+            if matchup.get("racer_a") and matchup.get("racer_b"):
+                response = await http.post(
+                    f"/admin/events/{event_id}/matchups/rounds/{round_['id']}/matchups/{matchup['matchup_id']}/winner",
+                    json={"winner": matchup["racer_a"]},
+                )
+                response.raise_for_status()
+
+        session = {"event_id": event_id, "class_key": class_key}
+        (await http.post("/admin/speed/start", json=session)).raise_for_status()
+        for i, registration_id in enumerate(registration_ids[:10]):
+            response = await http.post("/admin/speed/update", json={
+                **session,
+                "registration_id": registration_id,
+                "speed": 55.0 + i * 0.7,
+            })
+            response.raise_for_status()
+
+
+# -------------------------
+# Endpoints
+# -------------------------
+
+def endpoints(seeded: dict, admin_key: str) -> dict:
+    """
+    name -> (route template, build(i) -> (method, url, headers)).
+    """
+    event_id = seeded["event_id"]
+    class_keys = [k for k, ids in seeded["registration_ids"].items() if len(ids) >= 2]
+    codes = seeded["ticket_codes"]
+    tokens = seeded["tokens"]
+    admin = {"x-admin-key": admin_key}
+
+    return {
+        "event": (
+            "GET /events/{event_id}",
+            lambda i: ("GET", f"/events/{event_id}", {}),
+        ),
+        "rounds": (
+            "GET /events/{event_id}/rounds",
+            lambda i: ("GET", f"/events/{event_id}/rounds", {}),
+        ),
+        "speed_session": (
+            "GET /speed/session",
+            lambda i: ("GET", f"/speed/session?event_id={event_id}&class_key={class_keys[i % len(class_keys)]}", {}),
+        ),
+        "event_registrations": (
+            "GET /registrations/event/{event_id}/registrations",
+            lambda i: ("GET", f"/registrations/event/{event_id}/registrations", {}),
+        ),
+        # Each code admits once; later passes measure the rejection path
+        "ticket_scan": (
+            "POST /admin/tickets/scan",
+            lambda i: ("POST", f"/admin/tickets/scan?ticket_code={codes[i % len(codes)]}", admin),
+        ),
+        "me_registrations": (
+            "GET /me/registrations",
+            lambda i: ("GET", "/me/registrations", {"authorization": f"Bearer {tokens[i % len(tokens)]}"}),
+        ),
+    }
+
+
+async def drive(http, build, start: int, count: int, concurrency: int) -> tuple[list[float], Counter, float]:
+    """
+    `count` requests from `concurrency` workers; returns latencies in ms,
+    status counts and wall time.
+    """
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    next_index = iter(range(start, start + count))
+
+    async def worker() -> None:
+        for i in next_index:
+            method, url, headers = build(i)
+            started = time.perf_counter()
+            try:
+                response = await http.request(method, url, headers=headers)
+                statuses[str(response.status_code)] += 1
+            except Exception as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, statuses, time.perf_counter() - started
+
+
+def histogram(latencies: list[float]) -> dict:
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for value in latencies:
+        counts[next((i for i, bound in enumerate(BUCKETS_MS) if value <= bound), len(BUCKETS_MS))] += 1
+    return {"le_ms": [*BUCKETS_MS, "inf"], "counts": counts}
+
+
+async def run(args, server: BenchServer, seeded: dict) -> dict:
+    import httpx
+
+    admin_key = os.environ["ADMIN_API_KEY"]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=server.base_url, headers={"x-admin-key": admin_key}, timeout=60) as admin:
+        await prepare(admin, seeded)
+
+    async with httpx.AsyncClient(base_url=server.base_url, limits=limits, timeout=60) as http:
+        results = {}
+        for name, (route, build) in endpoints(seeded, admin_key).items():
+            if args.endpoints and name not in args.endpoints:
+                continue
+
+            await drive(http, build, 0, args.warmup, args.concurrency)
+
+            cpu_before = cpu_seconds(server.pid)
+            latencies, statuses, wall = await drive(http, build, args.warmup, args.requests, args.concurrency)
+            cpu_after = cpu_seconds(server.pid)
+
+            errors = sum(n for status, n in statuses.items() if not status.startswith("2"))
+            results[name] = {
+                "route": route,
+                "requests": len(latencies),
+                "errors": errors,
+                "status": dict(sorted(statuses.items())),
+                "throughput_rps": round(len(latencies) / wall, 1),
+                "latency_ms": {
+                    "mean": round(sum(latencies) / len(latencies), 3),
+                    **{f"p{p}": round(percentile(latencies, p), 3) for p in (50, 90, 99)},
+                    "max": round(max(latencies), 3),
+                },
+                "histogram": histogram(latencies),
+                "server_cpu_ms_per_request": (
+                    None if cpu_before is None else round((cpu_after - cpu_before) * 1000 / len(latencies), 3)
+                ),
+            }
+            print(f"{name:<20} {results[name]['throughput_rps']:>8.1f} rps  "
+                  f"p50 {results[name]['latency_ms']['p50']:>7.1f} ms  "
+                  f"p99 {results[name]['latency_ms']['p99']:>7.1f} ms  "
+                  f"errors {errors}")
+
+    memory = memory_kb(server.pid)
+    return {
+        "endpoints": results,
+        "server": {"rss_kb": memory.get("VmRSS"), "rss_peak_kb": memory.get("VmHWM")},
+    }
+
+
+# -------------------------
+# Results
+# -------------------------
+
+def git(*command: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *command], cwd=REPO, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(args) -> dict:
+    return {
+        "suite": "http_load",
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "backend": "mongodb" if args.mongo_url else "mongomock",
+        "seed": args.seed,
+        "racers": args.racers,
+        "tickets": args.tickets,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+    }
+
+
+def compare(previous: dict, current: dict) -> None:
+    if previous["meta"]["backend"] != current["meta"]["backend"]:
+        print(f"warning: comparing {previous['meta']['backend']} against {current['meta']['backend']}")
+
+    old_commit = (previous["meta"]["commit"] or "?")[:8]
+    new_commit = (current["meta"]["commit"] or "?")[:8]
+    print()
+    print(f"{'endpoint':<20} {'p50 ' + old_commit:>14} {'p50 ' + new_commit:>14} {'change':>8}"
+          f" {'rps ' + old_commit:>14} {'rps ' + new_commit:>14} {'change':>8}")
+
+    for name, result in current["endpoints"].items():
+        before = previous["endpoints"].get(name)
+        if before is None:
+            continue
+        p50_old, p50_new = before["latency_ms"]["p50"], result["latency_ms"]["p50"]
+        rps_old, rps_new = before["throughput_rps"], result["throughput_rps"]
+        print(f"{name:<20} {p50_old:>14.1f} {p50_new:>14.1f} {(p50_new - p50_old) / p50_old:>8.0%}"
+              f" {rps_old:>14.1f} {rps_new:>14.1f} {(rps_new - rps_old) / rps_old:>8.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000, help="measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=50, help="unmeasured requests per endpoint first")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--endpoints", type=lambda v: v.split(","), help="comma-separated subset to run")
+    parser.add_argument("--racers", type=int, default=300)
+    parser.add_argument("--tickets", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", help="results file (default: http_load-<commit>.json)")
+    parser.add_argument("--compare", help="earlier results file to diff against")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args, lambda: seed(args), unseed)
+        return
+
+    meta = metadata(args)
+    with BenchServer("benchmarks.http_load", args) as server:
+        seeded = asyncio.run(server.ready(timeout=300))
+        result = {"meta": meta, **asyncio.run(run(args, server, seeded))}
+
+    output = Path(args.output or f"http_load-{(meta['commit'] or 'nogit')[:8]}{'-dirty' if meta['dirty'] else ''}.json")
+    output.write_text(json.dumps(result, indent=2) + "\n")
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# benchmarks/read_models.py
+"""
+Read-model serialization: the Document → to_mongo().to_dict() → validate →
+response_model re-check → json.dumps path vs raw PyMongo rows → from_raw() →
+orjson via ModelJSONResponse.
+
+Rows are built in memory, so no database is needed.
+
+    python -m benchmarks.read_models
+"""
+from benchmarks import ensure_env, per_call_us
+
+ensure_env()
+
+import copy  # noqa: E402
+import tracemalloc  # noqa: E402
+from datetime import date, datetime, timedelta  # noqa: E402
+
+from bson import ObjectId  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from core.models import build_default_event_classes, build_default_event_info, build_default_event_rules  # noqa: E402
+from core.models.event import Event, EventLocation, EventScheduleItem  # noqa: E402
+from core.models.racer import Racer  # noqa: E402
+from core.models.registration import EventRegistration  # noqa: E402
+from server.base_models.event import EventBase  # noqa: E402
+from server.base_models.racer import RacerBase  # noqa: E402
+from server.base_models.registration import EventRegistrationClientBase  # noqa: E402
+from server.responses import ModelJSONResponse  # noqa: E402
+
+ROWS = 100
+ITERATIONS = 50
+
+
+def legacy_from_mongo(model, document):
+    """
+    MongoReadModel.from_mongo as it was before from_raw().
+    """
+    data = {}
+    for key, value in document.to_mongo().to_dict().items():
+        if key == "_id":
+            data["id"] = str(value)
+        elif isinstance(value, ObjectId):
+            data[key] = str(value)
+        else:
+            data[key] = value
+    return model(**data)
+
+
+def legacy_registration(document):
+    return EventRegistrationClientBase(
+        id=str(document.id),
+        pwc_identifier=document.pwc_identifier,
+        class_key=document.class_key,
+        class_name=document.class_name,
+        price=float(document.price),
+        losses=document.losses,
+        is_paid=document.is_paid,
+        created_at=document.created_at,
+        racer=legacy_from_mongo(RacerBase, document.racer),
+        event=legacy_from_mongo(EventBase, document.event),
+    )
+
+
+def make_event(i: int) -> dict:
+    start = datetime(2026, 6, 1) + timedelta(days=i)
+    return Event(
+        id=ObjectId(),
+        name=f"Event {i}",
+        description="Summer series round",
+        start_date=start,
+        end_date=start + timedelta(days=2),
+        location=EventLocation(name="Lake", city="Minneapolis", state="MN", latitude=44.9, longitude=-93.2),
+        event_info=build_default_event_info(),
+        schedule=[
+            EventScheduleItem(day=f"Day {d}", start_time=start + timedelta(days=d), description="Racing")
+            for d in range(3)
+        ],
+        classes=build_default_event_classes(),
+        rules=build_default_event_rules(),
+        is_published=True,
+        created_at=start,
+        updated_at=start,
+    ).to_mongo().to_dict()
+
+
+def make_racer(i: int) -> dict:
+    return Racer(
+        id=ObjectId(),
+        email=f"racer{i}@example.com",
+        first_name="Racer",
+        last_name=str(i),
+        date_of_birth=date(1990, 1, 1),
+        phone="555-0100",
+        emergency_contact_name="Contact",
+        emergency_contact_phone="555-0101",
+        street="1 Main St",
+        city="Minneapolis",
+        state_province="MN",
+        country="US",
+        zip_postal_code="55401",
+        sponsors=["Sponsor"],
+        pwc_id=[str(ObjectId())],
+        waiver_signed_at=datetime(2026, 5, 1),
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 1),
+    ).to_mongo().to_dict()
+
+
+def make_registration(event: dict, racer: dict) -> dict:
+    return EventRegistration(
+        id=ObjectId(),
+        event=event["_id"],
+        racer=racer["_id"],
+        pwc_identifier="Yamaha FX",
+        class_key="pro_stock",
+        class_name="Pro Stock",
+        price=250.0,
+        top_speed=61.2,
+        created_at=datetime(2026, 5, 2),
+        updated_at=datetime(2026, 5, 2),
+    ).to_mongo().to_dict()
+
+
+def legacy_response(model, rows: list, build) -> bytes:
+    # What a route returning a list of models costs: build, then FastAPI's
+    # response_model validate + serialize, then stdlib json.
+    adapter = TypeAdapter(list[model])
+    models = [build(row) for row in rows]
+    content = adapter.dump_python(adapter.validate_python(models, from_attributes=True), mode="json")
+    return JSONResponse(content).body
+
+
+def fast_response(model, rows: list) -> bytes:
+    return ModelJSONResponse([model.from_raw(row) for row in rows]).body
+
+
+def peak_kb_per_row(build, rows: list) -> float:
+    """
+    Peak memory for holding every row as built by `build`, as a list endpoint does.
+    """
+    tracemalloc.start()
+    kept = [build(row) for row in rows]  # noqa: F841
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / len(rows)
+
+
+def main() -> None:
+    events = [make_event(i) for i in range(ROWS)]
+    racers = [make_racer(i) for i in range(ROWS)]
+    registrations = [make_registration(e, r) for e, r in zip(events, racers)]
+    joined = [{**reg, "event": e, "racer": r} for reg, e, r in zip(registrations, events, racers)]
+
+    def registration_document(row: dict):
+        document = EventRegistration._from_son(row | {"event": row["event"]["_id"], "racer": row["racer"]["_id"]})
+        document.event = Event._from_son(row["event"])
+        document.racer = Racer._from_son(row["racer"])
+        return document
+
+    cases = [
+        ("EventBase", EventBase, events, lambda row: legacy_from_mongo(EventBase, Event._from_son(row))),
+        ("RacerBase", RacerBase, racers, lambda row: legacy_from_mongo(RacerBase, Racer._from_son(row))),
+        ("EventRegistrationClientBase", EventRegistrationClientBase, joined,
+         lambda row: legacy_registration(registration_document(row))),
+    ]
+
+    print(f"{ROWS} rows per response, times in us/row")
+    print(f"{'model':<30} {'legacy':>9} {'raw+orjson':>11} {'speedup':>8}")
+
+    for name, model, rows, build in cases:
+        before = per_call_us(lambda: legacy_response(model, rows, build), ITERATIONS) / ROWS
+        after = per_call_us(lambda: fast_response(model, rows), ITERATIONS) / ROWS
+        print(f"{name:<30} {before:9.1f} {after:11.1f} {before / after:7.1f}x")
+
+    print()
+    print("Rows held in memory, KB/row")
+    print(f"{'document':<30} {'Document':>9} {'raw dict':>11}")
+
+    for name, document, rows in [("Event", Event, events), ("Racer", Racer, racers)]:
+        # as_pymongo() rows are the BSON-decoded dicts themselves; deep-copy
+        # so the measurement sees their allocation.
+        documents = peak_kb_per_row(lambda row: document._from_son(copy.deepcopy(row)), rows)
+        raw = peak_kb_per_row(copy.deepcopy, rows)
+        print(f"{name:<30} {documents:9.1f} {raw:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# benchmarks/server.py
+"""
+The app in a child uvicorn process, for the load benchmarks: no external
+services, and the server's CPU and memory are measured apart from the
+clients driving it.
+
+A benchmark module adds `add_arguments()` to its parser, calls `serve()`
+when run with the hidden --serve flag, and otherwise starts itself in that
+mode through `BenchServer`:
+
+    with BenchServer("benchmarks.ws_load", args) as server:
+        seeded = asyncio.run(server.ready())
+
+Without --mongo-url the child runs on mongomock, which is pinned in
+requirements.txt with the other benchmark dependencies (Faker, httpx).
+"""
+import asyncio
+import importlib.util
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import SUPPRESS, ArgumentParser, Namespace
+from pathlib import Path
+from typing import Callable
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument("--mongo-url", help="real MongoDB to use instead of mongomock")
+    parser.add_argument("--verbose", action="store_true", help="show server output")
+    parser.add_argument("--serve", action="store_true", help=SUPPRESS)
+    parser.add_argument("--port", type=int, help=SUPPRESS)
+    parser.add_argument("--ready-file", help=SUPPRESS)
+
+
+# -------------------------
+# Child side
+# -------------------------
+
+def serve(args: Namespace, seed: Callable[[], dict], unseed: Callable[[dict], None]) -> None:
+    """
+    Connect, seed, write what `seed` returned to the ready file and run the
+    app until interrupted. Seed data in a real database is removed on exit.
+    """
+    from mongoengine import connect
+
+    if args.mongo_url:
+        connect(host=args.mongo_url)
+    else:
+        import mongomock
+        connect(host="mongodb://localhost", db="hydrodrags_bench", mongo_client_class=mongomock.MongoClient)
+
+    import uvicorn
+
+    from core.database import Database
+
+    # Already connected (mongomock only lives in this process) and seeded
+    Database.connect = lambda self: None
+    Database.disconnect = lambda self: None
+
+    from main import app, hydrodrags_app
+
+    seeded = seed()
+    Path(args.ready_file).write_text(json.dumps(seeded))
+
+    try:
+        uvicorn.run(
+            app,
+            host="127.0.0.1",
+            port=args.port,
+            log_level="warning",
+            ws_ping_interval=hydrodrags_app.settings.ws_heartbeat_interval_seconds,
+            ws_ping_timeout=hydrodrags_app.settings.ws_heartbeat_interval_seconds,
+        )
+    finally:
+        if args.mongo_url:
+            unseed(seeded)
+
+
+# -------------------------
+# Parent side
+# -------------------------
+
+class BenchServer:
+    """
+    Starts `python -m <module> <this process's options> --serve` in a
+    scratch directory and stops it on exit.
+    """
+
+    def __init__(self, module: str, args: Namespace, env: dict | None = None):
+        self.module = module
+        self.args = args
+        self.env = env or {}
+        self.port = free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.process: subprocess.Popen | None = None
+        self._workdir: tempfile.TemporaryDirectory | None = None
+
+    def __enter__(self) -> "BenchServer":
+        # Otherwise the child dies on import and all we see is its exit code
+        if not self.args.mongo_url and importlib.util.find_spec("mongomock") is None:
+            raise RuntimeError("mongomock is not installed: pip install -r requirements.txt, or pass --mongo-url")
+
+        # The app mounts ./assets and reads ./.env; keep both out of the checkout
+        self._workdir = tempfile.TemporaryDirectory()
+        Path(self._workdir.name, "assets").mkdir()
+
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO), os.environ.get("PYTHONPATH")])),
+            "LOG_LEVEL": "WARNING",
+            **self.env,
+        }
+        # The child parses the same options (seed sizes, --mongo-url, ...)
+        command = [
+            sys.executable, "-m", self.module, *sys.argv[1:], "--serve",
+            "--port", str(self.port),
+            "--ready-file", self.ready_file,
+        ]
+
+        output = None if self.args.verbose else subprocess.DEVNULL
+        self.process = subprocess.Popen(command, cwd=self._workdir.name, env=env, stdout=output, stderr=output)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.process.send_signal(signal.SIGINT)
+        try:
+            self.process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self._workdir.cleanup()
+
+    @property
+    def ready_file(self) -> str:
+        return str(Path(self._workdir.name, "ready.json"))
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    async def ready(self, timeout: float = 60) -> dict:
+        """
+        Wait until the app answers /health; returns what the child seeded.
+        """
+        import httpx
+
+        deadline = time.monotonic() + timeout
+        path = Path(self.ready_file)
+
+        async with httpx.AsyncClient(base_url=self.base_url) as http:
+            while time.monotonic() < deadline:
+                if self.process.poll() is not None:
+                    raise RuntimeError(f"server exited with {self.process.returncode}; rerun with --verbose")
+
+                if path.exists() and path.stat().st_size:
+                    try:
+                        if (await http.get("/health")).status_code == 200:
+                            return json.loads(path.read_text())
+                    except httpx.TransportError:
+                        pass
+                await asyncio.sleep(0.2)
+
+        raise RuntimeError(f"server did not start within {timeout:.0f}s")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# -------------------------
+# Process stats (Linux /proc)
+# -------------------------
+
+def cpu_seconds(pid: int) -> float | None:
+    try:
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    # utime and stime, fields 14 and 15 of stat(5)
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def memory_kb(pid: int) -> dict:
+    try:
+        lines = Path(f"/proc/{pid}/status").read_text().splitlines()
+    except OSError:
+        return {}
+    return {
+        key: int(value.split()[0])
+        for key, value in (line.split(":", 1) for line in lines)
+        if key in ("VmRSS", "VmHWM")
+    }
@@ -0,0 +1,39 @@
+# benchmarks/settings_provider.py
+"""
+Per-request auth overhead: building Settings() each call vs the cached provider.
+
+    python -m benchmarks.settings_provider
+"""
+from benchmarks import ensure_env, per_call_us
+
+ensure_env()
+
+import jwt  # noqa: E402
+
+from core.config.settings import Settings, get_settings, reload_settings  # noqa: E402
+
+ITERATIONS = 2_000
+
+
+def main() -> None:
+    settings = reload_settings()
+    token = jwt.encode({"sub": "bench"}, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+    def uncached():
+        s = Settings()
+        jwt.decode(token, s.jwt_secret, algorithms=[s.jwt_algorithm])
+
+    def cached():
+        s = get_settings()
+        jwt.decode(token, s.jwt_secret, algorithms=[s.jwt_algorithm])
+
+    before = per_call_us(uncached, ITERATIONS)
+    after = per_call_us(cached, ITERATIONS)
+
+    print(f"Settings() + decode     : {before:8.1f} us/request")
+    print(f"get_settings() + decode : {after:8.1f} us/request")
+    print(f"speedup                 : {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
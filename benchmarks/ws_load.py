@@ -0,0 +1,366 @@
+# benchmarks/ws_load.py
+"""
+WebSocket fan-out under load: N spectator sockets on /ws/events/{id} while
+bracket and speed updates are driven through the admin HTTP API.
+
+The app runs in a child uvicorn process on mongomock by default (or a real
+MongoDB with --mongo-url), so no external services are needed and the
+server's CPU and memory can be measured apart from the clients.
+
+Updates are sent one at a time. A probe socket times each one from the HTTP
+request to the broadcast it triggers, which gives every broadcast a send
+time; each client's receive time against it is the delivery latency. A
+message is lost if a client never sees its seq.
+
+    python -m benchmarks.ws_load --clients 2000 --updates 200
+
+The coalescing window is 0 by default so latency is pure fan-out cost; pass
+--coalesce-ms 250 to see what spectators get with production settings.
+Clients share one process here: if "harness cpu" nears 100% the numbers
+measure the harness, not the server.
+"""
+from benchmarks import ensure_env, percentile
+
+ensure_env()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import resource  # noqa: E402
+import time  # noqa: E402
+from collections import defaultdict  # noqa: E402
+
+from benchmarks.server import BenchServer, add_arguments, cpu_seconds, memory_kb, serve  # noqa: E402
+
+CLASS_KEY = "pro_stock"
+RACERS = 16
+
+
+# -------------------------
+# Seed data (child process)
+# -------------------------
+
+def seed():
+    from datetime import datetime, timezone
+
+    from core.models import build_default_event_classes, build_default_event_info
+    from core.models.event import Event, EventLocation
+    from core.models.racer import Racer
+    from core.models.registration import EventRegistration
+
+    event = Event(
+        name="WS load test",
+        start_date=datetime.now(timezone.utc),
+        location=EventLocation(name="Bench Lake"),
+        event_info=build_default_event_info(),
+        classes=build_default_event_classes(),
+        is_published=True,
+    ).save()
+
+    registrations = []
+    for i in range(RACERS):
+        racer = Racer(email=f"ws-load-{event.id}-{i}@example.com", first_name="Racer", last_name=str(i)).save()
+        registrations.append(EventRegistration(
+            event=event,
+            racer=racer,
+            pwc_identifier=f"PWC {i}",
+            class_key=CLASS_KEY,
+            class_name="Pro Stock",
+            price=250.0,
+            is_paid=True,
+        ).save())
+
+    return {
+        "event_id": str(event.id),
+        "registration_ids": [str(r.id) for r in registrations],
+    }
+
+
+def unseed(seeded: dict) -> None:
+    from core.models.event import Event
+    from core.models.racer import Racer
+    from core.models.registration import EventRegistration
+    from core.models.round import Round
+    from core.models.speed_session import SpeedSession
+
+    event = Event.objects(id=seeded["event_id"]).first()
+    racer_ids = [r.racer.id for r in EventRegistration.objects(event=event).only("racer").no_dereference()]
+    EventRegistration.objects(event=event).delete()
+    Round.objects(event=event).delete()
+    SpeedSession.objects(event=event).delete()
+    Racer.objects(id__in=racer_ids).delete()
+    event.delete()
+
+
+# -------------------------
+# Clients
+# -------------------------
+
+class Spectator:
+    """
+    One client socket; records when each broadcast seq arrived.
+    """
+
+    def __init__(self, url: str, binary: bool):
+        self.url = url
+        self.binary = binary
+        self.received: dict[int, float] = {}
+        self.ready = asyncio.Event()
+        self.failed = False
+        self.messages: asyncio.Queue | None = None  # set on the probe
+
+    async def run(self, stop: asyncio.Event) -> None:
+        from websockets.asyncio.client import connect
+
+        try:
+            async with connect(self.url, max_size=None, open_timeout=30) as ws:
+                self.ready.set()
+                receiving = asyncio.ensure_future(self._receive(ws))
+                await stop.wait()
+                receiving.cancel()
+        except Exception:
+            self.failed = True
+            self.ready.set()
+
+    async def _receive(self, ws) -> None:
+        async for raw in ws:
+            now = time.perf_counter()
+            message = json.loads(raw)
+            if message.get("snapshot") or message.get("type") == "ping":
+                continue
+
+            self.received[message["seq"]] = now
+            if self.messages is not None:
+                self.messages.put_nowait(message["seq"])
+
+
+# -------------------------
+# Driver
+# -------------------------
+
+class Driver:
+    """
+    Alternates bracket results and speed updates through the admin API.
+    """
+
+    def __init__(self, http, event_id: str, registration_ids: list[str]):
+        self.http = http
+        self.event_id = event_id
+        self.registration_ids = registration_ids
+        self.matchups: list[tuple[str, str, str]] = []
+        self.winners: set[str] = set()
+        self.speed = 50.0
+        self.count = 0
+
+    async def prepare(self) -> None:
+        response = await self.http.post(
+            f"/admin/events/{self.event_id}/matchups/rounds",
+            json={"class_key": CLASS_KEY},
+        )
+        response.raise_for_status()
+        round_ = response.json()
+        self.matchups = [
+            (round_["id"], m["matchup_id"], m["racer_a"])
+            for m in round_["matchups"]
+            if m.get("racer_a")
+        ]
+
+        response = await self.http.post(
+            "/admin/speed/start",
+            json={"event_id": self.event_id, "class_key": CLASS_KEY},
+        )
+        response.raise_for_status()
+
+    async def update(self) -> str:
+        self.count += 1
+        if self.count % 2:
+            await self._bracket()
+            return "brackets"
+        await self._speed()
+        return "speed"
+
+    async def _bracket(self) -> None:
+        round_id, matchup_id, racer_a = self.matchups[(self.count // 2) % len(self.matchups)]
+        path = f"/admin/events/{self.event_id}/matchups/rounds/{round_id}/matchups/{matchup_id}/winner"
+
+        # Toggle so every call is a real change
+        if matchup_id in self.winners:
+            response = await self.http.delete(path)
+            self.winners.discard(matchup_id)
+        else:
+            response = await self.http.post(path, json={"winner": racer_a})
+            self.winners.add(matchup_id)
+        response.raise_for_status()
+
+    async def _speed(self) -> None:
+        # Always a new top speed, so always a broadcast
+        self.speed += 0.01
+        response = await self.http.post("/admin/speed/update", json={
+            "event_id": self.event_id,
+            "class_key": CLASS_KEY,
+            "registration_id": self.registration_ids[self.count % len(self.registration_ids)],
+            "speed": round(self.speed, 2),
+        })
+        response.raise_for_status()
+
+
+# -------------------------
+# Run
+# -------------------------
+
+async def run(args, server: BenchServer, seeded: dict) -> dict:
+    import httpx
+
+    base_url = server.base_url
+    event_id = seeded["event_id"]
+    ws_url = base_url.replace("http", "ws", 1) + f"/ws/events/{event_id}"
+    if args.binary:
+        ws_url += "?binary=true"
+
+    stop = asyncio.Event()
+    rss_before = memory_kb(server.pid).get("VmRSS")
+
+    # Connect in waves so the accept backlog isn't the thing under test
+    spectators = [Spectator(ws_url, args.binary) for _ in range(args.clients)]
+    tasks = []
+    started = time.perf_counter()
+    for i in range(0, len(spectators), args.connect_batch):
+        batch = spectators[i:i + args.connect_batch]
+        tasks += [asyncio.ensure_future(s.run(stop)) for s in batch]
+        await asyncio.gather(*(s.ready.wait() for s in batch))
+    connect_seconds = time.perf_counter() - started
+
+    probe = Spectator(ws_url, args.binary)
+    probe.messages = asyncio.Queue()
+    tasks.append(asyncio.ensure_future(probe.run(stop)))
+    await probe.ready.wait()
+
+    rss_connected = memory_kb(server.pid).get("VmRSS")
+    connected = [s for s in spectators if not s.failed]
+
+    sent_at: dict[int, float] = {}
+    kinds: dict[str, int] = defaultdict(int)
+    timeouts = 0
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"x-admin-key": os.environ["ADMIN_API_KEY"]},
+        timeout=30,
+    ) as http:
+        driver = Driver(http, event_id, seeded["registration_ids"])
+        await driver.prepare()
+
+        # Let the prepare broadcasts land before timing anything
+        await asyncio.sleep(max(0.5, 2 * args.coalesce_ms / 1000))
+        while not probe.messages.empty():
+            probe.messages.get_nowait()
+
+        cpu_before = cpu_seconds(server.pid)
+        wall_started = time.perf_counter()
+
+        for _ in range(args.updates):
+            requested = time.perf_counter()
+            kinds[await driver.update()] += 1
+            try:
+                seq = await asyncio.wait_for(probe.messages.get(), timeout=args.timeout)
+                sent_at[seq] = requested
+            except asyncio.TimeoutError:
+                timeouts += 1
+            await asyncio.sleep(args.interval)
+
+        # Stragglers
+        await asyncio.sleep(args.timeout)
+        wall = time.perf_counter() - wall_started
+        cpu_after = cpu_seconds(server.pid)
+
+    memory = memory_kb(server.pid)
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = []
+    lost = 0
+    for spectator in connected:
+        for seq, requested in sent_at.items():
+            received = spectator.received.get(seq)
+            if received is None:
+                lost += 1
+            else:
+                latencies.append((received - requested) * 1000)
+
+    return {
+        "clients": args.clients,
+        "connected": len(connected),
+        "connect_seconds": connect_seconds,
+        "updates": dict(kinds),
+        "broadcasts": len(sent_at),
+        "probe_timeouts": timeouts,
+        "expected": len(sent_at) * len(connected),
+        "lost": lost,
+        "latencies": latencies,
+        "wall": wall,
+        "server_cpu": None if cpu_before is None else cpu_after - cpu_before,
+        "rss_before_kb": rss_before,
+        "rss_connected_kb": rss_connected,
+        "rss_kb": memory.get("VmRSS"),
+        "rss_peak_kb": memory.get("VmHWM"),
+    }
+
+
+def report(result: dict) -> None:
+    latencies = result["latencies"]
+    expected = result["expected"] or 1
+
+    print(f"{'clients':<16} {result['connected']}/{result['clients']} connected in {result['connect_seconds']:.1f}s")
+    updates = ", ".join(f"{count} {kind}" for kind, count in sorted(result["updates"].items()))
+    print(f"{'updates':<16} {updates}; {result['broadcasts']} broadcasts timed, {result['probe_timeouts']} timed out")
+    print(f"{'delivered':<16} {result['expected'] - result['lost']}/{result['expected']} "
+          f"({result['lost'] / expected:.2%} lost)")
+    print(f"{'latency ms':<16} " + "  ".join(
+        f"p{p} {percentile(latencies, p):.1f}" for p in (50, 90, 99)
+    ) + f"  max {max(latencies, default=0):.1f}")
+
+    if result["server_cpu"] is not None:
+        print(f"{'server cpu':<16} {result['server_cpu']:.2f}s over {result['wall']:.1f}s "
+              f"({result['server_cpu'] / result['wall']:.0%} of a core)")
+
+    if result["rss_kb"]:
+        per_socket = (result["rss_connected_kb"] - result["rss_before_kb"]) / max(result["connected"], 1)
+        print(f"{'server memory':<16} rss {result['rss_kb'] / 1024:.1f} MB, peak {result['rss_peak_kb'] / 1024:.1f} MB, "
+              f"{per_socket:.1f} KB per socket")
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    print(f"{'harness cpu':<16} {usage.ru_utime + usage.ru_stime:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=0.05, help="seconds between updates")
+    parser.add_argument("--timeout", type=float, default=5.0, help="seconds to wait for a broadcast")
+    parser.add_argument("--connect-batch", type=int, default=200)
+    parser.add_argument("--coalesce-ms", type=int, default=0)
+    parser.add_argument("--binary", action="store_true", help="binary frames (?binary=true)")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args, seed, unseed)
+        return
+
+    env = {
+        "WS_MAX_CONNECTIONS": str(args.clients + 10),
+        "WS_MAX_CONNECTIONS_PER_IP": str(args.clients + 10),
+        "WS_COALESCE_WINDOW_MS": str(args.coalesce_ms),
+        "WS_COALESCE_MAX_DELAY_MS": str(4 * args.coalesce_ms),
+    }
+    with BenchServer("benchmarks.ws_load", args, env) as server:
+        seeded = asyncio.run(server.ready())
+        result = asyncio.run(run(args, server, seeded))
+
+    report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 from pydantic import Field
@@ -19,6 +20,29 @@ class Settings(BaseSettings):
     jwt_secret: str
     jwt_algorithm: str = "HS256"
     jwt_access_token_minutes: int = 60
+    auth_cleanup_interval_seconds: int = 3600
+    dashboard_reconcile_interval_seconds: int = 900
+
+    # Proxies trusted to set X-Forwarded-For/-Proto, comma-separated or "*";
+    # e.g. the Docker bridge gateway when published behind a host proxy
+    forwarded_allow_ips: str = "127.0.0.1"
+
+    log_level: str = "INFO"
+    log_json: bool = True
+
+    query_profiler_enabled: bool = True
+    query_profiler_warn_commands: int = 20
+    query_profiler_warn_ms: float = 200.0
+
+    ws_coalesce_window_ms: int = 250
+    ws_coalesce_max_delay_ms: int = 1000
+    ws_max_connections: int = 10000
+    # 0 disables. Behind a proxy this needs forwarded_allow_ips, or every
+    # client counts as the proxy's address
+    ws_max_connections_per_ip: int = 0
+    ws_heartbeat_interval_seconds: int = 20
+    ws_idle_timeout_seconds: int = 0
+    ws_send_timeout_seconds: float = 5.0
 
     admin_api_key: str
 
@@ -30,3 +54,21 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Process-wide settings, parsed from the environment once.
+    Usable directly or as a FastAPI dependency.
+    """
+    return Settings()
+
+
+def reload_settings() -> Settings:
+    """
+    Drop the cached settings and re-read the environment.
+    Intended for tests that patch env vars.
+    """
+    get_settings.cache_clear()
+    return get_settings()
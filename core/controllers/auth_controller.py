@@ -6,6 +6,7 @@ import jwt
 from pydantic import EmailStr
 
 from core.config.settings import Settings
+from core.controllers.dashboard_controller import DashboardController
 from core.models.auth_code import AuthCode, AuthRefreshToken
 from core.models.racer import Racer
 from utils import utcnow
@@ -23,6 +24,7 @@ class AuthController:
         if not racer:
             racer = Racer(email=email)
             racer.save()
+            DashboardController.record_racer()
 
         auth_code = AuthCode.create(racer)
         auth_code.save()
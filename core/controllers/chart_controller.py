@@ -1,8 +1,38 @@
 
 # core/controllers/chart_controller.py
 
+from bson import ObjectId
+from mongoengine.connection import get_db
+
 from core.models.event import Event
+from core.models.hydrodrags import HydroDragsConfig
+from core.models.paypal import PayPalCheckout
 from core.models.registration import EventRegistration
+from core.models.spectator_ticket import SpectatorTicket
+from utils.cache import analytics_cache
+
+
+def checkout_revenue_group(config: HydroDragsConfig) -> dict:
+    """
+    $group stage summing spectator and membership revenue over checkouts.
+    Checkouts from before amounts were stored fall back to current prices.
+    """
+    return {
+        "$group": {
+            "_id": None,
+            "spectator": {"$sum": {"$ifNull": [
+                "$spectator_amount",
+                {"$add": [
+                    {"$multiply": [{"$ifNull": ["$spectator_single_day_passes", 0]}, config.spectator_single_day_price]},
+                    {"$multiply": [{"$ifNull": ["$spectator_weekend_passes", 0]}, config.spectator_weekend_price]},
+                ]},
+            ]}},
+            "membership": {"$sum": {"$ifNull": [
+                "$membership_amount",
+                {"$cond": ["$purchase_ihra_membership", config.ihra_membership_price, 0]},
+            ]}},
+        }
+    }
 
 
 class ChartController:
@@ -72,4 +102,172 @@ class ChartController:
         return {
             "registrations_over_time": ChartController.registrations_over_time(),
             "racers_per_class": ChartController.racers_per_class(),
-        }
\ No newline at end of file
+        }
+
+    # -------------------------------------------------
+    # Per-event analytics
+    # -------------------------------------------------
+    @classmethod
+    def event_analytics(cls, event_id: str) -> dict:
+        """
+        Per-event breakdowns, cached briefly so an auto-refreshing dashboard
+        doesn't re-run the pipelines on every poll. Times are bucketed in UTC.
+        """
+        cached = analytics_cache.get(event_id)
+        if cached is not None:
+            return cached
+
+        raw = {
+            name: list(document.objects.aggregate(*pipeline))
+            for name, (document, pipeline) in cls._event_pipelines(event_id).items()
+        }
+
+        per_class = [
+            {
+                "class_key": r["_id"],
+                "class_name": r.get("class_name") or r["_id"],
+                "registrations": r["registrations"],
+                "paid": r["paid"],
+                "unpaid": r["registrations"] - r["paid"],
+                "revenue": round(float(r["revenue"]), 2),
+            }
+            for r in raw["registrations_per_class"]
+        ]
+
+        tickets_per_day: dict[str, dict] = {}
+        for r in raw["tickets_per_day"]:
+            day = tickets_per_day.setdefault(r["_id"]["day"], {"day": r["_id"]["day"], "single_day": 0, "weekend": 0})
+            day[r["_id"]["ticket_type"]] = r["count"]
+
+        tickets_sold = sum(r["count"] for r in raw["tickets_per_day"])
+        checked_in = sum(r["count"] for r in raw["checkins_by_hour"])
+        checkouts = raw["checkout_revenue"][0] if raw["checkout_revenue"] else {}
+
+        result = {
+            "event_id": event_id,
+            "registrations_per_class": per_class,
+            "paid_vs_unpaid": {
+                "paid": sum(c["paid"] for c in per_class),
+                "unpaid": sum(c["unpaid"] for c in per_class),
+            },
+            "registrations_per_day": [
+                {"day": r["_id"], "count": r["count"]}
+                for r in raw["registrations_per_day"]
+            ],
+            "tickets_per_day": list(tickets_per_day.values()),
+            "checkins_by_hour": [
+                {"hour": r["_id"], "count": r["count"]}
+                for r in raw["checkins_by_hour"]
+            ],
+            "checkin_rate": round(checked_in / tickets_sold, 4) if tickets_sold else 0.0,
+            "revenue_by_product": {
+                "registrations": round(sum(c["revenue"] for c in per_class), 2),
+                "spectator": round(float(checkouts.get("spectator", 0.0)), 2),
+                "membership": round(float(checkouts.get("membership", 0.0)), 2),
+            },
+        }
+
+        analytics_cache.set(event_id, result)
+        return result
+
+    @classmethod
+    def explain_event_analytics(cls, event_id: str) -> dict:
+        """
+        Index usage of each analytics pipeline, from the server's explain
+        output. A pipeline reporting a COLLSCAN is missing its index.
+        """
+        db = get_db()
+        plans = {}
+
+        for name, (document, pipeline) in cls._event_pipelines(event_id).items():
+            collection = document._get_collection_name()
+            explain = db.command("aggregate", collection, pipeline=pipeline, explain=True)
+
+            stages = _collect_plan_values(explain, "stage")
+            plans[name] = {
+                "collection": collection,
+                "indexes": sorted(set(_collect_plan_values(explain, "indexName"))),
+                "collscan": "COLLSCAN" in stages,
+            }
+
+        return plans
+
+    @staticmethod
+    def _event_pipelines(event_id: str) -> dict[str, tuple[type, list[dict]]]:
+        """
+        Each pipeline opens with a $match on event (plus an equality or sort
+        key) so it is served by an (event, …) index rather than a scan.
+        """
+        event = ObjectId(event_id)
+
+        return {
+            # (event, racer, class_key)
+            "registrations_per_class": (EventRegistration, [
+                {"$match": {"event": event}},
+                {"$group": {
+                    "_id": "$class_key",
+                    "class_name": {"$first": "$class_name"},
+                    "registrations": {"$sum": 1},
+                    "paid": {"$sum": {"$cond": ["$is_paid", 1, 0]}},
+                    "revenue": {"$sum": {"$cond": ["$is_paid", "$price", 0]}},
+                }},
+                {"$sort": {"registrations": -1}},
+            ]),
+            # (event, created_at)
+            "registrations_per_day": (EventRegistration, [
+                {"$match": {"event": event}},
+                {"$sort": {"created_at": 1}},
+                {"$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                    "count": {"$sum": 1},
+                }},
+                {"$sort": {"_id": 1}},
+            ]),
+            # (event, created_at)
+            "tickets_per_day": (SpectatorTicket, [
+                {"$match": {"event": event}},
+                {"$sort": {"created_at": 1}},
+                {"$group": {
+                    "_id": {
+                        "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                        "ticket_type": "$ticket_type",
+                    },
+                    "count": {"$sum": 1},
+                }},
+                {"$sort": {"_id.day": 1}},
+            ]),
+            # (event, is_used)
+            "checkins_by_hour": (SpectatorTicket, [
+                {"$match": {"event": event, "is_used": True}},
+                {"$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m-%dT%H:00", "date": "$used_at"}},
+                    "count": {"$sum": 1},
+                }},
+                {"$sort": {"_id": 1}},
+            ]),
+            # (event, is_captured)
+            "checkout_revenue": (PayPalCheckout, [
+                {"$match": {"event": event, "is_captured": True}},
+                checkout_revenue_group(HydroDragsConfig.get()),
+            ]),
+        }
+
+
+def _collect_plan_values(node, key: str) -> list:
+    """
+    Every value stored under `key` anywhere in an explain document; plan
+    shapes differ between server versions and pipeline stages.
+    """
+    found = []
+
+    if isinstance(node, dict):
+        for k, v in node.items():
+            if k == key and isinstance(v, str):
+                found.append(v)
+            else:
+                found.extend(_collect_plan_values(v, key))
+    elif isinstance(node, list):
+        for item in node:
+            found.extend(_collect_plan_values(item, key))
+
+    return found
@@ -0,0 +1,200 @@
+# core/controllers/dashboard_controller.py
+import logging
+
+from pymongo.errors import PyMongoError
+
+from core.controllers.chart_controller import ChartController, checkout_revenue_group
+from core.models.dashboard import DashboardRollup
+from core.models.event import Event
+from core.models.hydrodrags import HydroDragsConfig
+from core.models.paypal import PayPalCheckout
+from core.models.racer import Racer
+from core.models.registration import EventRegistration
+from core.models.spectator_ticket import SpectatorTicket
+from utils import utcnow
+from utils.log import get_logger, log
+
+logger = get_logger("dashboard")
+
+ROLLUP_KEY = "global"
+
+
+class DashboardController:
+    """
+    Maintains the dashboard rollup so dashboard reads are a single document.
+
+    Write paths call the record_* hooks, which $inc the rollup in place.
+    Anything they miss (cascading deletes, direct DB edits, a failed hook)
+    is corrected by reconcile(), which runs periodically.
+    """
+
+    # -------------------------------------------------
+    # Reads
+    # -------------------------------------------------
+    @classmethod
+    def counts(cls) -> dict:
+        rollup = cls._get()
+
+        return {
+            "events": rollup.events,
+            "racers": rollup.racers,
+            "registrations": rollup.registrations,
+            "event_revenue": round(rollup.event_revenue, 2),
+            "spectator_revenue": round(rollup.spectator_revenue, 2),
+            "membership_revenue": round(rollup.membership_revenue, 2),
+            "dayPasses": rollup.day_passes,
+            "weekendPasses": rollup.weekend_passes,
+        }
+
+    @classmethod
+    def charts(cls) -> dict:
+        rollup = cls._get()
+
+        by_class = sorted(
+            rollup.registrations_by_class.items(),
+            key=lambda item: item[1].get("count", 0),
+            reverse=True,
+        )
+
+        return {
+            "registrations_over_time": [
+                {"period": period, "count": count}
+                for period, count in sorted(rollup.registrations_by_month.items())
+            ],
+            "racers_per_class": [
+                {
+                    "class_key": class_key,
+                    "class_name": entry.get("class_name") or class_key,
+                    "count": entry.get("count", 0),
+                }
+                for class_key, entry in by_class
+            ],
+        }
+
+    # -------------------------------------------------
+    # Incremental hooks
+    # -------------------------------------------------
+    @classmethod
+    def record_event(cls, delta: int = 1) -> None:
+        cls._inc({"events": delta})
+
+    @classmethod
+    def record_racer(cls, delta: int = 1) -> None:
+        cls._inc({"racers": delta})
+
+    @classmethod
+    def record_registration(cls, registration: EventRegistration) -> None:
+        month = registration.created_at.strftime("%Y-%m")
+        class_key = registration.class_key
+
+        cls._inc(
+            {
+                "registrations": 1,
+                f"registrations_by_month.{month}": 1,
+                f"registrations_by_class.{class_key}.count": 1,
+            },
+            {f"registrations_by_class.{class_key}.class_name": registration.class_name},
+        )
+
+    @classmethod
+    def record_payment(
+        cls,
+        *,
+        event_revenue: float = 0.0,
+        spectator_revenue: float = 0.0,
+        membership_revenue: float = 0.0,
+    ) -> None:
+        cls._inc({
+            "event_revenue": float(event_revenue),
+            "spectator_revenue": float(spectator_revenue),
+            "membership_revenue": float(membership_revenue),
+        })
+
+    @classmethod
+    def record_tickets(cls, quantities: dict[str, int]) -> None:
+        cls._inc({
+            "day_passes": quantities.get("single_day") or 0,
+            "weekend_passes": quantities.get("weekend") or 0,
+        })
+
+    # -------------------------------------------------
+    # Reconciliation
+    # -------------------------------------------------
+    @classmethod
+    def reconcile(cls) -> DashboardRollup:
+        """
+        Recompute every figure from source collections and overwrite the
+        rollup. Increments landing mid-run may be lost; the next run restores them.
+        """
+        config = HydroDragsConfig.get()
+
+        revenue = cls._aggregate_one(EventRegistration, [
+            {"$match": {"is_paid": True}},
+            {"$group": {"_id": None, "total": {"$sum": "$price"}}},
+        ])
+
+        checkout_revenue = cls._aggregate_one(PayPalCheckout, [
+            {"$match": {"is_captured": True}},
+            checkout_revenue_group(config),
+        ])
+
+        passes = {
+            row["_id"]: row["count"]
+            for row in SpectatorTicket.objects.aggregate(
+                {"$group": {"_id": "$ticket_type", "count": {"$sum": 1}}},
+            )
+        }
+
+        rollup = DashboardRollup.objects(key=ROLLUP_KEY).first() or DashboardRollup(key=ROLLUP_KEY)
+
+        rollup.events = Event.objects.count()
+        rollup.racers = Racer.objects.count()
+        rollup.registrations = EventRegistration.objects.count()
+
+        rollup.event_revenue = float(revenue.get("total", 0.0))
+        rollup.spectator_revenue = float(checkout_revenue.get("spectator", 0.0))
+        rollup.membership_revenue = float(checkout_revenue.get("membership", 0.0))
+
+        rollup.day_passes = passes.get("single_day", 0)
+        rollup.weekend_passes = passes.get("weekend", 0)
+
+        rollup.registrations_by_month = {
+            row["period"]: row["count"]
+            for row in ChartController.registrations_over_time()
+        }
+        rollup.registrations_by_class = {
+            row["class_key"]: {"class_name": row["class_name"], "count": row["count"]}
+            for row in ChartController.racers_per_class()
+        }
+
+        rollup.reconciled_at = utcnow()
+        rollup.save()
+        return rollup
+
+    # -------------------------------------------------
+    # Internal helpers
+    # -------------------------------------------------
+    @classmethod
+    def _get(cls) -> DashboardRollup:
+        rollup = DashboardRollup.objects(key=ROLLUP_KEY).first()
+
+        # Hooks may have upserted a partial document before the first reconcile
+        if rollup is None or rollup.reconciled_at is None:
+            rollup = cls.reconcile()
+
+        return rollup
+
+    @staticmethod
+    def _inc(inc: dict, set_: dict | None = None) -> None:
+        update = {"$inc": inc, "$set": {"updated_at": utcnow(), **(set_ or {})}}
+
+        try:
+            DashboardRollup._get_collection().update_one({"key": ROLLUP_KEY}, update, upsert=True)
+        except PyMongoError as e:
+            # Never fail the write that triggered this; reconcile catches up
+            log(logger, logging.WARNING, "dashboard rollup update failed", error=str(e))
+
+    @staticmethod
+    def _aggregate_one(document, pipeline: list[dict]) -> dict:
+        rows = list(document.objects.aggregate(*pipeline))
+        return rows[0] if rows else {}
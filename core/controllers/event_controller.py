@@ -1,14 +1,15 @@
 # core/controllers/event_controller.py
-from pathlib import Path
 from uuid import uuid4
 
 from fastapi import UploadFile
 
 from core.controllers import convert_embedded
+from core.controllers.dashboard_controller import DashboardController
 from core.models.event import Event, EventLocation, EventInfo, EventScheduleItem, EventClass, EventRule
 from core.models import build_default_event_classes, build_default_event_rules, build_default_event_schedule, build_default_event_info
 from server.base_models.event import EventCreate, EventUpdate
 from utils import utcnow
+from utils.asset_store import AssetStore
 
 
 class EventController:
@@ -39,6 +40,7 @@ class EventController:
             event.event_info = build_default_event_info()
 
         event.save()
+        DashboardController.record_event()
         return event
 
     async def update_event(self, payload: EventUpdate) -> Event:
@@ -67,19 +69,15 @@ class EventController:
 
     async def delete_event(self) -> None:
         self.event.delete()
+        # Registrations cascade with the event; recount rather than track them
+        DashboardController.reconcile()
 
     async def update_event_image(self, file: UploadFile) -> Event:
-        event_dir = Path(f"assets/events/{self.model.id}")
-        event_dir.mkdir(parents=True, exist_ok=True)
+        asset = await AssetStore.store(file)
 
-        ext = Path(file.filename).suffix.lower() or ".jpg"
-        file_path = event_dir / f"banner{ext}"
-
-        contents = await file.read()
-        file_path.write_bytes(contents)
-
-        self.event.image_url = f"/assets/events/{self.model.id}/banner{ext}"
+        self.event.image_url = asset.url
+        self.event.image_variants = asset.variants
         self.event.image_updated_at = utcnow()
         self.event.save()
 
-        return self.model
\ No newline at end of file
+        return self.event
\ No newline at end of file
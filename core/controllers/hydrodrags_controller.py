@@ -1,6 +1,4 @@
 # core/controllers/hydrodrags_config_controller.py
-from pathlib import Path
-
 from fastapi import UploadFile
 
 from core.models.hydrodrags import (
@@ -9,7 +7,8 @@ from core.models.hydrodrags import (
     SocialLink,
     SpanishContent, NewsItem,
 )
-ASSETS_DIR = Path("assets")
+from utils.asset_store import AssetStore
+
 
 class HydroDragsConfigController:
     def __init__(self):
@@ -129,13 +128,10 @@ class HydroDragsConfigController:
     # Logo
     # -------------------------
 
-    def update_logo(self, file: UploadFile) -> str:
-        path = ASSETS_DIR / "logo.png"
+    async def update_logo(self, file: UploadFile) -> str:
+        asset = await AssetStore.store(file, default_ext=".png")
 
-        with path.open("wb") as f:
-            f.write(file.file.read())
-
-        self.config.logo_url = "/assets/logo.png"
+        self.config.logo_url = asset.url
         self.config.save()
         return self.config.logo_url
 
@@ -147,13 +143,10 @@ class HydroDragsConfigController:
     # Banner
     # -------------------------
 
-    def update_banner(self, file: UploadFile) -> str:
-        path = ASSETS_DIR / "banner.png"
-
-        with path.open("wb") as f:
-            f.write(file.file.read())
+    async def update_banner(self, file: UploadFile) -> str:
+        asset = await AssetStore.store(file, default_ext=".png")
 
-        self.config.banner_url = "/assets/banner.png"
+        self.config.banner_url = asset.url
         self.config.save()
         return self.config.banner_url
 
@@ -1,4 +1,9 @@
+from core.models.event import Event
 from core.models.paypal import PayPalCheckout
+from core.models.racer import Racer
+from server.base_models.event import EventBase
+from server.base_models.paypal import PayPalCheckoutRead
+from server.base_models.racer import RacerBase
 from utils.paypal_service import PayPalService
 
 
@@ -9,7 +14,11 @@ class PayPalAdminController:
         *,
         event_id: str | None = None,
         captured: bool | None = None,
-    ):
+    ) -> list[dict]:
+        """
+        Raw checkout documents, newest first, with `event` and `racer` joined
+        in as raw documents (one query each) for PayPalCheckoutRead.from_raw.
+        """
         qs = PayPalCheckout.objects()
 
         if event_id:
@@ -18,7 +27,19 @@ class PayPalAdminController:
         if captured is not None:
             qs = qs.filter(is_captured=captured)
 
-        return qs.order_by("-created_at")
+        rows = list(
+            qs.order_by("-created_at")
+            .only(*PayPalCheckoutRead.mongo_fields())
+            .as_pymongo()
+        )
+
+        events = Event.raw_by_id({r.get("event") for r in rows}, *EventBase.mongo_fields())
+        racers = Racer.raw_by_id({r.get("racer") for r in rows}, *RacerBase.mongo_fields())
+
+        return [
+            {**r, "event": events.get(r.get("event")), "racer": racers.get(r.get("racer"))}
+            for r in rows
+        ]
 
     @staticmethod
     async def create_order(
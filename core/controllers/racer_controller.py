@@ -1,17 +1,15 @@
 # core/controllers/racer_controller.py
-from pathlib import Path
-
 from fastapi import UploadFile
 
+from core.controllers.dashboard_controller import DashboardController
 from core.models.racer import Racer
 from utils import utcnow
+from utils.cache import racer_cache
+from utils.asset_store import AssetStore
 from utils.pdf_service import PDFService
 
 
 class RacerController:
-    PROFILE_IMAGE_DIR = Path("assets/racers/profile")
-    BANNER_IMAGE_DIR = Path("assets/racers/banner")
-
     def __init__(self, model: Racer):
         self.model = model
 
@@ -26,8 +24,10 @@ class RacerController:
                 setattr(racer, field, value)
         else:
             racer = Racer(**data)
+            DashboardController.record_racer()
 
         racer.save()
+        racer_cache.invalidate(str(racer.id))
 
         return racer
 
@@ -37,41 +37,25 @@ class RacerController:
         for field, value in data.items():
             setattr(self.model, field, value)
 
-        self.model.save()
-
-        return self.model
+        return self._save()
 
     async def update_profile_image(self, file: UploadFile) -> Racer:
-        racer_dir = Path(f"assets/racers/{self.model.id}")
-        racer_dir.mkdir(parents=True, exist_ok=True)
+        asset = await AssetStore.store(file)
 
-        ext = Path(file.filename).suffix.lower() or ".jpg"
-        file_path = racer_dir / f"profile{ext}"
-
-        contents = await file.read()
-        file_path.write_bytes(contents)
-
-        self.model.profile_image_path = f"assets/racers/{self.model.id}/profile{ext}"
+        self.model.profile_image_path = asset.path
+        self.model.profile_image_variants = asset.variants
         self.model.profile_image_updated_at = utcnow()
-        self.model.save()
 
-        return self.model
+        return self._save()
 
     async def update_banner_image(self, file: UploadFile) -> Racer:
-        racer_dir = Path(f"assets/racers/{self.model.id}")
-        racer_dir.mkdir(parents=True, exist_ok=True)
+        asset = await AssetStore.store(file)
 
-        ext = Path(file.filename).suffix.lower() or ".jpg"
-        file_path = racer_dir / f"banner{ext}"
-
-        contents = await file.read()
-        file_path.write_bytes(contents)
-
-        self.model.banner_image_path = f"assets/racers/{self.model.id}/banner{ext}"
+        self.model.banner_image_path = asset.path
+        self.model.banner_image_variants = asset.variants
         self.model.banner_image_updated_at = utcnow()
-        self.model.save()
 
-        return self.model
+        return self._save()
 
 
     async def upload_waiver(self, file: UploadFile) -> Racer:
@@ -84,9 +68,8 @@ class RacerController:
 
         self.model.waiver_path = pdf_path
         self.model.waiver_signed_at = utcnow()
-        self.model.save()
 
-        return self.model
+        return self._save()
 
     async def add_pwc(self, pwc_id: str) -> Racer:
         pwc_id = pwc_id.strip()
@@ -102,9 +85,15 @@ class RacerController:
             self.model.pwc_id = []
 
         self.model.pwc_id.append(pwc_id)
-        self.model.save()
-
-        return self.model
 
+        return self._save()
 
+    def _save(self) -> Racer:
+        # Drop the cached copy even if the save fails; the stored racer may
+        # have changed either way.
+        try:
+            self.model.save()
+        finally:
+            racer_cache.invalidate(str(self.model.id))
 
+        return self.model
@@ -1,3 +1,4 @@
+from core.controllers.dashboard_controller import DashboardController
 from core.controllers.ticket_controller import TicketController
 from core.models.hydrodrags import HydroDragsConfig
 from core.models.paypal import PayPalCheckout
@@ -5,8 +6,8 @@ from core.models.registration import EventRegistration
 from core.models.event import Event
 from core.models.pwc import PWC
 from core.models.racer import Racer
-from core.models.spectator_ticket import SpectatorTicket
-from utils.dependencies import settings
+from core.config.settings import get_settings
+from utils.cache import racer_cache
 from utils.email_service import EmailService
 
 
@@ -39,6 +40,42 @@ class EventRegistrationController:
             .select_related()
         )
 
+    async def get_raw_registrations_for_racer(self) -> list[dict]:
+        """
+        Same rows as get_registrations_for_racer, as raw PyMongo documents with
+        `racer`, `event` and `payment` (and the payment's own refs) joined in.
+
+        Three queries however many registrations, and no Document construction.
+        """
+        if not self.racer:
+            raise ValueError("Racer is required")
+
+        rows = list(
+            EventRegistration.objects(racer=self.racer.id)
+            .order_by("-created_at")
+            .as_pymongo()
+        )
+
+        payments = PayPalCheckout.raw_by_id({r.get("payment") for r in rows})
+        events = Event.raw_by_id({r["event"] for r in rows} | {p.get("event") for p in payments.values()})
+
+        racer = self.racer.to_mongo()
+
+        def join(raw: dict) -> dict:
+            return {
+                **raw,
+                "event": events.get(raw.get("event")),
+                "racer": racer if raw.get("racer") == self.racer.id else None,
+            }
+
+        return [
+            {
+                **join(r),
+                "payment": join(payments[r["payment"]]) if r.get("payment") in payments else None,
+            }
+            for r in rows
+        ]
+
     # --------------------------------------------------
     # Mutations
     # --------------------------------------------------
@@ -79,6 +116,7 @@ class EventRegistrationController:
                 price=event_class.price,
             )
             reg.save()
+            DashboardController.record_registration(reg)
             created.append(reg)
 
         return created
@@ -121,6 +159,8 @@ class EventRegistrationController:
 
         class_map = {c.key: c for c in self.event.classes if c.is_active}
         total = 0.0
+        spectator_amount = 0.0
+        membership_amount = 0.0
         config = HydroDragsConfig.get()
 
         # ---- Classes ----
@@ -132,16 +172,16 @@ class EventRegistrationController:
 
         # ---- Membership ----
         if purchase_ihra_membership:
-            total += float(config.ihra_membership_price)
+            membership_amount = float(config.ihra_membership_price)
 
         # ---- Spectators ----
         if spectator_single_day_passes:
-            total += float(spectator_single_day_passes) * float(config.spectator_single_day_price)
+            spectator_amount += float(spectator_single_day_passes) * float(config.spectator_single_day_price)
 
         if spectator_weekend_passes:
-            total += float(spectator_weekend_passes) * float(config.spectator_weekend_price)
+            spectator_amount += float(spectator_weekend_passes) * float(config.spectator_weekend_price)
 
-        total = round(total, 2)
+        total = round(total + membership_amount + spectator_amount, 2)
 
         # ---- PayPal Order ----
         order = await paypal_service.create_order(
@@ -161,6 +201,8 @@ class EventRegistrationController:
             "paypal_order_id": order["id"],
             "approval_url": approval_url,
             "amount": total,
+            "spectator_amount": round(spectator_amount, 2),
+            "membership_amount": round(membership_amount, 2),
         }
 
     async def capture_paypal_checkout(
@@ -213,6 +255,7 @@ class EventRegistrationController:
         # 2️⃣ Registrations
         class_map = {c.key: c for c in self.event.classes if c.is_active}
         registrations_written = 0
+        event_revenue = 0.0
 
         for class_key, pwc_identifier in (checkout.class_entries or {}).items():
             event_class = class_map.get(class_key)
@@ -225,7 +268,8 @@ class EventRegistrationController:
                 class_key=class_key,
             ).first()
 
-            if not reg:
+            is_new = reg is None
+            if is_new:
                 reg = EventRegistration(
                     event=self.event,
                     racer=racer,
@@ -235,32 +279,31 @@ class EventRegistrationController:
                     price=float(event_class.price),
                 )
 
+            if not reg.is_paid:
+                event_revenue += float(reg.price)
+
             reg.is_paid = True
             reg.payment = checkout  # 🔥 IMPORTANT FIX
             reg.save()
             registrations_written += 1
 
+            if is_new:
+                DashboardController.record_registration(reg)
+
         # 3️⃣ IHRA Membership (FIXED)
         if checkout.purchase_ihra_membership:
             racer.membership_purchased_at = checkout.created_at
             racer.membership_number = racer.membership_number or f"IHRA-{racer.id}"
             racer.save()
+            racer_cache.invalidate(str(racer.id))
 
-        # 4️⃣ Spectator Tickets (REFactored)
-        TicketController.create_spectator_tickets(
+        # 4️⃣ Spectator Tickets (one bulk insert for the whole order)
+        tickets = TicketController.issue_tickets(
             event=self.event,
-            quantity=checkout.spectator_single_day_passes or 0,
-            ticket_type="single_day",
-            purchaser_name=racer.full_name,
-            purchaser_phone=racer.phone,
-            racer=racer,
-            payment=checkout,
-        )
-
-        TicketController.create_spectator_tickets(
-            event=self.event,
-            quantity=checkout.spectator_weekend_passes or 0,
-            ticket_type="weekend",
+            quantities={
+                "single_day": checkout.spectator_single_day_passes or 0,
+                "weekend": checkout.spectator_weekend_passes or 0,
+            },
             purchaser_name=racer.full_name,
             purchaser_phone=racer.phone,
             racer=racer,
@@ -270,10 +313,24 @@ class EventRegistrationController:
         # 5️⃣ Finalize checkout
         checkout.is_captured = True
         checkout.save()
-        # 🔥 EMAIL RECEIPT + TICKETS
-        email = EmailService(settings)
 
-        tickets = SpectatorTicket.objects(payment=checkout)
+        config = HydroDragsConfig.get()
+        DashboardController.record_payment(
+            event_revenue=event_revenue,
+            spectator_revenue=(
+                checkout.spectator_amount
+                if checkout.spectator_amount is not None
+                else (checkout.spectator_single_day_passes or 0) * config.spectator_single_day_price
+                + (checkout.spectator_weekend_passes or 0) * config.spectator_weekend_price
+            ),
+            membership_revenue=(
+                checkout.membership_amount
+                if checkout.membership_amount is not None
+                else config.ihra_membership_price if checkout.purchase_ihra_membership else 0.0
+            ),
+        )
+        # 🔥 EMAIL RECEIPT + TICKETS
+        email = EmailService(get_settings())
 
         await email.send_purchase_receipt(
             to_email=racer.email,
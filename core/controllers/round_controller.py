@@ -1,12 +1,14 @@
 import random
 from typing import Optional
 
-from core.controllers.score_broadcaster import ScoreBroadcaster
+from core.controllers.score_broadcaster import BRACKETS_UPDATE, ScoreBroadcaster
 from core.models.round import Round, Matchup
 from core.models.event import Event
 from core.models.registration import EventRegistration
 from server.base_models.round import BracketsBase
+from server.responses import dumps
 from utils import utcnow
+from utils.cache import brackets_cache
 
 
 # ------------------------------------------------------------------
@@ -242,14 +244,50 @@ class TournamentService:
         return qs.order_by("round_number")
 
     @staticmethod
-    async def broadcast_brackets(*, event: Event, class_key: str | None) -> None:
+    async def brackets_json(*, event: Event, class_key: str | None, refresh: bool = False) -> bytes:
+        """
+        Encoded bracket rounds, shared by the HTTP rounds endpoint and the
+        brackets_update broadcast so each state is serialized once.
+        """
+        key = (str(event.id), class_key)
+
+        if not refresh:
+            cached = brackets_cache.get(key)
+            if cached is not None:
+                return cached
+
         rounds = await TournamentService.list_rounds(event=event, class_key=class_key)
-        payload = [BracketsBase.from_mongo(r) for r in rounds]
+        encoded = dumps([BracketsBase.from_mongo(r) for r in rounds])
+
+        brackets_cache.set(key, encoded)
+        return encoded
+
+    @staticmethod
+    async def broadcast_brackets(*, event: Event, class_key: str | None) -> None:
+        """
+        Coalesced: the rebuild and broadcast happen once the burst of edits
+        for this class settles.
+        """
+        event_id = str(event.id)
+
+        # Readers before the flush rebuild from the DB instead of serving the
+        # old bytes; the all-classes snapshot includes this class.
+        brackets_cache.invalidate((event_id, class_key))
+        brackets_cache.invalidate((event_id, None))
 
+        ScoreBroadcaster.schedule(
+            event_id=event_id,
+            class_key=class_key,
+            type=BRACKETS_UPDATE,
+            send=lambda: TournamentService._send_brackets(event=event, class_key=class_key),
+        )
+
+    @staticmethod
+    async def _send_brackets(*, event: Event, class_key: str | None) -> None:
         await ScoreBroadcaster.broadcast_brackets_payload(
             event_id=str(event.id),
             class_key=class_key,
-            rounds_payload=payload,
+            rounds_json=await TournamentService.brackets_json(event=event, class_key=class_key, refresh=True),
         )
 
     @staticmethod
@@ -1,35 +1,82 @@
-from server.ws_manager import WebSocketManager
+import logging
+from typing import Awaitable, Callable
+
+from mongoengine.errors import ValidationError
+
+from server.responses import dumps, extend_object
+from server.ws_manager import Topic, WebSocketManager
+from utils.coalescer import Coalescer
+from utils.log import TRACE, get_logger, log
+from utils.metrics import WS_BROADCASTS_COALESCED
+
+logger = get_logger("ws.broadcast")
 
 ws_manager = WebSocketManager()
 
+BRACKETS_UPDATE = "brackets_update"
+SPEED_SESSION_UPDATE = "speed_session_update"
+
+MESSAGE_TYPES = (BRACKETS_UPDATE, SPEED_SESSION_UPDATE)
+
+# Bursts of admin edits per (event, class, type) collapse into one rebuild
+# and one message; the app applies the configured window at startup.
+coalescer = Coalescer(window=0.25, max_delay=1.0)
+
 
 class ScoreBroadcaster:
     """
     High-level broadcaster for live event scoring.
     """
 
+    @staticmethod
+    def schedule(
+            *,
+            event_id: str,
+            class_key: str | None,
+            type: str,
+            send: Callable[[], Awaitable[None]],
+    ) -> None:
+        """
+        Queue a broadcast for (event, class, type). `send` runs once the
+        topic has been quiet for the coalescing window (or max delay has
+        passed), so it should build its payload when called, not before.
+        """
+        if coalescer.submit((event_id, class_key, type), send):
+            WS_BROADCASTS_COALESCED.inc(type=type)
+
+    @staticmethod
+    def brackets_message(*, event_id: str, class_key: str | None, rounds_json: bytes) -> bytes:
+        return ScoreBroadcaster._envelope(
+            {"type": BRACKETS_UPDATE, "event_id": event_id, "class_key": class_key},
+            rounds=rounds_json,
+        )
 
     @staticmethod
-    async def broadcast_brackets_payload(*, event_id: str, class_key: str | None, rounds_payload: list):
+    def speed_session_message(*, event_id: str, class_key: str, payload: dict) -> bytes:
+        return dumps({
+            "type": SPEED_SESSION_UPDATE,
+            "event_id": event_id,
+            "class_key": class_key,
+            **payload,
+        })
+
+    @staticmethod
+    async def broadcast_brackets_payload(*, event_id: str, class_key: str | None, rounds_json: bytes):
+        """
+        `rounds_json` is the already-encoded rounds list, the same bytes the
+        HTTP rounds endpoint serves; it is spliced into the message as is.
+        """
         channel = f"event:{event_id}"
 
-        print(
-            f"📣 WS BROADCAST | type=brackets_update | "
-            f"channel={channel} | class={class_key} | "
-            f"rounds={len(rounds_payload)}"
-        )
-        print("#############################")
-        print(f"Payload: {rounds_payload}")
-        print("#############################")
-
-        await ws_manager.broadcast(
-            channel=f"event:{event_id}",
-            payload={
-                "type": "brackets_update",
-                "event_id": event_id,
-                "class_key": class_key,
-                "rounds": rounds_payload,
-            },
+        log(logger, logging.DEBUG, "ws broadcast", type=BRACKETS_UPDATE, channel=channel, class_key=class_key, bytes=len(rounds_json))
+        if logger.isEnabledFor(TRACE):
+            log(logger, TRACE, "ws broadcast payload", channel=channel, payload=rounds_json.decode())
+
+        await ws_manager.broadcast_encoded(
+            channel,
+            ScoreBroadcaster.brackets_message(event_id=event_id, class_key=class_key, rounds_json=rounds_json),
+            class_key=class_key,
+            type=BRACKETS_UPDATE,
         )
 
     @staticmethod
@@ -41,19 +88,78 @@ class ScoreBroadcaster:
     ):
         channel = f"event:{event_id}"
 
-        print(
-            f"📣 WS BROADCAST | type=speed_session_update | "
-            f"channel={channel} | class={class_key}"
+        log(logger, logging.DEBUG, "ws broadcast", type=SPEED_SESSION_UPDATE, channel=channel, class_key=class_key)
+        log(logger, TRACE, "ws broadcast payload", channel=channel, payload=payload)
+        await ws_manager.broadcast_encoded(
+            channel,
+            ScoreBroadcaster.speed_session_message(event_id=event_id, class_key=class_key, payload=payload),
+            class_key=class_key,
+            type=SPEED_SESSION_UPDATE,
         )
-        print("#############################")
-        print(f"Payload: {payload}")
-        print("#############################")
-        await ws_manager.broadcast(
-            channel=f"event:{event_id}",
-            payload={
-                "type": "speed_session_update",
-                "event_id": event_id,
-                "class_key": class_key,
-                **payload,
-            },
-        )
\ No newline at end of file
+
+    @staticmethod
+    async def snapshot(*, event_id: str, topics: list[Topic]) -> list[bytes]:
+        """
+        Current bracket and speed-session state for `topics`, in the same
+        message format as the live updates plus `"snapshot": true` and the
+        channel seq it is current as of.
+
+        Brackets come from the shared encoded cache, so a reconnect storm
+        costs one query per class at most.
+        """
+        from core.controllers.round_controller import TournamentService
+        from core.controllers.speed_session_controller import SpeedSessionController
+        from core.models.event import Event
+        from core.models.speed_session import SpeedSession
+
+        try:
+            event = Event.objects(id=event_id).first()
+        except ValidationError:
+            event = None
+        if not event:
+            return []
+
+        seq = ws_manager.seq(f"event:{event_id}")
+        messages = []
+
+        bracket_classes = ScoreBroadcaster._snapshot_classes(topics, BRACKETS_UPDATE)
+        for class_key in bracket_classes:
+            rounds_json = await TournamentService.brackets_json(event=event, class_key=class_key)
+            messages.append(ScoreBroadcaster.brackets_message(
+                event_id=event_id, class_key=class_key, rounds_json=rounds_json,
+            ))
+
+        speed_classes = ScoreBroadcaster._snapshot_classes(topics, SPEED_SESSION_UPDATE)
+        if speed_classes:
+            sessions = SpeedSession.objects(event=event)
+            if None not in speed_classes:
+                sessions = sessions.filter(class_key__in=speed_classes)
+
+            for session in sessions:
+                controller = SpeedSessionController(event=event, class_key=session.class_key, session=session)
+                messages.append(ScoreBroadcaster.speed_session_message(
+                    event_id=event_id, class_key=session.class_key, payload=controller.broadcast_payload(),
+                ))
+
+        return [extend_object(m, {"seq": seq, "snapshot": True}) for m in messages]
+
+    @staticmethod
+    def _snapshot_classes(topics: list[Topic], message_type: str) -> list[str | None]:
+        """
+        Classes to snapshot for one message type; [None] means all classes in
+        one message.
+        """
+        classes = {class_key for class_key, t in topics if t in (None, message_type)}
+        if None in classes:
+            return [None]
+        return sorted(classes)
+
+    @staticmethod
+    def _envelope(fields: dict, **encoded: bytes) -> bytes:
+        """
+        Encode `fields` and append pre-encoded JSON values without decoding them.
+        """
+        message = dumps(fields)[:-1]
+        for key, value in encoded.items():
+            message += b',"' + key.encode() + b'":' + value
+        return message + b"}"
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 
 from utils import utcnow
 
-from core.controllers.score_broadcaster import ScoreBroadcaster
+from core.controllers.score_broadcaster import SPEED_SESSION_UPDATE, ScoreBroadcaster
 from core.models.event import Event
 from core.models.registration import EventRegistration
 from core.models.speed_session import SpeedSession, SpeedRankingEntry
@@ -13,11 +13,12 @@ class SpeedSessionController:
     Controls a top-speed session for a single Event + Class.
     """
 
-    def __init__(self, *, event: Event, class_key: str):
+    def __init__(self, *, event: Event, class_key: str, session: SpeedSession | None = None):
         self.event = event
         self.class_key = class_key
 
-        self.session: SpeedSession | None = SpeedSession.objects(
+        # Callers that already loaded the session pass it to skip the query
+        self.session: SpeedSession | None = session or SpeedSession.objects(
             event=event,
             class_key=class_key,
         ).first()
@@ -45,8 +46,8 @@ class SpeedSessionController:
 
         return max(0, int(self.session.duration_seconds - elapsed))
 
-    async def _broadcast(self) -> None:
-        payload = {
+    def broadcast_payload(self) -> dict:
+        return {
             "session": {
                 "started_at": self.session.started_at if self.session else None,
                 "stopped_at": self.session.stopped_at if self.session else None,
@@ -56,10 +57,19 @@ class SpeedSessionController:
             "rankings": self.rankings(),
         }
 
-        await ScoreBroadcaster.broadcast_speed_session_payload(
-            event_id=str(self.event.id),
+    async def _broadcast(self) -> None:
+        event_id = str(self.event.id)
+
+        # Payload is built at send time so the coalesced message is the latest state
+        ScoreBroadcaster.schedule(
+            event_id=event_id,
             class_key=self.class_key,
-            payload=payload,
+            type=SPEED_SESSION_UPDATE,
+            send=lambda: ScoreBroadcaster.broadcast_speed_session_payload(
+                event_id=event_id,
+                class_key=self.class_key,
+                payload=self.broadcast_payload(),
+            ),
         )
 
     def session_info(self) -> SpeedSession | None:
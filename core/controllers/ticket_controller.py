@@ -1,7 +1,62 @@
-from core.models.spectator_ticket import SpectatorTicket
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from core.controllers.dashboard_controller import DashboardController
+from core.models.spectator_ticket import SpectatorTicket, new_ticket_code
 from core.models.event import Event
 from core.models.racer import Racer
 from core.models.paypal import PayPalCheckout
+from utils import utcnow
+from utils.phone import normalize_phone
+
+MAX_INSERT_ATTEMPTS = 3
+DUPLICATE_KEY = 11000
+
+# Just what a gate needs to admit someone
+SCAN_FIELDS = {
+    "ticket_code": 1,
+    "ticket_type": 1,
+    "purchaser_name": 1,
+    "event": 1,
+    "is_used": 1,
+    "used_at": 1,
+    "scan_id": 1,
+}
+
+# Writers stamp updated_at before they commit, so a change can land after a
+# snapshot's find with an updated_at earlier than its version. Versions are
+# backdated by this much so the next sync still picks such changes up.
+SYNC_VERSION_OVERLAP = timedelta(seconds=10)
+
+# Per-ticket state held by an offline scanner
+SYNC_FIELDS = {
+    "ticket_code": 1,
+    "ticket_type": 1,
+    "is_used": 1,
+    "used_at": 1,
+    "scan_id": 1,
+    "scanned_by": 1,
+}
+
+SYNC_ADMITTED = "admitted"      # this upload admitted the ticket
+SYNC_DUPLICATE = "duplicate"    # same scan already uploaded by this device
+SYNC_CONFLICT = "conflict"      # ticket was used elsewhere or earlier
+SYNC_INVALID = "invalid"        # unknown code
+
+
+def _to_utc_ms(value: datetime) -> datetime:
+    """
+    Aware UTC at millisecond precision, matching what Mongo stores, so client
+    timestamps compare equal to the values read back.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
 
 
 class TicketController:
@@ -11,10 +66,27 @@ class TicketController:
 
     @classmethod
     def create_spectator_tickets(cls, *, event: Event, quantity: int, ticket_type: str, purchaser_name: str, purchaser_phone: str, racer: Racer | None = None, payment: PayPalCheckout | None = None) -> list[str]:
-        created = []
+        tickets = cls.issue_tickets(
+            event=event,
+            quantities={ticket_type: quantity},
+            purchaser_name=purchaser_name,
+            purchaser_phone=purchaser_phone,
+            racer=racer,
+            payment=payment,
+        )
+        return [t.ticket_code for t in tickets]
 
-        for _ in range(quantity):
-            ticket = SpectatorTicket(
+    @classmethod
+    def issue_tickets(cls, *, event: Event | None, quantities: dict[str, int], purchaser_name: str, purchaser_phone: str, racer: Racer | None = None, payment: PayPalCheckout | None = None) -> list[SpectatorTicket]:
+        """
+        Build every ticket for an order up front and write them with a single
+        insert_many, so issuance costs one round trip whatever the quantity.
+
+        `quantities` maps ticket_type → count; tickets come back in that order.
+        """
+        tickets = [
+            SpectatorTicket(
+                id=ObjectId(),
                 event=event,
                 racer=racer,
                 payment=payment,
@@ -22,33 +94,243 @@ class TicketController:
                 purchaser_phone=purchaser_phone,
                 ticket_type=ticket_type,
             )
-            ticket.save()
-            created.append(ticket.ticket_code)
+            for ticket_type, quantity in quantities.items()
+            for _ in range(quantity or 0)
+        ]
+
+        if not tickets:
+            return []
 
-        return created
+        for ticket in tickets:
+            ticket.validate()
+
+        cls._insert_tickets(tickets)
+        DashboardController.record_tickets(quantities)
+        return tickets
 
     @staticmethod
     def scan_ticket(ticket_code: str) -> dict:
-        ticket = SpectatorTicket.objects(ticket_code=ticket_code).first()
+        """
+        Admit a ticket in one atomic round trip. Two gates scanning the same
+        code race on the is_used filter, so exactly one of them succeeds.
+        """
+        now = utcnow()
+        collection = SpectatorTicket._get_collection()
 
-        if not ticket:
+        ticket = collection.find_one_and_update(
+            {"ticket_code": ticket_code, "is_used": False},
+            {"$set": {"is_used": True, "used_at": now, "updated_at": now}},
+            projection=SCAN_FIELDS,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if ticket:
             return {
-                "success": False,
-                "error": "Invalid ticket code",
+                "success": True,
+                "ticket": ticket,
             }
 
-        if ticket.is_used:
+        # Rejections only: tell an unknown code from one already used
+        existing = collection.find_one({"ticket_code": ticket_code}, SCAN_FIELDS)
+
+        if not existing:
             return {
                 "success": False,
-                "error": "Ticket already used",
-                "used_at": ticket.used_at,
+                "error": "Invalid ticket code",
             }
 
-        ticket.mark_used()
+        return {
+            "success": False,
+            "error": "Ticket already used",
+            "used_at": existing.get("used_at"),
+        }
+
+    @staticmethod
+    def scan_tickets(ticket_codes: list[str]) -> list[dict]:
+        """
+        Admit a queue of scans in two round trips regardless of its length.
+
+        The update tags what it admits with a fresh scan_id, so the follow-up
+        read can tell tickets this batch admitted from ones used elsewhere.
+        Results follow the input order; a code repeated in the batch is
+        admitted once and reported as used after that.
+        """
+        codes = list(dict.fromkeys(ticket_codes))
+        if not codes:
+            return []
+
+        now = utcnow()
+        scan_id = uuid4().hex
+        collection = SpectatorTicket._get_collection()
+
+        collection.update_many(
+            {"ticket_code": {"$in": codes}, "is_used": False},
+            {"$set": {"is_used": True, "used_at": now, "updated_at": now, "scan_id": scan_id}},
+        )
+
+        found = {
+            t["ticket_code"]: t
+            for t in collection.find({"ticket_code": {"$in": codes}}, SCAN_FIELDS)
+        }
+
+        results = []
+        admitted = set()
+
+        for code in ticket_codes:
+            ticket = found.get(code)
+
+            if ticket is None:
+                results.append({
+                    "ticket_code": code,
+                    "success": False,
+                    "error": "Invalid ticket code",
+                })
+            elif ticket.get("scan_id") == scan_id and code not in admitted:
+                admitted.add(code)
+                results.append({
+                    "ticket_code": code,
+                    "success": True,
+                    "ticket": ticket,
+                })
+            else:
+                results.append({
+                    "ticket_code": code,
+                    "success": False,
+                    "error": "Ticket already used",
+                    "used_at": ticket.get("used_at"),
+                })
+
+        return results
+
+    @staticmethod
+    def lookup_by_phone(phone: str, event_id: str | None = None) -> list[SpectatorTicket]:
+        """
+        Every ticket bought with this phone number, in one indexed query.
+        References are left unresolved; callers only need their ids.
+        """
+        e164 = normalize_phone(phone)
+        if not e164:
+            raise ValueError("Invalid phone number")
+
+        tickets = SpectatorTicket.objects(purchaser_phone_e164=e164)
+
+        if event_id:
+            if not ObjectId.is_valid(event_id):
+                raise ValueError("Invalid event id")
+            tickets = tickets.filter(event=event_id)
+
+        return list(tickets.no_dereference().order_by("-created_at"))
+
+    @staticmethod
+    def sync_snapshot(*, event_id: str | None = None, since: datetime | None = None) -> dict:
+        """
+        Ticket codes and used-state for an offline scanner.
+
+        Without `since` this is the full set; with it, only tickets changed at
+        or after that time. Clients pass the returned `version` back as
+        `since` on their next sync. The version is backdated by
+        SYNC_VERSION_OVERLAP, so consecutive syncs overlap; that is harmless
+        because entries are keyed by code.
+        """
+        version = utcnow() - SYNC_VERSION_OVERLAP
+        query = {}
+
+        if event_id:
+            if not ObjectId.is_valid(event_id):
+                raise ValueError("Invalid event id")
+            query["event"] = ObjectId(event_id)
+
+        if since:
+            query["updated_at"] = {"$gte": since}
+
+        tickets = list(SpectatorTicket._get_collection().find(query, SYNC_FIELDS))
 
         return {
-            "success": True,
-            "ticket": ticket,
+            "version": version,
+            "full": since is None,
+            "tickets": tickets,
+        }
+
+    @staticmethod
+    def sync_scans(*, device_id: str, scans: list[tuple[str, datetime]]) -> dict:
+        """
+        Reconcile scans a device made while offline.
+
+        The earliest scan of each code is applied with its original scan time
+        in one bulk write; the follow-up read classifies every scan as
+        admitted, duplicate (a re-upload of something already applied),
+        conflict (used by another scan first) or invalid. Results follow the
+        input order.
+        """
+        version = utcnow()
+        if not scans:
+            return {"version": version, "results": []}
+
+        scans = [(code, _to_utc_ms(scanned_at)) for code, scanned_at in scans]
+
+        earliest: dict[str, datetime] = {}
+        for code, scanned_at in scans:
+            if code not in earliest or scanned_at < earliest[code]:
+                earliest[code] = scanned_at
+
+        batch_id = uuid4().hex
+        collection = SpectatorTicket._get_collection()
+
+        collection.bulk_write(
+            [
+                UpdateOne(
+                    {"ticket_code": code, "is_used": False},
+                    {"$set": {
+                        "is_used": True,
+                        "used_at": scanned_at,
+                        "updated_at": version,
+                        "scan_id": batch_id,
+                        "scanned_by": device_id,
+                    }},
+                )
+                for code, scanned_at in earliest.items()
+            ],
+            ordered=False,
+        )
+
+        found = {
+            t["ticket_code"]: t
+            for t in collection.find({"ticket_code": {"$in": list(earliest)}}, SYNC_FIELDS)
+        }
+
+        results = []
+        admitted = set()
+
+        for code, scanned_at in scans:
+            ticket = found.get(code)
+            result = {"ticket_code": code, "scanned_at": scanned_at}
+
+            if ticket is None:
+                result["status"] = SYNC_INVALID
+                results.append(result)
+                continue
+
+            used_at = _to_utc_ms(ticket["used_at"]) if ticket.get("used_at") else None
+
+            if (
+                ticket.get("scan_id") == batch_id
+                and scanned_at == earliest[code]
+                and code not in admitted
+            ):
+                admitted.add(code)
+                result["status"] = SYNC_ADMITTED
+            elif ticket.get("scanned_by") == device_id and used_at == scanned_at:
+                result["status"] = SYNC_DUPLICATE
+            else:
+                result["status"] = SYNC_CONFLICT
+                result["used_at"] = used_at
+                result["scanned_by"] = ticket.get("scanned_by")
+
+            results.append(result)
+
+        return {
+            "version": version,
+            "results": results,
         }
 
     @staticmethod
@@ -69,9 +351,46 @@ class TicketController:
 
         ticket.is_used = False
         ticket.used_at = None
+        ticket.scan_id = None
+        ticket.scanned_by = None
         ticket.save()
 
         return {
             "success": True,
             "ticket": ticket,
-        }
\ No newline at end of file
+        }
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    @staticmethod
+    def _insert_tickets(tickets: list[SpectatorTicket]) -> None:
+        """
+        Unordered insert_many. Tickets whose code collided with an existing one
+        get a fresh code and are retried; everything else is already written.
+        """
+        collection = SpectatorTicket._get_collection()
+        pending = tickets
+
+        for _ in range(MAX_INSERT_ATTEMPTS):
+            try:
+                collection.insert_many([t.to_mongo() for t in pending], ordered=False)
+                pending = []
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if any(err.get("code") != DUPLICATE_KEY for err in errors):
+                    raise
+
+                pending = [pending[err["index"]] for err in errors]
+                for ticket in pending:
+                    ticket.ticket_code = new_ticket_code()
+
+            if not pending:
+                break
+        else:
+            raise ValueError("Could not allocate unique ticket codes")
+
+        for ticket in tickets:
+            ticket._created = False
+            ticket._clear_changed_fields()
@@ -1,12 +1,17 @@
 from mongoengine import connect, disconnect
+from pymongo import UpdateOne
 from pymongo.errors import PyMongoError
 
 from core.config.settings import Settings
+from core.models.auth_code import AuthCode, AuthRefreshToken
 from core.models.event import Event
 from core.models.hydrodrags import HydroDragsConfig
 from core.models.paypal import PayPalCheckout
 from core.models.racer import Racer
 from core.models.spectator_ticket import SpectatorTicket
+from utils import utcnow
+from utils.phone import normalize_phone
+from utils.query_profiler import QueryProfiler
 
 
 class Database:
@@ -21,6 +26,7 @@ class Database:
         connect(
             host=self._settings.database_url,
             serverSelectionTimeoutMS=3000,  # fast fail
+            event_listeners=[QueryProfiler.listener],
         )
         self._connected = True
         self.cleanup()
@@ -51,5 +57,54 @@ class Database:
                 "error": str(e),
             }
 
-    def cleanup(self):
-        pass
\ No newline at end of file
+    def cleanup(self) -> dict:
+        """
+        Purges spent auth artifacts.
+
+        TTL indexes remove expired documents on their own; this also drops
+        used codes and revoked refresh tokens early, and covers TTL monitor lag.
+        """
+        now = utcnow()
+
+        codes = AuthCode.objects(expires_at__lte=now).delete()
+        codes += AuthCode.objects(used_at__ne=None).delete()
+
+        tokens = AuthRefreshToken.objects(expires_at__lte=now).delete()
+        tokens += AuthRefreshToken.objects(revoked_at__ne=None).delete()
+
+        return {
+            "auth_codes": codes,
+            "refresh_tokens": tokens,
+        }
+
+    BACKFILL_BATCH = 1000
+
+    def backfill(self) -> dict:
+        """
+        Fills derived fields on documents written before those fields existed.
+        Cheap once done: each query only matches documents still missing them.
+
+        Runs in the background after startup (see HydrodragsApp), one bulk
+        write per batch; not part of connect().
+        """
+        phones = 0
+        collection = SpectatorTicket._get_collection()
+        missing = {"purchaser_phone_e164": {"$exists": False}}
+
+        # Every update takes its ticket out of `missing`, so re-query until empty
+        while batch := list(collection.find(missing, {"purchaser_phone": 1}).limit(self.BACKFILL_BATCH)):
+            collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": t["_id"]},
+                        {"$set": {"purchaser_phone_e164": normalize_phone(t.get("purchaser_phone"))}},
+                    )
+                    for t in batch
+                ],
+                ordered=False,
+            )
+            phones += len(batch)
+
+        return {
+            "ticket_phones": phones,
+        }
@@ -1,10 +1,24 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from core.config.settings import Settings
+from core.config.settings import Settings, get_settings
+from core.controllers.dashboard_controller import DashboardController
+from core.controllers.score_broadcaster import coalescer as broadcast_coalescer, ws_manager
 from core.database import Database
+from utils.image_service import ImageService
+from utils.log import configure_logging, get_logger, log, shutdown_logging
+from utils.metrics import MetricsMiddleware
+from utils.pdf_service import PDFQueueFullError, PDFService
+from utils.query_profiler import QueryProfiler, QueryProfilerMiddleware
+from utils.upload_service import UploadTooLargeError
+
+
+logger = get_logger("app")
 
 
 class HydrodragsApp:
@@ -18,16 +32,61 @@ class HydrodragsApp:
         """
     def __init__(self) -> None:
         self._server: FastAPI | None = None
-        self._settings = Settings()
+        self._settings = get_settings()
+        configure_logging(level=self._settings.log_level, json_output=self._settings.log_json)
         self._db = Database(self._settings)
 
     @asynccontextmanager
     async def _lifespan(self, app: FastAPI):
-        print("Starting up HydroDrags API...")
+        log(logger, logging.INFO, "startup")
         self._db.connect()
+        tasks = [
+            asyncio.create_task(self._backfill()),
+            asyncio.create_task(self._periodic_cleanup()),
+            asyncio.create_task(self._periodic_reconcile()),
+            asyncio.create_task(ws_manager.heartbeat()),
+        ]
         yield
-        print("Shutting down HydroDrags API...")
+        log(logger, logging.INFO, "shutdown")
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await broadcast_coalescer.flush()
+        ImageService.shutdown()
+        PDFService.shutdown()
         self._db.disconnect()
+        shutdown_logging()
+
+    async def _backfill(self) -> None:
+        # One-off per boot; off the startup path so large collections don't delay serving
+        try:
+            filled = await asyncio.to_thread(self._db.backfill)
+            log(logger, logging.INFO, "backfill", **filled)
+        except Exception:
+            logger.exception("backfill failed")
+
+    async def _periodic_cleanup(self) -> None:
+        interval = self._settings.auth_cleanup_interval_seconds
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = await asyncio.to_thread(self._db.cleanup)
+                log(logger, logging.INFO, "auth cleanup", **removed)
+            except Exception:
+                logger.exception("auth cleanup failed")
+
+    async def _periodic_reconcile(self) -> None:
+        interval = self._settings.dashboard_reconcile_interval_seconds
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                rollup = await asyncio.to_thread(DashboardController.reconcile)
+                log(logger, logging.INFO, "dashboard reconcile", registrations=rollup.registrations)
+            except Exception:
+                logger.exception("dashboard reconcile failed")
 
     def create_app(self) -> FastAPI:
         if self._server:
@@ -47,12 +106,44 @@ class HydrodragsApp:
             allow_headers=["*"],
         )
 
+        self._server.add_middleware(MetricsMiddleware)
+
+        broadcast_coalescer.configure(
+            window=self._settings.ws_coalesce_window_ms / 1000,
+            max_delay=self._settings.ws_coalesce_max_delay_ms / 1000,
+        )
+        ws_manager.configure(
+            max_connections=self._settings.ws_max_connections,
+            max_connections_per_ip=self._settings.ws_max_connections_per_ip,
+            heartbeat_interval=self._settings.ws_heartbeat_interval_seconds,
+            idle_timeout=self._settings.ws_idle_timeout_seconds,
+            send_timeout=self._settings.ws_send_timeout_seconds,
+        )
+
+        if self._settings.query_profiler_enabled:
+            QueryProfiler.configure(
+                warn_commands=self._settings.query_profiler_warn_commands,
+                warn_ms=self._settings.query_profiler_warn_ms,
+            )
+            self._server.add_middleware(QueryProfilerMiddleware)
+
         self._server.state.app = self
+        self._register_exception_handlers()
         self._register_routes()
         return self._server
 
+    def _register_exception_handlers(self) -> None:
+        @self._server.exception_handler(UploadTooLargeError)
+        async def upload_too_large(request: Request, exc: UploadTooLargeError):
+            return JSONResponse(status_code=413, content={"detail": str(exc)})
+
+        @self._server.exception_handler(PDFQueueFullError)
+        async def pdf_queue_full(request: Request, exc: PDFQueueFullError):
+            return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
     def _register_routes(self) -> None:
         from server.routes.health import router as health_router
+        from server.routes.metrics import router as metrics_router
         from server.routes.auth import router as auth_router
         from server.routes.racer import router as rider_router
         from server.routes.user.me import router as me_router
@@ -64,16 +155,23 @@ class HydrodragsApp:
         from server.routes.hydrodrags import router as hydrodrags_router
         from server.routes.speed import router as speed_router
         from server.routes.ws import router as ws_router
-        from fastapi.staticfiles import StaticFiles
+        from server.static_files import ImmutableStaticFiles, PublicStaticFiles
 
+        # Must precede the generic /assets mount so it matches first
+        self._server.mount(
+            "/assets/cas",
+            ImmutableStaticFiles(directory="assets/cas", check_dir=False),
+            name="assets_cas",
+        )
 
         self._server.mount(
             "/assets",
-            StaticFiles(directory="assets"),
+            PublicStaticFiles(directory="assets"),
             name="assets",
         )
 
         self._server.include_router(health_router)
+        self._server.include_router(metrics_router)
         self._server.include_router(auth_router)
         self._server.include_router(rider_router)
         self._server.include_router(me_router)
@@ -0,0 +1,24 @@
+# core/models/asset.py
+from mongoengine import StringField, IntField, DictField
+
+from core.models import BaseDocument
+
+
+class Asset(BaseDocument):
+    """
+    Metadata for a content-addressed upload. The file lives at `path`,
+    named by its SHA-256, so the same bytes are only ever stored once.
+    """
+    sha256 = StringField(required=True, unique=True)
+    path = StringField(required=True)  # "assets/cas/ab/ab12…ef.png"
+    ext = StringField()
+    content_type = StringField()
+    size_bytes = IntField()
+
+    variants = DictField()  # width → resized URL
+
+    meta = {"collection": "assets"}
+
+    @property
+    def url(self) -> str:
+        return f"/{self.path}"
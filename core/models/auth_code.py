@@ -1,4 +1,5 @@
 # core/models/auth_code.py
+import logging
 from datetime import timedelta, timezone
 
 from mongoengine import StringField, DateTimeField, ReferenceField
@@ -6,6 +7,9 @@ from mongoengine import StringField, DateTimeField, ReferenceField
 from core.models import BaseDocument
 from core.models.racer import Racer
 from utils import utcnow
+from utils.log import get_logger, log
+
+logger = get_logger("auth")
 
 
 class AuthCode(BaseDocument):
@@ -14,7 +18,14 @@ class AuthCode(BaseDocument):
     expires_at = DateTimeField(required=True)
     used_at = DateTimeField()
 
-    meta = {"collection": "auth_codes"}
+    meta = {
+        "collection": "auth_codes",
+        "indexes": [
+            ("racer", "code", "used_at"),
+            # Mongo's TTL monitor drops codes once expires_at has passed
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ],
+    }
 
     @property
     def is_expired(self) -> bool:
@@ -31,7 +42,7 @@ class AuthCode(BaseDocument):
     def create(cls, racer: Racer, minutes: int = 10):
         expires = utcnow() + timedelta(minutes=minutes)
 
-        print("Creating AuthCode expires_at:", expires, "tzinfo:", expires.tzinfo)
+        log(logger, logging.DEBUG, "auth code created", expires_at=expires)
 
         return cls(
             racer=racer,
@@ -47,7 +58,13 @@ class AuthRefreshToken(BaseDocument):
     expires_at = DateTimeField(required=True)
     revoked_at = DateTimeField()
 
-    meta = {"collection": "auth_refresh_tokens"}
+    meta = {
+        "collection": "auth_refresh_tokens",
+        "indexes": [
+            "racer",
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+        ],
+    }
 
     @property
     def is_expired(self) -> bool:
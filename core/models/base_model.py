@@ -24,6 +24,22 @@ class BaseDocument(Document):
 
         return data
 
+    @classmethod
+    def raw_by_id(cls, ids, *fields: str) -> dict:
+        """
+        Raw PyMongo documents keyed by _id, in one query. Pass field names to
+        project; no Document objects are built.
+        """
+        ids = {i for i in ids if i is not None}
+        if not ids:
+            return {}
+
+        qs = cls.objects(id__in=ids)
+        if fields:
+            qs = qs.only(*fields)
+
+        return {d["_id"]: d for d in qs.as_pymongo()}
+
     def save(self, *args, **kwargs):
         self.updated_at = utcnow()
         return super().save(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,30 @@
+# core/models/dashboard.py
+from mongoengine import StringField, IntField, FloatField, DictField, DateTimeField
+
+from core.models import BaseDocument
+
+
+class DashboardRollup(BaseDocument):
+    """
+    Running totals behind the admin dashboard. Write paths $inc these as they
+    happen; DashboardController.reconcile() rebuilds them from source data.
+    """
+    key = StringField(required=True, unique=True, default="global")
+
+    events = IntField(default=0)
+    racers = IntField(default=0)
+    registrations = IntField(default=0)
+
+    event_revenue = FloatField(default=0.0)
+    spectator_revenue = FloatField(default=0.0)
+    membership_revenue = FloatField(default=0.0)
+
+    day_passes = IntField(default=0)
+    weekend_passes = IntField(default=0)
+
+    registrations_by_month = DictField()  # "YYYY-MM" → count
+    registrations_by_class = DictField()  # class_key → {"class_name", "count"}
+
+    reconciled_at = DateTimeField(null=True)
+
+    meta = {"collection": "dashboard_rollups"}
@@ -93,6 +93,7 @@ class Event(BaseDocument):
     description = StringField()
     image_url = StringField()
     image_updated_at = DateTimeField()
+    image_variants = DictField()  # width → resized URL
 
     # Dates
     start_date = DateTimeField(required=True)
@@ -5,6 +5,7 @@ from mongoengine import (
     ListField,
     EmbeddedDocument,
     EmbeddedDocumentField,
+    DictField,
 )
 from core.models import BaseDocument
 
@@ -16,6 +17,7 @@ from core.models import BaseDocument
 class Sponsor(EmbeddedDocument):
     name = StringField(required=True)
     logo_url = StringField()
+    logo_variants = DictField()  # width → resized URL
     website_url = StringField()
     is_active = BooleanField(default=True)
 
@@ -6,6 +6,7 @@ from mongoengine import (
     BooleanField,
     IntField,
     DictField,
+    FloatField,
 )
 from core.models import BaseDocument
 from core.models.event import Event
@@ -33,11 +34,18 @@ class PayPalCheckout(BaseDocument):
     # Add-ons
     purchase_ihra_membership = BooleanField(default=False)
 
+    # Amounts charged at checkout creation (None on older checkouts)
+    spectator_amount = FloatField(null=True)
+    membership_amount = FloatField(null=True)
+
     billing_zip = StringField(null=True)
 
     is_captured = BooleanField(default=False)
 
     meta = {
         "collection": "paypal_checkouts",
-        "indexes": ["paypal_order_id"],
+        "indexes": [
+            "paypal_order_id",
+            ("event", "is_captured"),  # per-event revenue
+        ],
     }
\ No newline at end of file
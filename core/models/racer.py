@@ -1,7 +1,7 @@
 # core/models/racer.py
 from datetime import timedelta, date, timezone
 
-from mongoengine import StringField, DateField, BooleanField, DateTimeField, ListField
+from mongoengine import StringField, DateField, BooleanField, DateTimeField, ListField, DictField
 
 from core.models import BaseDocument
 from utils import utcnow
@@ -35,9 +35,11 @@ class Racer(BaseDocument):
 
     profile_image_path = StringField()
     profile_image_updated_at = DateTimeField()
+    profile_image_variants = DictField()  # width → resized URL
 
     banner_image_path = StringField()
     banner_image_updated_at = DateTimeField()
+    banner_image_variants = DictField()  # width → resized URL
 
     waiver_path = StringField()
     waiver_signed_at = DateTimeField()
@@ -36,6 +36,7 @@ class EventRegistration(BaseDocument):
         "collection": "event_registrations",
         "indexes": [
             ("event", "racer", "class_key"),
+            ("event", "created_at"),  # per-event analytics
             ("payment",),  # useful for admin queries
         ],
     }
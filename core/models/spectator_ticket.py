@@ -12,6 +12,11 @@ from datetime import datetime
 import uuid
 
 from utils import utcnow
+from utils.phone import normalize_phone
+
+
+def new_ticket_code() -> str:
+    return uuid.uuid4().hex
 
 
 class SpectatorTicket(BaseDocument):
@@ -23,11 +28,12 @@ class SpectatorTicket(BaseDocument):
 
     purchaser_name = StringField(required=True)
     purchaser_phone = StringField(required=True)
+    purchaser_phone_e164 = StringField(null=True)  # normalized for gate lookup
 
     ticket_code = StringField(
         required=True,
         unique=True,
-        default=lambda: uuid.uuid4().hex,
+        default=new_ticket_code,
     )
 
     ticket_type = StringField(
@@ -37,6 +43,11 @@ class SpectatorTicket(BaseDocument):
 
     is_used = BooleanField(default=False)
     used_at = DateTimeField(null=True)
+    scan_id = StringField(null=True)  # batch that admitted this ticket
+    scanned_by = StringField(null=True)  # offline scanner device id
+
+    def clean(self):
+        self.purchaser_phone_e164 = normalize_phone(self.purchaser_phone)
 
     def mark_used(self):
         if self.is_used:
@@ -50,7 +61,10 @@ class SpectatorTicket(BaseDocument):
         "indexes": [
             "ticket_code",
             ("event", "is_used"),
+            ("event", "updated_at"),  # scanner sync deltas
+            ("event", "created_at"),  # per-event analytics
             ("purchaser_phone", "event"),
+            ("purchaser_phone_e164", "event"),
             ("payment",),
         ],
     }
\ No newline at end of file
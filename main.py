@@ -11,6 +11,12 @@ def main() -> None:
         "main:app",
         host="0.0.0.0",
         port=8000,
+        # Client addresses (per-IP WebSocket cap, logs) come from the proxy's X-Forwarded-For
+        proxy_headers=True,
+        forwarded_allow_ips=hydrodrags_app.settings.forwarded_allow_ips,
+        # Protocol-level pings: peers that stop answering are dropped by the server
+        ws_ping_interval=hydrodrags_app.settings.ws_heartbeat_interval_seconds,
+        ws_ping_timeout=hydrodrags_app.settings.ws_heartbeat_interval_seconds,
         # reload=True,
     )
 
@@ -1,5 +1,6 @@
 # server/schemas/base.py
-from typing import TypeVar
+from functools import lru_cache
+from typing import ClassVar, TypeVar
 
 T = TypeVar("T", bound="MongoReadModel")
 
@@ -8,17 +9,66 @@ from pydantic import BaseModel
 
 
 class MongoReadModel(BaseModel):
+    # Document the raw rows come from. Its field defaults fill keys older
+    # documents never stored, as MongoEngine does when it loads them.
+    mongo_document: ClassVar[type | None] = None
+
     @classmethod
     def from_mongo(cls, document):
-        raw = document.to_mongo().to_dict()
+        return cls.from_raw(document.to_mongo())
+
+    @classmethod
+    def from_raw(cls, raw: dict):
+        """
+        Build from a raw PyMongo / BSON document (as_pymongo(), find(), to_mongo()).
+
+        Skips MongoEngine entirely: `_id` becomes `id`, ObjectIds, including
+        lists of them, become strings and missing fields get the document's
+        defaults. Nested documents are left to subclasses.
+        """
+        return cls.model_validate(cls._normalize_raw(raw))
+
+    @classmethod
+    def mongo_fields(cls) -> tuple[str, ...]:
+        """
+        Stored fields this model reads, for `.only()` projections on raw queries.
+        """
+        return tuple(name for name in cls.model_fields if name != "id")
+
+    @classmethod
+    def _normalize_raw(cls, raw: dict) -> dict:
         data = {}
 
+        for name, db_field, default in _document_defaults(cls):
+            if db_field not in raw:
+                data[name] = default() if callable(default) else default
+
         for key, value in raw.items():
             if key == "_id":
                 data["id"] = str(value)
             elif isinstance(value, ObjectId):
                 data[key] = str(value)
+            elif isinstance(value, list) and value and isinstance(value[0], ObjectId):
+                data[key] = [str(v) for v in value]
             else:
                 data[key] = value
 
-        return cls(**data)
\ No newline at end of file
+        return data
+
+
+@lru_cache(maxsize=None)
+def _document_defaults(model: type[MongoReadModel]) -> tuple:
+    """
+    (name, db_field, default) for each stored field `model` reads. A None
+    default is only used where the read model has no default of its own.
+    """
+    if model.mongo_document is None:
+        return ()
+
+    return tuple(
+        (name, field.db_field, field.default)
+        for name, field in model.mongo_document._fields.items()
+        if name != "id"
+        and name in model.model_fields
+        and (field.default is not None or model.model_fields[name].is_required())
+    )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, EmailStr
 
 
@@ -19,4 +21,11 @@ class VerifyCodeResponse(BaseModel):
 
 
 class RefreshTokenRequest(BaseModel):
-    refresh_token: str
\ No newline at end of file
+    refresh_token: str
+
+class AuthContext(BaseModel):
+    """
+    Identity taken from verified JWT claims, without a database read.
+    """
+    racer_id: str
+    email: Optional[str] = None
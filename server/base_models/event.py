@@ -9,9 +9,10 @@ from typing import Optional, List, Dict, Any
 
 from pydantic import BaseModel, Field, computed_field
 
-from core.models.event import EventFormat
+from core.models.event import Event, EventFormat
 from server.base_models import MongoReadModel
 from utils import utcnow
+from utils.image_service import ImageService
 
 
 # ------------------------------------------------------------------
@@ -121,6 +122,8 @@ class EventUpdate(BaseModel):
 # ------------------------------------------------------------------
 
 class EventBase(MongoReadModel):
+    mongo_document = Event
+
     id: str
 
     created_at: datetime
@@ -131,6 +134,7 @@ class EventBase(MongoReadModel):
     description: Optional[str] = None
     image_url: Optional[str] = None
     image_updated_at: Optional[datetime] = None
+    image_variants: Dict[str, str] = Field(default_factory=dict)
 
     start_date: datetime
     end_date: Optional[datetime] = None
@@ -158,6 +162,11 @@ class EventBase(MongoReadModel):
             return dt.replace(tzinfo=timezone.utc)
         return dt
 
+    @computed_field
+    @property
+    def image_thumb_url(self) -> Optional[str]:
+        return ImageService.pick(self.image_variants, ImageService.CARD_WIDTH, fallback=self.image_url)
+
     @computed_field
     @property
     def ordered_schedule(self) -> list[EventScheduleItem]:
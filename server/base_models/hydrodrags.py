@@ -1,6 +1,6 @@
 # server/base_models/hydrodrags.py
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from server.base_models import MongoReadModel
 
@@ -16,6 +16,7 @@ class AssetUpdateResponse(BaseModel):
 class SponsorBase(BaseModel):
     name: str
     logo_url: Optional[str] = None
+    logo_variants: Dict[str, str] = Field(default_factory=dict)
     website_url: Optional[str] = None
     is_active: bool = True
 
@@ -33,6 +34,7 @@ class SpanishContentBase(BaseModel):
 class SponsorCreate(BaseModel):
     name: str
     logo_url: str
+    logo_variants: Dict[str, str] = Field(default_factory=dict)
     website_url: Optional[str] = None
     is_active: bool = True
 
@@ -40,6 +42,7 @@ class SponsorCreate(BaseModel):
 class SponsorUpdate(BaseModel):
     name: Optional[str] = None
     logo_url: Optional[str] = None
+    logo_variants: Optional[Dict[str, str]] = None
     website_url: Optional[str] = None
     is_active: Optional[bool] = None
 
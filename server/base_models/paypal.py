@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
 
+from core.models.paypal import PayPalCheckout
 from server.base_models import MongoReadModel
 from server.base_models.event import EventBase
 from server.base_models.racer import RacerBase
@@ -58,6 +59,8 @@ class SpectatorCheckoutCreateRequest(BaseModel):
 
 
 class PayPalCheckoutRead(MongoReadModel):
+    mongo_document = PayPalCheckout
+
     id: str
     paypal_order_id: str
 
@@ -72,23 +75,24 @@ class PayPalCheckoutRead(MongoReadModel):
 
     @classmethod
     def from_mongo(cls, document):
-        data = super().from_mongo(document)
+        return cls.from_raw({
+            **document.to_mongo(),
+            "event": document.event.to_mongo() if getattr(document, "event", None) else None,
+            "racer": document.racer.to_mongo() if getattr(document, "racer", None) else None,
+        })
 
-        return cls(
+    @classmethod
+    def from_raw(cls, raw: dict):
+        """
+        `event` and `racer` are expanded only when joined in as raw documents;
+        bare ids are dropped.
+        """
+        data = cls._normalize_raw(raw)
+        event, racer, created_at = data.get("event"), data.get("racer"), data.get("created_at")
+
+        return cls.model_validate({
             **data,
-            event=(
-                EventBase.from_mongo(document.event)
-                if getattr(document, "event", None)
-                else None
-            ),
-            racer=(
-                RacerBase.from_mongo(document.racer)
-                if getattr(document, "racer", None)
-                else None
-            ),
-            created_at=(
-                document.created_at.isoformat()
-                if getattr(document, "created_at", None)
-                else None
-            ),
-        )
\ No newline at end of file
+            "event": EventBase.from_raw(event) if isinstance(event, dict) else None,
+            "racer": RacerBase.from_raw(racer) if isinstance(racer, dict) else None,
+            "created_at": created_at.isoformat() if created_at else None,
+        })
@@ -2,13 +2,17 @@
 from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
-from pydantic import EmailStr, BaseModel, computed_field
+from pydantic import EmailStr, BaseModel, Field, computed_field
 
+from core.models.racer import Racer
 from server.base_models import MongoReadModel
 from utils import utcnow
+from utils.image_service import ImageService
 
 
 class RacerBase(MongoReadModel):
+    mongo_document = Racer
+
     id: str
     email: EmailStr
 
@@ -39,6 +43,8 @@ class RacerBase(MongoReadModel):
     banner_image_path: Optional[str] = None
     banner_image_updated_at: Optional[datetime] = None
     profile_image_updated_at: Optional[datetime] = None
+    profile_image_variants: dict[str, str] = Field(default_factory=dict)
+    banner_image_variants: dict[str, str] = Field(default_factory=dict)
 
     waiver_path: Optional[str] = None
     waiver_signed_at: Optional[datetime] = None
@@ -49,6 +55,15 @@ class RacerBase(MongoReadModel):
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
+    @computed_field
+    @property
+    def profile_image_thumb_url(self) -> Optional[str]:
+        return ImageService.pick(
+            self.profile_image_variants,
+            ImageService.AVATAR_WIDTH,
+            fallback=self.profile_image_path,
+        )
+
     @computed_field
     @property
     def has_valid_waiver(self) -> bool:
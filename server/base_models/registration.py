@@ -3,6 +3,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, computed_field
 
+from core.models.registration import EventRegistration
 from server.base_models import MongoReadModel
 from server.base_models.event import EventBase
 from server.base_models.paypal import PayPalCheckoutRead
@@ -131,6 +132,8 @@ class EventRegistrationAdminBase(MongoReadModel):
 # ==========================================================
 
 class EventRegistrationClientBase(MongoReadModel):
+    mongo_document = EventRegistration
+
     id: str
 
     pwc_identifier: str
@@ -170,20 +173,32 @@ class EventRegistrationClientBase(MongoReadModel):
 
     @classmethod
     def from_mongo(cls, document):
-        return cls(
-            id=str(document.id),
-            pwc_identifier=document.pwc_identifier,
-            class_key=document.class_key,
-            class_name=document.class_name,
-            price=float(document.price),
-            losses=document.losses,
-            is_paid=document.is_paid,
-            created_at=document.created_at,
-            racer=RacerBase.from_mongo(document.racer),
-            event=EventBase.from_mongo(document.event),
-            payment=(
-                PayPalCheckoutRead.from_mongo(document.payment)
+        return cls.from_raw({
+            **document.to_mongo(),
+            "racer": document.racer.to_mongo(),
+            "event": document.event.to_mongo(),
+            "payment": (
+                {
+                    **document.payment.to_mongo(),
+                    "event": document.payment.event.to_mongo() if document.payment.event else None,
+                    "racer": document.payment.racer.to_mongo() if document.payment.racer else None,
+                }
                 if getattr(document, "payment", None)
                 else None
             ),
-        )
\ No newline at end of file
+        })
+
+    @classmethod
+    def from_raw(cls, raw: dict):
+        """
+        Raw registration with `racer`, `event` and `payment` joined in as raw
+        documents, see EventRegistrationController.get_raw_registrations_for_racer.
+        """
+        payment = raw.get("payment")
+
+        return cls.model_validate({
+            **cls._normalize_raw(raw),
+            "racer": RacerBase.from_raw(raw["racer"]),
+            "event": EventBase.from_raw(raw["event"]),
+            "payment": PayPalCheckoutRead.from_raw(payment) if isinstance(payment, dict) else None,
+        })
@@ -2,6 +2,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 
 from server.base_models import MongoReadModel
+from utils.image_service import ImageService
 
 
 class MatchupBase(BaseModel):
@@ -60,6 +61,7 @@ class RegistrationRefBase(BaseModel):
     racer_id: str
     racer_first_name: str | None = None
     racer_last_name: str | None = None
+    racer_avatar_url: str | None = None
     class_key: str
     losses: int
     is_paid: bool
@@ -71,6 +73,11 @@ class RegistrationRefBase(BaseModel):
             racer_id=str(reg.racer.id),
             racer_first_name=reg.racer.first_name,
             racer_last_name=reg.racer.last_name,
+            racer_avatar_url=ImageService.pick(
+                reg.racer.profile_image_variants,
+                ImageService.AVATAR_WIDTH,
+                fallback=reg.racer.profile_image_path,
+            ),
             class_key=reg.class_key,
             losses=reg.losses,
             is_paid=reg.is_paid,
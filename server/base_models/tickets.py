@@ -1,6 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Literal
 
+from pydantic import BaseModel, Field, field_validator
+
+from core.models.spectator_ticket import SpectatorTicket
 from server.base_models import MongoReadModel
 from server.base_models.event import EventBase
 from server.base_models.paypal import PayPalCheckoutRead
@@ -8,6 +11,8 @@ from server.base_models.racer import RacerBase
 
 
 class SpectatorTicketBase(MongoReadModel):
+    mongo_document = SpectatorTicket
+
     id: str
 
     # references (IDs only by default)
@@ -78,4 +83,80 @@ class SpectatorTicketAdminBase(SpectatorTicketBase):
                     else None
                 ),
             }
-        )
\ No newline at end of file
+        )
+
+
+class TicketScanResult(BaseModel):
+    """
+    Lightweight ticket view for gate scans, built from a projected raw document.
+    """
+    ticket_code: str
+    ticket_type: str
+    purchaser_name: str
+    event: Optional[str] = None
+    used_at: Optional[datetime] = None
+
+    @field_validator("event", mode="before")
+    @classmethod
+    def _event_id(cls, value):
+        return str(value) if value is not None else None
+
+
+class TicketScanResponse(BaseModel):
+    ticket_code: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+    used_at: Optional[datetime] = None
+    ticket: Optional[TicketScanResult] = None
+
+
+class TicketBatchScanRequest(BaseModel):
+    ticket_codes: list[str] = Field(..., min_length=1, max_length=500)
+
+
+class TicketBatchScanResponse(BaseModel):
+    admitted: int
+    rejected: int
+    results: list[TicketScanResponse]
+
+
+class TicketSyncEntry(BaseModel):
+    ticket_code: str
+    ticket_type: str
+    is_used: bool
+    used_at: Optional[datetime] = None
+
+
+class TicketSyncSnapshot(BaseModel):
+    version: datetime  # pass back as `since` for the next delta
+    full: bool
+    tickets: list[TicketSyncEntry]
+
+
+class TicketOfflineScan(BaseModel):
+    ticket_code: str
+    scanned_at: datetime
+
+
+class TicketSyncUploadRequest(BaseModel):
+    device_id: str = Field(..., min_length=1, max_length=64)
+    scans: list[TicketOfflineScan] = Field(..., max_length=5000)
+
+
+class TicketSyncScanResult(BaseModel):
+    ticket_code: str
+    status: Literal["admitted", "duplicate", "conflict", "invalid"]
+    scanned_at: datetime
+
+    # conflicts only: the scan that won
+    used_at: Optional[datetime] = None
+    scanned_by: Optional[str] = None
+
+
+class TicketSyncUploadResponse(BaseModel):
+    version: datetime
+    admitted: int
+    duplicates: int
+    conflicts: int
+    invalid: int
+    results: list[TicketSyncScanResult]
@@ -0,0 +1,52 @@
+# server/responses.py
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(value: Any):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode models, dicts and lists of them to JSON bytes in one pass.
+    """
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+
+def extend_object(encoded: bytes, fields: dict) -> bytes:
+    """
+    Add `fields` to an already-encoded JSON object without decoding it.
+    """
+    extra = dumps(fields)[1:-1]
+    if not extra:
+        return encoded
+    if encoded == b"{}":
+        return b"{" + extra + b"}"
+    return encoded[:-1] + b"," + extra + b"}"
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    orjson-encoded response for read models that are already built.
+
+    Returning a Response from a route skips FastAPI's response_model
+    validate-and-serialize pass, so keep `response_model` on the route for
+    the OpenAPI schema and return this for the body. Models are dumped in
+    Python mode (computed fields included) and orjson encodes datetimes,
+    enums and UUIDs natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -12,6 +12,7 @@ from .hydrodrags import router as hydrodrags_router
 from .tickets import router as tickets_router
 from .paypal import router as paypal_router
 from .speed import router as speed_router
+from .debug import router as debug_router
 
 
 router = APIRouter(prefix="/admin")
@@ -24,4 +25,5 @@ router.include_router(registrations_router)
 router.include_router(hydrodrags_router)
 router.include_router(tickets_router)
 router.include_router(paypal_router)
-router.include_router(speed_router)
\ No newline at end of file
+router.include_router(speed_router)
+router.include_router(debug_router)
\ No newline at end of file
@@ -1,12 +1,11 @@
 # server/routes/admin/charts.py
 
-from fastapi import APIRouter, Depends
-
-from core.models.event import Event
-from core.models.racer import Racer
-from core.models.registration import EventRegistration
+from bson import ObjectId
+from fastapi import APIRouter, Depends, HTTPException
 
 from core.controllers.chart_controller import ChartController
+from core.controllers.dashboard_controller import DashboardController
+from core.models.event import Event
 from utils.dependencies import require_admin_key
 
 # ------------------------------------------------------------------
@@ -25,38 +24,19 @@ router = APIRouter(
 
 @router.get("/counts")
 async def admin_dashboard_counts():
-    events = Event.objects.count()
-    racers = Racer.objects.count()
-    registrations = EventRegistration.objects.count()
-
-    # Event revenue: sum of registration price where is_paid=True
-    event_revenue_pipeline = [
-        {"$match": {"is_paid": True}},
-        {"$group": {"_id": None, "total": {"$sum": "$price"}}},
-    ]
-    event_revenue_result = list(
-        EventRegistration.objects.aggregate(*event_revenue_pipeline)
-    )
-    event_revenue = (
-        float(event_revenue_result[0]["total"])
-        if event_revenue_result
-        else 0.0
-    )
-
-    # Placeholders for future expansion
-    spectator_revenue = 0.0
-    membership_revenue = 0.0
-
-    return {
-        "events": events,
-        "racers": racers,
-        "registrations": registrations,
-        "event_revenue": event_revenue,
-        "spectator_revenue": spectator_revenue,
-        "membership_revenue": membership_revenue,
-        "dayPasses": 0,
-        "weekendPasses": 0,
-    }
+    """
+    Headline figures, read from the maintained rollup document.
+    """
+    return DashboardController.counts()
+
+
+@router.post("/reconcile")
+async def admin_dashboard_reconcile():
+    """
+    Rebuild the rollup from source data now instead of waiting for the job.
+    """
+    DashboardController.reconcile()
+    return DashboardController.counts()
 
 
 # ==================================================================
@@ -68,4 +48,31 @@ async def admin_dashboard_charts():
     """
     Returns all chart datasets needed for the admin dashboard.
     """
-    return ChartController.dashboard_charts()
\ No newline at end of file
+    return DashboardController.charts()
+
+
+# ==================================================================
+# PER-EVENT ANALYTICS
+# ==================================================================
+
+@router.get("/events/{event_id}/analytics")
+async def admin_event_analytics(event_id: str):
+    """
+    Per-event registrations, ticket sales, check-ins and revenue.
+    """
+    _require_event(event_id)
+    return ChartController.event_analytics(event_id)
+
+
+@router.get("/events/{event_id}/analytics/explain")
+async def admin_event_analytics_explain(event_id: str):
+    """
+    Which index each analytics pipeline uses, for verifying new indexes.
+    """
+    _require_event(event_id)
+    return ChartController.explain_event_analytics(event_id)
+
+
+def _require_event(event_id: str) -> None:
+    if not ObjectId.is_valid(event_id) or not Event.objects(id=event_id).only("id").first():
+        raise HTTPException(404, "Event not found")
@@ -0,0 +1,31 @@
+# server/routes/admin/debug.py
+
+from fastapi import APIRouter, Depends, Query
+
+from utils.dependencies import require_admin_key
+from utils.query_profiler import QueryProfiler
+
+router = APIRouter(
+    prefix="/debug",
+    tags=["Admin Debug"],
+    dependencies=[Depends(require_admin_key)]
+)
+
+
+@router.get("/queries")
+async def query_profile(limit: int = Query(50, ge=1, le=QueryProfiler.HISTORY_SIZE)):
+    """
+    Mongo commands per request: per-route summary plus the latest requests.
+    """
+    return {
+        "warn_commands": QueryProfiler.warn_commands,
+        "warn_ms": QueryProfiler.warn_ms,
+        "routes": QueryProfiler.by_route(),
+        "recent": QueryProfiler.recent(limit),
+    }
+
+
+@router.delete("/queries")
+async def reset_query_profile():
+    QueryProfiler.reset()
+    return {"status": "ok"}
@@ -10,6 +10,7 @@ from server.base_models.event import (
     EventResponse,
     EventListResponse,
 )
+from server.responses import ModelJSONResponse
 from utils.dependencies import require_admin_key
 
 router = APIRouter(tags=["Admin Events"],
@@ -26,10 +27,10 @@ async def admin_create_event(payload: EventCreate):
 
 @router.get("/{event_id}", response_model=EventResponse)
 async def admin_get_event(event_id: str):
-    event = Event.objects(id=event_id).first()
+    event = Event.objects(id=event_id).as_pymongo().first()
     if not event:
         raise HTTPException(404, "Event not found")
-    return {"event": EventBase.from_mongo(event)}
+    return ModelJSONResponse({"event": EventBase.from_raw(event)})
 
 
 @router.get("", response_model=EventListResponse)
@@ -44,14 +45,15 @@ async def admin_list_events(
         query.order_by("-start_date")
         .skip((page - 1) * page_size)
         .limit(page_size)
+        .as_pymongo()
     )
 
-    return {
-        "events": [EventBase.from_mongo(e) for e in events],
+    return ModelJSONResponse({
+        "events": [EventBase.from_raw(e) for e in events],
         "total": total,
         "page": page,
         "page_size": page_size,
-    }
+    })
 
 
 @router.patch("/{event_id}", response_model=EventBase)
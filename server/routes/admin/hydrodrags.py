@@ -1,14 +1,13 @@
 # server/routes/admin/hydrodrags.py
 
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from pathlib import Path
-import uuid
 
 from core.controllers.hydrodrags_controller import HydroDragsConfigController
 from core.models.hydrodrags import HydroDragsConfig
 from server.base_models.hydrodrags import HydroDragsConfigUpdate, SponsorCreate, SponsorUpdate, HydroDragsConfigBase, \
     NewsItemCreate, NewsItemUpdate
 from utils.dependencies import require_admin_key  # whatever you already use
+from utils.asset_store import AssetStore
 
 router = APIRouter(
     prefix="/hydrodrags",
@@ -63,39 +62,23 @@ async def upload_sponsor_image(file: UploadFile = File(...)):
     if not file.content_type.startswith("image/"):
         raise HTTPException(400, "Invalid image type")
 
-    ext = Path(file.filename).suffix
-    filename = f"{uuid.uuid4().hex}{ext}"
-
-    save_dir = Path("assets/sponsors")
-    save_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = save_dir / filename
-
-    with file_path.open("wb") as f:
-        f.write(await file.read())
+    asset = await AssetStore.store(file, default_ext="")
 
     return {
-        "logo_url": f"/assets/sponsors/{filename}"
+        "logo_url": asset.url,
+        "logo_variants": asset.variants,
     }
 
-@router.post("/upload/sponsor-image")
+@router.post("/upload/media-image")
 async def upload_media_image(file: UploadFile = File(...)):
     if not file.content_type.startswith("image/"):
         raise HTTPException(400, "Invalid image type")
 
-    ext = Path(file.filename).suffix
-    filename = f"{uuid.uuid4().hex}{ext}"
-
-    save_dir = Path("assets/sponsors")
-    save_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = save_dir / filename
-
-    with file_path.open("wb") as f:
-        f.write(await file.read())
+    asset = await AssetStore.store(file, default_ext="")
 
     return {
-        "logo_url": f"/assets/media/{filename}"
+        "logo_url": asset.url,
+        "logo_variants": asset.variants,
     }
 
 
@@ -124,9 +107,9 @@ from server.base_models.hydrodrags import AssetUpdateResponse
 # -------------------------
 
 @router.post("/logo", response_model=AssetUpdateResponse)
-def upload_logo(file: UploadFile = File(...)):
+async def upload_logo(file: UploadFile = File(...)):
     controller = HydroDragsConfigController()
-    url = controller.update_logo(file)
+    url = await controller.update_logo(file)
     return {"field": "logo_url", "url": url}
 
 
@@ -142,9 +125,9 @@ def delete_logo():
 # -------------------------
 
 @router.post("/banner", response_model=AssetUpdateResponse)
-def upload_banner(file: UploadFile = File(...)):
+async def upload_banner(file: UploadFile = File(...)):
     controller = HydroDragsConfigController()
-    url = controller.update_banner(file)
+    url = await controller.update_banner(file)
     return {"field": "banner_url", "url": url}
 
 
@@ -3,6 +3,7 @@ from typing import List
 
 from core.controllers.paypal_controller import PayPalAdminController
 from server.base_models.paypal import PayPalCheckoutRead
+from server.responses import ModelJSONResponse
 from utils.dependencies import require_admin_key
 
 router = APIRouter(prefix="/paypal", tags=["Admin / PayPal"],
@@ -19,4 +20,4 @@ async def list_paypal_transactions(
         captured=captured,
     )
 
-    return [PayPalCheckoutRead.from_mongo(c) for c in checkouts]
\ No newline at end of file
+    return ModelJSONResponse([PayPalCheckoutRead.from_raw(c) for c in checkouts])
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends
 
 from core.models.racer import Racer
 from server.base_models.racer import RacerBase
+from server.responses import ModelJSONResponse
 from utils.dependencies import require_admin_key
 
 router = APIRouter(tags=["Admin Racers"],
@@ -12,8 +13,8 @@ router = APIRouter(tags=["Admin Racers"],
 
 @router.get("/all", response_model=list[RacerBase])
 async def admin_get_all_racers():
-    racers = Racer.objects().all()
-    return [RacerBase.from_mongo(r) for r in racers]
+    racers = Racer.objects.only(*RacerBase.mongo_fields()).as_pymongo()
+    return ModelJSONResponse([RacerBase.from_raw(r) for r in racers])
 
 
 @router.get("/{racer_id}", response_model=RacerBase)
@@ -1,24 +1,100 @@
-from fastapi import APIRouter, Depends
+from collections import Counter
+from datetime import datetime
 
-from core.controllers.ticket_controller import TicketController
+from fastapi import APIRouter, Depends, HTTPException
+
+from core.controllers.ticket_controller import (
+    TicketController,
+    SYNC_ADMITTED,
+    SYNC_DUPLICATE,
+    SYNC_CONFLICT,
+    SYNC_INVALID,
+)
 from core.models.spectator_ticket import SpectatorTicket
-from server.base_models.tickets import SpectatorTicketBase
+from server.base_models.tickets import (
+    SpectatorTicketBase,
+    TicketScanResponse,
+    TicketBatchScanRequest,
+    TicketBatchScanResponse,
+    TicketSyncSnapshot,
+    TicketSyncUploadRequest,
+    TicketSyncUploadResponse,
+)
+from server.responses import ModelJSONResponse
 from utils.dependencies import require_admin_key
 
 router = APIRouter(prefix="/tickets", tags=["Tickets"],
                    dependencies=[Depends(require_admin_key)])
 
 
-@router.post("/scan")
+@router.post(
+    "/scan",
+    response_model=TicketScanResponse,
+    response_model_exclude_none=True,
+)
 async def scan_ticket(ticket_code: str):
-    result = TicketController.scan_ticket(ticket_code)
+    return TicketController.scan_ticket(ticket_code)
 
-    if not result["success"]:
-        return result
+
+@router.post(
+    "/scan/batch",
+    response_model=TicketBatchScanResponse,
+    response_model_exclude_none=True,
+)
+async def scan_tickets(payload: TicketBatchScanRequest):
+    results = TicketController.scan_tickets(payload.ticket_codes)
+    admitted = sum(1 for r in results if r["success"])
 
     return {
-        "success": True,
-        "ticket": SpectatorTicketBase.from_mongo(result["ticket"]),
+        "admitted": admitted,
+        "rejected": len(results) - admitted,
+        "results": results,
+    }
+
+
+@router.get("/lookup", response_model=list[SpectatorTicketBase])
+async def lookup_tickets_by_phone(
+    phone: str,
+    event_id: str | None = None,
+):
+    try:
+        tickets = TicketController.lookup_by_phone(phone, event_id=event_id)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    return [SpectatorTicketBase.from_mongo(t) for t in tickets]
+
+
+@router.get("/sync/snapshot", response_model=TicketSyncSnapshot)
+async def sync_snapshot(
+    event_id: str | None = None,
+    since: datetime | None = None,
+):
+    try:
+        return TicketController.sync_snapshot(event_id=event_id, since=since)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+
+@router.post(
+    "/sync/scans",
+    response_model=TicketSyncUploadResponse,
+    response_model_exclude_none=True,
+)
+async def sync_scans(payload: TicketSyncUploadRequest):
+    result = TicketController.sync_scans(
+        device_id=payload.device_id,
+        scans=[(s.ticket_code, s.scanned_at) for s in payload.scans],
+    )
+    statuses = Counter(r["status"] for r in result["results"])
+
+    return {
+        "version": result["version"],
+        "admitted": statuses[SYNC_ADMITTED],
+        "duplicates": statuses[SYNC_DUPLICATE],
+        "conflicts": statuses[SYNC_CONFLICT],
+        "invalid": statuses[SYNC_INVALID],
+        "results": result["results"],
     }
 
 
@@ -47,5 +123,10 @@ async def get_all_tickets(
     if used is not None:
         qs = qs.filter(is_used=used)
 
-    return [SpectatorTicketBase.from_mongo(t) for t in qs.order_by("-created_at")]
+    rows = (
+        qs.order_by("-created_at")
+        .only(*SpectatorTicketBase.mongo_fields())
+        .as_pymongo()
+    )
+    return ModelJSONResponse([SpectatorTicketBase.from_raw(t) for t in rows])
 
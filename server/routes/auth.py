@@ -1,24 +1,31 @@
 # server/routes/auth.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from core.controllers.auth_controller import AuthController
-from core.config.settings import Settings
+from core.config.settings import Settings, get_settings
 from server.base_models.auth import VerifyCodeResponse, VerifyCodeRequest, AuthRequest, RefreshTokenRequest
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
-settings = Settings()
-auth_controller = AuthController(settings=settings)
+
+def get_auth_controller(settings: Settings = Depends(get_settings)) -> AuthController:
+    return AuthController(settings=settings)
 
 
 @router.post("/request-code")
-async def request_code(payload: AuthRequest):
+async def request_code(
+    payload: AuthRequest,
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
     await auth_controller.request_code(payload.email)
     return {"status": "sent"}
 
 
 @router.post("/verify-code", response_model=VerifyCodeResponse)
-async def verify_code(payload: VerifyCodeRequest):
+async def verify_code(
+    payload: VerifyCodeRequest,
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
     try:
         return await auth_controller.verify_code(
             payload.email,
@@ -29,7 +36,10 @@ async def verify_code(payload: VerifyCodeRequest):
 
 
 @router.post("/refresh", response_model=VerifyCodeResponse)
-async def refresh_token(payload: RefreshTokenRequest):
+async def refresh_token(
+    payload: RefreshTokenRequest,
+    auth_controller: AuthController = Depends(get_auth_controller),
+):
     try:
         return await auth_controller.refresh_token(payload.refresh_token)
     except ValueError:
@@ -1,11 +1,17 @@
 # server/routes/events.py
-from fastapi import APIRouter, HTTPException, Query, UploadFile, File
+import logging
+
+from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Response
 
 from core.controllers.event_controller import EventController
 from core.controllers.round_controller import TournamentService
 from core.models.event import Event
 from server.base_models.event import EventCreate, EventBase, EventResponse, EventListResponse, EventUpdate
 from server.base_models.round import RoundBase, BracketsBase
+from server.responses import ModelJSONResponse
+from utils.log import get_logger, log
+
+logger = get_logger("routes.events")
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
@@ -18,11 +24,11 @@ async def create_event(payload: EventCreate):
 
 @router.get("/{event_id}", response_model=EventResponse)
 async def get_event(event_id: str):
-    event = Event.objects(id=event_id).first()
+    event = Event.objects(id=event_id).as_pymongo().first()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    return {"event": EventBase.from_mongo(event)}
+    return ModelJSONResponse({"event": EventBase.from_raw(event)})
 
 
 @router.get("/", response_model=EventListResponse)
@@ -42,14 +48,14 @@ async def list_events(
         .order_by("start_date")
         .skip((page - 1) * page_size)
         .limit(page_size)
+        .as_pymongo()
     )
-    resp = {
-        "events": [EventBase.from_mongo(e) for e in events],
+    return ModelJSONResponse({
+        "events": [EventBase.from_raw(e) for e in events],
         "total": total,
         "page": page,
         "page_size": page_size,
-    }
-    return resp
+    })
 
 
 @router.patch("/{event_id}", response_model=EventBase)
@@ -94,14 +100,13 @@ async def fetch_event_rounds(
     event_id: str,
     class_key: str | None = Query(default=None),
 ):
-    print("Getting rounds for event: ", event_id, " class: ", class_key or "all")
+    log(logger, logging.DEBUG, "get rounds", event_id=event_id, class_key=class_key or "all")
     event = Event.objects(id=event_id).first()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    rounds_qs = await TournamentService.list_rounds(
+    rounds_json = await TournamentService.brackets_json(
         event=event,
         class_key=class_key,
     )
-    print("Found rounds: ", rounds_qs)
-    return [BracketsBase.from_mongo(r) for r in rounds_qs]
\ No newline at end of file
+    return Response(rounds_json, media_type="application/json")
\ No newline at end of file
@@ -5,6 +5,7 @@ from core.models.pwc import PWC
 from core.models.racer import Racer
 from server.base_models.pwc import PWCPublic
 from server.base_models.racer import RacerCreate, RacerBase, RacerUpdate
+from server.responses import ModelJSONResponse
 
 router = APIRouter(prefix="/racers", tags=["Racer"])
 
@@ -31,8 +32,8 @@ async def update_racer(
 
 @router.get("/all", response_model=list[RacerBase])
 async def get_racers():
-    racers = Racer.objects().all()
-    return [RacerBase.from_mongo(racer) for racer in racers]
+    racers = Racer.objects.only(*RacerBase.mongo_fields()).as_pymongo()
+    return ModelJSONResponse([RacerBase.from_raw(racer) for racer in racers])
 
 
 @router.get("/{racer_id}", response_model=RacerBase)
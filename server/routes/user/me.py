@@ -6,10 +6,12 @@ from pydantic import BaseModel
 from core.controllers.racer_controller import RacerController
 from core.models.racer import Racer
 from core.models.spectator_ticket import SpectatorTicket
+from server.base_models.auth import AuthContext
 from server.base_models.racer import RacerBase
 from server.base_models.registration import EventRegistrationClientBase
 from server.base_models.tickets import SpectatorTicketBase
-from utils.dependencies import get_current_racer
+from server.responses import ModelJSONResponse
+from utils.dependencies import get_current_racer, get_auth_context
 
 router = APIRouter(prefix="/me", tags=["User"])
 
@@ -79,9 +81,9 @@ async def add_pwc(
 
 @router.get("/tickets", response_model=list[SpectatorTicketBase])
 async def get_my_tickets(
-    racer: Racer = Depends(get_current_racer),
+    auth: AuthContext = Depends(get_auth_context),
 ):
-    tickets = SpectatorTicket.objects(racer=racer)
+    tickets = SpectatorTicket.objects(racer=auth.racer_id)
     return [SpectatorTicketBase.from_mongo(t) for t in tickets]
 
 
@@ -92,6 +94,6 @@ async def get_my_registrations(
     from core.controllers.registration_controller import EventRegistrationController
 
     controller = EventRegistrationController(racer=racer)
-    registrations = await controller.get_registrations_for_racer()
+    registrations = await controller.get_raw_registrations_for_racer()
 
-    return [EventRegistrationClientBase.from_mongo(r) for r in registrations]
+    return ModelJSONResponse([EventRegistrationClientBase.from_raw(r) for r in registrations])
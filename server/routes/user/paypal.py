@@ -1,18 +1,25 @@
+import logging
+
 from fastapi import APIRouter, Request, HTTPException, Depends
 from starlette import status
 
+from core.controllers.dashboard_controller import DashboardController
 from core.controllers.registration_controller import EventRegistrationController
+from core.controllers.ticket_controller import TicketController
 from core.models.event import Event
 from core.models.hydrodrags import HydroDragsConfig
 from core.models.paypal import PayPalCheckout
 from core.models.pwc import PWC
 from core.models.racer import Racer
-from core.models.spectator_ticket import SpectatorTicket
 from server.base_models.paypal import CheckoutCreateRequest, CheckoutCaptureRequest, SpectatorCheckoutCreateRequest
-from utils.dependencies import get_current_racer, settings
+from core.config.settings import Settings, get_settings
+from utils.dependencies import get_current_racer
 from utils.email_service import EmailService
+from utils.log import get_logger, log
 from utils.paypal_service import PayPalService
 
+logger = get_logger("paypal")
+
 router = APIRouter(prefix="/paypal", tags=["Payments"])
 
 
@@ -22,18 +29,17 @@ async def paypal_webhook(request: Request):
     body = await request.body()
 
     if not body:
-        print("📩 PayPal Webhook received with EMPTY body")
+        log(logger, logging.INFO, "paypal webhook empty body")
         return {"status": "ok"}
 
     try:
         payload = await request.json()
     except Exception:
-        print("⚠️ PayPal Webhook received NON-JSON payload")
-        print(body.decode(errors="ignore"))
+        log(logger, logging.WARNING, "paypal webhook non-json payload", body=body.decode(errors="ignore"))
         return {"status": "ok"}
 
-    print("📩 PayPal Webhook received:")
-    print(payload)
+    log(logger, logging.INFO, "paypal webhook", event_type=payload.get("event_type"), resource_id=(payload.get("resource") or {}).get("id"))
+    log(logger, logging.DEBUG, "paypal webhook payload", payload=payload)
 
     # TODO: verify signature + process event later
 
@@ -45,6 +51,7 @@ async def create_checkout(
     event_id: str,
     payload: CheckoutCreateRequest,
     racer: Racer = Depends(get_current_racer),
+    settings: Settings = Depends(get_settings),
 ):
     event = Event.objects(id=event_id).first()
     if not event:
@@ -81,6 +88,8 @@ async def create_checkout(
             spectator_single_day_passes=payload.spectator_single_day_passes,
             spectator_weekend_passes=payload.spectator_weekend_passes,
             purchase_ihra_membership=payload.purchase_ihra_membership,
+            spectator_amount=result["spectator_amount"],
+            membership_amount=result["membership_amount"],
         ).save()
 
     return result
@@ -110,6 +119,7 @@ async def capture_checkout(
 @router.post("/spectator-checkout/create")
 async def create_spectator_checkout(
     payload: SpectatorCheckoutCreateRequest,
+    settings: Settings = Depends(get_settings),
 ):
     config = HydroDragsConfig.get()
 
@@ -153,6 +163,7 @@ async def create_spectator_checkout(
         billing_zip=payload.purchaser_zip,
         spectator_single_day_passes=payload.spectator_single_day_passes,
         spectator_weekend_passes=payload.spectator_weekend_passes,
+        spectator_amount=total,
         is_captured=False,
     )
     checkout.save()
@@ -167,6 +178,7 @@ async def create_spectator_checkout(
 @router.post("/spectator-checkout/capture")
 async def capture_spectator_checkout(
     payload: CheckoutCaptureRequest,
+    settings: Settings = Depends(get_settings),
 ):
     paypal = PayPalService()
     await paypal.capture_order(order_id=payload.paypal_order_id)
@@ -184,27 +196,25 @@ async def capture_spectator_checkout(
     checkout.is_captured = True
     checkout.save()
 
-    tickets = []
-
-    for _ in range(checkout.spectator_single_day_passes):
-        tickets.append(
-            SpectatorTicket(
-                purchaser_name=checkout.purchaser_name,
-                purchaser_phone=checkout.purchaser_phone,
-                ticket_type="single_day",
-                payment=checkout,
-            ).save()
-        )
-
-    for _ in range(checkout.spectator_weekend_passes):
-        tickets.append(
-            SpectatorTicket(
-                purchaser_name=checkout.purchaser_name,
-                purchaser_phone=checkout.purchaser_phone,
-                ticket_type="weekend",
-                payment=checkout,
-            ).save()
-        )
+    config = HydroDragsConfig.get()
+    amount = (
+        checkout.spectator_amount
+        if checkout.spectator_amount is not None
+        else checkout.spectator_single_day_passes * float(config.spectator_single_day_price)
+        + checkout.spectator_weekend_passes * float(config.spectator_weekend_price)
+    )
+    DashboardController.record_payment(spectator_revenue=amount)
+
+    tickets = TicketController.issue_tickets(
+        event=None,
+        quantities={
+            "single_day": checkout.spectator_single_day_passes or 0,
+            "weekend": checkout.spectator_weekend_passes or 0,
+        },
+        purchaser_name=checkout.purchaser_name,
+        purchaser_phone=checkout.purchaser_phone,
+        payment=checkout,
+    )
 
     # 🔥 SEND EMAIL
     email = EmailService(settings)
@@ -212,12 +222,7 @@ async def capture_spectator_checkout(
         to_email=checkout.purchaser_email,
         purchaser_name=checkout.purchaser_name,
         paypal_order_id=checkout.paypal_order_id,
-        amount=(
-            checkout.spectator_single_day_passes
-            * float(HydroDragsConfig.get().spectator_single_day_price)
-            + checkout.spectator_weekend_passes
-            * float(HydroDragsConfig.get().spectator_weekend_price)
-        ),
+        amount=amount,
         tickets=[
             {
                 "ticket_code": t.ticket_code,
@@ -1,26 +1,152 @@
-import asyncio
+import json
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from core.controllers.score_broadcaster import ws_manager
+from core.controllers.score_broadcaster import MESSAGE_TYPES, ScoreBroadcaster, ws_manager
+from server.ws_manager import ALL_TOPICS, Topic
 
 router = APIRouter(prefix="/ws", tags=["WebSockets"])
 
+MAX_TOPICS_PER_SOCKET = 32
+
+
+def _split(value: str | None) -> list[str | None]:
+    items = [v.strip() for v in (value or "").split(",") if v.strip()]
+    return items or [None]
+
+
+def _topics(classes: str | None, types: str | None) -> list[Topic]:
+    topics = [(c, t) for c in _split(classes) for t in _split(types)]
+
+    for _, message_type in topics:
+        if message_type is not None and message_type not in MESSAGE_TYPES:
+            raise ValueError(f"Unknown message type: {message_type}")
+
+    if len(topics) > MAX_TOPICS_PER_SOCKET:
+        raise ValueError(f"At most {MAX_TOPICS_PER_SOCKET} topics per connection")
+
+    return topics
 
 
 @router.websocket("/events/{event_id}")
-async def event_ws(websocket: WebSocket, event_id: str):
+async def event_ws(
+    websocket: WebSocket,
+    event_id: str,
+    binary: bool = False,
+    classes: str | None = None,
+    types: str | None = None,
+    since: int | None = None,
+):
+    """
+    Live updates for an event.
+
+    By default a socket gets every message for the event. Narrow it with
+    `?classes=pro_stock,pro_spec` and/or `?types=brackets_update` on connect,
+    or at any time by sending
+    `{"action": "subscribe" | "unsubscribe", "class_key": ..., "type": ...}`
+    (either key may be omitted as a wildcard). Each such message is answered
+    with the socket's current subscriptions, and a subscribe also with
+    snapshots for the topics it added.
+
+    Right after connecting the socket is sent a snapshot of the current
+    brackets and speed sessions (`"snapshot": true`). Every message carries
+    a `seq`; reconnect with `?since=<last seq>` to get only the messages
+    missed in between, or fresh snapshots if that is too far back.
+
+    Pass `?binary=true` to receive JSON as binary frames (UTF-8 bytes)
+    instead of text frames.
+
+    The server sends `{"type": "ping"}` periodically; answer with
+    `{"action": "pong"}`. Any frame from the client counts as a sign of
+    life, and with an idle timeout configured silent sockets are closed
+    (1001). A client may also send `{"action": "ping"}` to get a pong.
+    Over the connection caps the socket is closed with 1013; retry later.
+    """
     channel = f"event:{event_id}"
 
-    print(f"🔌 WS CONNECT REQUEST | channel={channel}")
-    await ws_manager.connect(channel, websocket)
+    try:
+        topics = _topics(classes, types)
+    except ValueError as e:
+        # Closing before accept() is an HTTP 403; accept so the client sees 1008 and why
+        await websocket.accept()
+        await websocket.close(code=1008, reason=str(e))
+        return
+
+    if not await ws_manager.connect(channel, websocket, binary=binary, topics=topics):
+        return
 
     try:
+        missed = ws_manager.replay(channel, since, topics) if since is not None else None
+        if missed is None:
+            missed = await ScoreBroadcaster.snapshot(event_id=event_id, topics=topics)
+
+        for encoded in missed:
+            await ws_manager.send_encoded(channel, websocket, encoded)
+
         while True:
-            await websocket.receive()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            ws_manager.touch(websocket)
+            raw = message.get("text") or message.get("bytes")
+            if raw:
+                await _handle_client_message(channel, websocket, event_id, raw)
     except (WebSocketDisconnect, RuntimeError):
         # RuntimeError happens after disconnect frame
         pass
     finally:
         ws_manager.disconnect(channel, websocket)
-        print(f"❌ WS DISCONNECT | channel={channel}")
\ No newline at end of file
+
+
+async def _handle_client_message(channel: str, websocket: WebSocket, event_id: str, raw: str | bytes) -> None:
+    try:
+        data = json.loads(raw)
+        action = data.get("action")
+        if action == "pong":
+            return
+        if action == "ping":
+            await ws_manager.send(channel, websocket, {"type": "pong"})
+            return
+        if action not in ("subscribe", "unsubscribe"):
+            raise ValueError("action must be 'subscribe', 'unsubscribe', 'ping' or 'pong'")
+
+        topics = _topics(data.get("class_key"), data.get("type"))
+    except (ValueError, AttributeError) as e:
+        await ws_manager.send(channel, websocket, {"type": "error", "detail": str(e)})
+        return
+
+    if action == "subscribe":
+        current = ws_manager.subscriptions(websocket)
+        if len(current | set(topics)) > MAX_TOPICS_PER_SOCKET:
+            await ws_manager.send(channel, websocket, {
+                "type": "error",
+                "detail": f"At most {MAX_TOPICS_PER_SOCKET} topics per connection",
+            })
+            return
+
+        # Already receiving everything, so the client has state for any topic
+        added = [] if ALL_TOPICS in current else [t for t in topics if t not in current]
+
+        # Narrowing from the default firehose: drop the catch-all
+        if current == {ALL_TOPICS} and ALL_TOPICS not in topics:
+            ws_manager.unsubscribe(channel, websocket, [ALL_TOPICS])
+        ws_manager.subscribe(channel, websocket, topics)
+    else:
+        ws_manager.unsubscribe(channel, websocket, topics)
+        added = []
+
+    await ws_manager.send(channel, websocket, {
+        "type": "subscriptions",
+        "topics": [
+            {"class_key": class_key, "type": message_type}
+            for class_key, message_type in sorted(
+                ws_manager.subscriptions(websocket),
+                key=lambda t: (t[0] or "", t[1] or ""),
+            )
+        ],
+    })
+
+    if added:
+        for encoded in await ScoreBroadcaster.snapshot(event_id=event_id, topics=added):
+            await ws_manager.send_encoded(channel, websocket, encoded)
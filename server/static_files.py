@@ -0,0 +1,29 @@
+# server/static_files.py
+from pathlib import PurePath
+
+from fastapi.staticfiles import StaticFiles
+
+
+class PublicStaticFiles(StaticFiles):
+    """
+    StaticFiles that never serves hidden (dot) files or directories. Uploads
+    are staged in those until complete, so partial files stay private.
+    """
+
+    def lookup_path(self, path: str):
+        if any(part.startswith(".") for part in PurePath(path).parts):
+            return "", None
+        return super().lookup_path(path)
+
+
+class ImmutableStaticFiles(PublicStaticFiles):
+    """
+    StaticFiles for content-addressed assets: a URL never changes content,
+    so clients and CDNs may cache responses for a year without revalidating.
+    """
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+        return response
@@ -1,56 +1,417 @@
-import json
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import suppress
 
 from fastapi import WebSocket
-from typing import Dict, Set
+from typing import Deque, Dict, Iterable, List, Set, Tuple
 
-from fastapi.encoders import jsonable_encoder
+from server.responses import dumps, extend_object
+from utils.log import Sampler, get_logger, log
+from utils.metrics import (
+    WS_BROADCAST_DURATION,
+    WS_CONNECTIONS,
+    WS_CONNECTIONS_REAPED,
+    WS_CONNECTIONS_REJECTED,
+    WS_MESSAGES_DROPPED,
+    WS_MESSAGES_SENT,
+)
+
+
+logger = get_logger("ws")
+
+# Connect/disconnect storms at race start; exact counts live in metrics
+_connection_sample = Sampler(every=20)
+
+# (class_key, message type); None matches anything
+Topic = Tuple[str | None, str | None]
+
+ALL_TOPICS: Topic = (None, None)
+
+PING = dumps({"type": "ping"})
+PING_TEXT = PING.decode()
+
+# Close codes
+GOING_AWAY = 1001
+TRY_AGAIN_LATER = 1013
 
 
 class WebSocketManager:
     """
     Manages websocket connections grouped by channel (event_id).
+
+    Within a channel each socket subscribes to topics, (class_key, type)
+    pairs where None is a wildcard, and sockets are indexed per topic so a
+    broadcast only touches the sockets that asked for it.
+
+    Each broadcast is encoded once and the same bytes go to every subscriber:
+    as binary frames to clients that asked for them, otherwise as one shared
+    text frame.
+
+    Broadcasts are stamped with a per-channel `seq` and kept in a short
+    replay buffer, so a client that reconnects with its last seen seq can be
+    sent just what it missed. Sequences start at the wall clock in ms, so a
+    seq from before a restart is always older than the buffer and falls back
+    to a snapshot instead of being mistaken for a recent one.
+
+    Connections are capped globally and optionally per client IP, the address
+    uvicorn resolves through trusted proxies. Many spectators can share one
+    address (venue wifi NAT), so the per-IP cap is off unless configured.
+    Over a cap a socket is accepted and immediately closed with 1013 (try
+    again later) so the client sees a reason rather than a failed handshake.
+    `heartbeat()` pings every socket periodically, reaps the ones a send
+    can't reach within `send_timeout` and, if `idle_timeout` is set, the
+    ones that haven't sent anything (e.g. a pong) for that long.
     """
+    REPLAY_SIZE = 64
+    REPLAY_TTL_SECONDS = 120
+
+    max_connections = 10_000
+    max_connections_per_ip = 0  # disabled
+    heartbeat_interval = 20.0
+    idle_timeout = 0.0
+    send_timeout = 5.0
 
     def __init__(self):
-        self._connections: Dict[str, Set[WebSocket]] = {}
+        # channel -> {websocket: wants binary frames}
+        self._connections: Dict[str, Dict[WebSocket, bool]] = {}
+        # channel -> topic -> sockets
+        self._topics: Dict[str, Dict[Topic, Set[WebSocket]]] = {}
+        # websocket -> its topics
+        self._subscriptions: Dict[WebSocket, Set[Topic]] = {}
+        # channel -> last seq / recent (seq, sent_at, class_key, type, message)
+        self._seq: Dict[str, int] = {}
+        self._replay: Dict[str, Deque[tuple]] = {}
+        # websocket -> client IP / last time it sent us anything
+        self._peers: Dict[WebSocket, str] = {}
+        self._per_ip: Dict[str, int] = {}
+        self._last_seen: Dict[WebSocket, float] = {}
 
-    async def connect(self, channel: str, websocket: WebSocket):
+    def configure(
+        self,
+        *,
+        max_connections: int,
+        max_connections_per_ip: int,
+        heartbeat_interval: float,
+        idle_timeout: float,
+        send_timeout: float,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_connections_per_ip = max_connections_per_ip
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.send_timeout = send_timeout
+
+    async def connect(
+        self,
+        channel: str,
+        websocket: WebSocket,
+        *,
+        binary: bool = False,
+        topics: Iterable[Topic] = (ALL_TOPICS,),
+    ) -> bool:
+        """
+        Accept and register a socket. Returns False if it was turned away
+        because a connection cap was reached; it is already closed then.
+        """
         await websocket.accept()
-        self._connections.setdefault(channel, set()).add(websocket)
 
-        print(
-            f"🔌 WS CONNECT | channel={channel} | "
-            f"connections={len(self._connections[channel])}"
-        )
+        ip = websocket.client.host if websocket.client else "unknown"
+        if len(self._peers) >= self.max_connections:
+            await self._reject(websocket, "server_full", "Server is at capacity")
+            return False
+        if self.max_connections_per_ip and self._per_ip.get(ip, 0) >= self.max_connections_per_ip:
+            await self._reject(websocket, "ip_limit", "Too many connections from this address")
+            return False
+
+        self._peers[websocket] = ip
+        self._per_ip[ip] = self._per_ip.get(ip, 0) + 1
+        self._last_seen[websocket] = time.monotonic()
+
+        self._connections.setdefault(channel, {})[websocket] = binary
+        self._subscriptions[websocket] = set()
+        self.subscribe(channel, websocket, topics)
+        WS_CONNECTIONS.set(len(self._connections[channel]), channel=channel)
+
+        if _connection_sample():
+            log(logger, logging.INFO, "ws connect", channel=channel, connections=len(self._connections[channel]), sampled=_connection_sample.every)
+
+        return True
 
     def disconnect(self, channel: str, websocket: WebSocket):
-        if channel in self._connections:
-            self._connections[channel].discard(websocket)
+        # Safe to call twice, e.g. by the reaper and then by the route
+        if websocket in self._connections.get(channel, {}):
+            ip = self._peers.pop(websocket, None)
+            if ip is not None:
+                self._per_ip[ip] -= 1
+                if not self._per_ip[ip]:
+                    del self._per_ip[ip]
+            self._last_seen.pop(websocket, None)
+
+            self.unsubscribe(channel, websocket, list(self._subscriptions.get(websocket, ())))
+            self._subscriptions.pop(websocket, None)
+
+            self._connections[channel].pop(websocket, None)
+            WS_CONNECTIONS.set(len(self._connections[channel]), channel=channel)
 
-            print(
-                f"❌ WS DISCONNECT | channel={channel} | "
-                f"connections={len(self._connections[channel])}"
-            )
+            if _connection_sample():
+                log(logger, logging.INFO, "ws disconnect", channel=channel, connections=len(self._connections[channel]), sampled=_connection_sample.every)
 
             if not self._connections[channel]:
                 del self._connections[channel]
-                print(f"🧹 WS CHANNEL EMPTY | channel={channel}")
+                self._topics.pop(channel, None)
+                WS_CONNECTIONS.remove(channel=channel)
+                log(logger, logging.DEBUG, "ws channel empty", channel=channel)
+
+    def subscribe(self, channel: str, websocket: WebSocket, topics: Iterable[Topic]) -> None:
+        index = self._topics.setdefault(channel, {})
+
+        for topic in topics:
+            index.setdefault(topic, set()).add(websocket)
+            self._subscriptions[websocket].add(topic)
+
+    def unsubscribe(self, channel: str, websocket: WebSocket, topics: Iterable[Topic]) -> None:
+        index = self._topics.get(channel, {})
+
+        for topic in topics:
+            sockets = index.get(topic)
+            if sockets is not None:
+                sockets.discard(websocket)
+                if not sockets:
+                    del index[topic]
+            self._subscriptions.get(websocket, set()).discard(topic)
+
+    def subscriptions(self, websocket: WebSocket) -> Set[Topic]:
+        return set(self._subscriptions.get(websocket, ()))
+
+    def touch(self, websocket: WebSocket) -> None:
+        """
+        Note that the client is alive; call on every frame it sends.
+        """
+        if websocket in self._last_seen:
+            self._last_seen[websocket] = time.monotonic()
+
+    def seq(self, channel: str) -> int:
+        """
+        Latest seq sent on `channel`; what a snapshot built now is current as of.
+
+        Only broadcasts store a seq. Before the first one this is the wall
+        clock, so any channel id a client asks about costs no memory.
+        """
+        seq = self._seq.get(channel)
+        return seq if seq is not None else int(time.time() * 1000)
+
+    def replay(self, channel: str, since: int, topics: Iterable[Topic]) -> List[bytes] | None:
+        """
+        Messages after `since` matching `topics`, oldest first, or None if the
+        buffer no longer reaches back that far and a snapshot is needed.
+        """
+        current = self.seq(channel)
+        if since == current:
+            return []
+        if since > current:
+            return None
+
+        buffer = self._replay.get(channel)
+        if not buffer:
+            return None
+
+        self._expire(buffer)
+        if not buffer or buffer[0][0] > since + 1:
+            return None
 
-    async def broadcast(self, channel: str, payload: dict):
-        if channel not in self._connections:
+        topics = list(topics)
+        return [
+            message
+            for seq, _, class_key, message_type, message in buffer
+            if seq > since and _matches(topics, class_key, message_type)
+        ]
+
+    async def send(self, channel: str, websocket: WebSocket, payload: dict) -> None:
+        """
+        Direct reply to one socket, in the frame type it asked for.
+        """
+        await self.send_encoded(channel, websocket, dumps(payload))
+
+    async def send_encoded(self, channel: str, websocket: WebSocket, message: bytes) -> None:
+        if self._connections.get(channel, {}).get(websocket):
+            await websocket.send_bytes(message)
+        else:
+            await websocket.send_text(message.decode())
+
+    async def broadcast(
+        self,
+        channel: str,
+        payload: dict,
+        *,
+        class_key: str | None = None,
+        type: str | None = None,
+    ):
+        await self.broadcast_encoded(channel, dumps(payload), class_key=class_key, type=type)
+
+    async def broadcast_encoded(
+        self,
+        channel: str,
+        message: bytes,
+        *,
+        class_key: str | None = None,
+        type: str | None = None,
+    ):
+        """
+        Send an already-encoded JSON message to every socket subscribed to a
+        topic matching (class_key, type). None on the message side matches
+        every subscription, e.g. an all-classes brackets update.
+        """
+        # Recorded even with nobody connected: that is exactly when clients
+        # are about to reconnect and resume.
+        seq = self._seq[channel] = self.seq(channel) + 1
+        message = extend_object(message, {"seq": seq})
+
+        buffer = self._replay.setdefault(channel, deque(maxlen=self.REPLAY_SIZE))
+        buffer.append((seq, time.monotonic(), class_key, type, message))
+
+        subscribers = self._connections.get(channel)
+        if not subscribers:
+            return
+
+        recipients = self._recipients(channel, class_key, type)
+        if not recipients:
             return
 
-        # ✅ Convert datetimes + Pydantic models safely
-        encoded = jsonable_encoder(payload)
-        message = json.dumps(encoded)
+        text = None
+        frames = []
+        for ws in recipients:
+            if subscribers[ws]:
+                frames.append((ws, message))
+            else:
+                if text is None:
+                    text = message.decode()
+                frames.append((ws, text))
 
-        dead = set()
+        started = time.perf_counter()
+        dead = await self._send_all(frames)
+        WS_BROADCAST_DURATION.observe(time.perf_counter() - started)
 
-        for ws in self._connections[channel]:
+        WS_MESSAGES_SENT.inc(len(frames) - len(dead))
+        if dead:
+            WS_MESSAGES_DROPPED.inc(len(dead))
+            await self._reap_all([(channel, ws) for ws in dead], "send_failed")
+
+    async def heartbeat(self) -> None:
+        """
+        Runs for the app's lifetime: sweep every `heartbeat_interval`.
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
             try:
-                await ws.send_text(message)
+                await self.sweep()
             except Exception:
-                dead.add(ws)
+                logger.exception("ws heartbeat failed")
+
+    async def sweep(self) -> None:
+        """
+        Reap idle sockets, ping the rest, and drop replay state for channels
+        nobody has been on for longer than the replay TTL.
+        """
+        now = time.monotonic()
+        idle = []
+        pings = []
+        channels = {}
+
+        for channel, subscribers in self._connections.items():
+            for ws, binary in subscribers.items():
+                if self.idle_timeout and now - self._last_seen.get(ws, now) > self.idle_timeout:
+                    idle.append((channel, ws))
+                else:
+                    pings.append((ws, PING if binary else PING_TEXT))
+                    channels[ws] = channel
+
+        await self._reap_all(idle, "idle")
+        dead = await self._send_all(pings)
+        await self._reap_all([(channels[ws], ws) for ws in dead], "send_failed")
+        reaped = len(idle) + len(dead)
+
+        for channel in [c for c in self._replay if c not in self._connections]:
+            buffer = self._replay[channel]
+            self._expire(buffer)
+            if not buffer:
+                del self._replay[channel]
+
+        for channel in [c for c in self._seq if c not in self._replay and c not in self._connections]:
+            del self._seq[channel]
+
+        if reaped:
+            log(logger, logging.INFO, "ws reaped", reaped=reaped, connections=len(self._peers))
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    async def _reject(self, websocket: WebSocket, reason: str, detail: str) -> None:
+        WS_CONNECTIONS_REJECTED.inc(reason=reason)
+        if _connection_sample():
+            log(logger, logging.WARNING, "ws rejected", reason=reason, connections=len(self._peers), sampled=_connection_sample.every)
+        await websocket.close(code=TRY_AGAIN_LATER, reason=detail)
+
+    async def _send_all(self, frames: List[Tuple[WebSocket, bytes | str]]) -> List[WebSocket]:
+        """
+        Send every (socket, frame) pair concurrently, each within
+        `send_timeout`, so stalled peers cost one timeout in total rather
+        than one each. Returns the sockets whose send failed.
+        """
+        sent = await asyncio.gather(*(self._send_timed(ws, frame) for ws, frame in frames))
+        return [ws for (ws, _), ok in zip(frames, sent) if not ok]
+
+    async def _send_timed(self, websocket: WebSocket, frame: bytes | str) -> bool:
+        try:
+            async with asyncio.timeout(self.send_timeout):
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+            return True
+        except Exception:
+            return False
+
+    async def _reap_all(self, sockets: List[Tuple[str, WebSocket]], reason: str) -> None:
+        await asyncio.gather(*(self._reap(channel, ws, reason) for channel, ws in sockets))
+
+    async def _reap(self, channel: str, websocket: WebSocket, reason: str) -> None:
+        if websocket not in self._connections.get(channel, {}):
+            return
+
+        self.disconnect(channel, websocket)
+        WS_CONNECTIONS_REAPED.inc(reason=reason)
+
+        # Ends the route's receive loop; fails harmlessly if the peer is gone
+        with suppress(Exception):
+            async with asyncio.timeout(self.send_timeout):
+                await websocket.close(code=GOING_AWAY)
+
+    def _expire(self, buffer: Deque[tuple]) -> None:
+        cutoff = time.monotonic() - self.REPLAY_TTL_SECONDS
+        while buffer and buffer[0][1] < cutoff:
+            buffer.popleft()
+
+    def _recipients(self, channel: str, class_key: str | None, type: str | None) -> Set[WebSocket]:
+        index = self._topics.get(channel, {})
+
+        if class_key is not None and type is not None:
+            # Common case: four direct lookups
+            topics = [(class_key, type), (class_key, None), (None, type), ALL_TOPICS]
+        else:
+            topics = [topic for topic in index if _matches([topic], class_key, type)]
+
+        recipients: Set[WebSocket] = set()
+        for topic in topics:
+            recipients |= index.get(topic, set())
+        return recipients
+
 
-        for ws in dead:
-            self.disconnect(channel, ws)
\ No newline at end of file
+def _matches(topics: Iterable[Topic], class_key: str | None, type: str | None) -> bool:
+    return any(
+        (class_key is None or topic_class in (None, class_key))
+        and (type is None or topic_type in (None, type))
+        for topic_class, topic_type in topics
+    )
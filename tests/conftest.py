@@ -0,0 +1,5 @@
+# tests/conftest.py
+from benchmarks import ensure_env
+
+# Settings() needs these before any app module is imported
+ensure_env()
@@ -0,0 +1,37 @@
+# tests/test_cache.py
+"""
+A value loaded before an invalidation of its key must not be cached after it.
+"""
+from utils.cache import TTLCache
+
+
+def test_set_skipped_after_racing_invalidate():
+    cache = TTLCache(maxsize=4, ttl_seconds=60)
+
+    generation = cache.generation()
+    cache.invalidate("racer")  # a save lands while the old value is loading
+    cache.set("racer", "stale", generation=generation)
+
+    assert cache.get("racer") is None
+
+
+def test_set_kept_when_other_keys_invalidated():
+    cache = TTLCache(maxsize=4, ttl_seconds=60)
+
+    cache.invalidate("racer")
+    generation = cache.generation()
+    cache.invalidate("other")
+    cache.set("racer", "fresh", generation=generation)
+
+    assert cache.get("racer") == "fresh"
+
+
+def test_set_skipped_once_invalidation_is_forgotten():
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+
+    generation = cache.generation()
+    for key in ("racer", "a", "b"):  # "racer" falls out of the tracked keys
+        cache.invalidate(key)
+    cache.set("racer", "stale", generation=generation)
+
+    assert cache.get("racer") is None
@@ -0,0 +1,67 @@
+# tests/test_read_models.py
+"""
+Raw rows from older documents lack fields added since; from_raw must fill
+them with the Document defaults, as loading through MongoEngine does.
+"""
+from datetime import datetime
+
+from bson import ObjectId
+
+from server.base_models.event import EventBase
+from server.base_models.paypal import PayPalCheckoutRead
+from server.base_models.tickets import SpectatorTicketBase
+
+
+def test_ticket_missing_defaults():
+    ticket = SpectatorTicketBase.from_raw({
+        "_id": ObjectId(),
+        "purchaser_name": "Pat Doe",
+        "purchaser_phone": "612-555-0100",
+        "ticket_type": "weekend",
+    })
+
+    assert ticket.is_used is False
+    assert ticket.used_at is None
+    assert isinstance(ticket.created_at, datetime)
+    assert ticket.ticket_code
+
+
+def test_checkout_missing_defaults():
+    checkout = PayPalCheckoutRead.from_raw({
+        "_id": ObjectId(),
+        "paypal_order_id": "ORDER-1",
+        "event": ObjectId(),
+    })
+
+    assert checkout.is_captured is False
+    assert checkout.event is None
+    assert checkout.created_at is not None
+
+
+def test_event_missing_defaults():
+    event = EventBase.from_raw({
+        "_id": ObjectId(),
+        "name": "Summer Series",
+        "start_date": datetime(2026, 6, 1),
+    })
+
+    assert event.is_published is False
+    assert isinstance(event.created_at, datetime)
+    assert isinstance(event.updated_at, datetime)
+
+
+def test_stored_values_win_over_defaults():
+    ticket = SpectatorTicketBase.from_raw({
+        "_id": ObjectId(),
+        "purchaser_name": "Pat Doe",
+        "purchaser_phone": "612-555-0100",
+        "ticket_code": "abc123",
+        "ticket_type": "single_day",
+        "is_used": True,
+        "used_at": datetime(2026, 6, 1),
+        "created_at": datetime(2026, 5, 1),
+    })
+
+    assert ticket.is_used is True
+    assert ticket.ticket_code == "abc123"
+    assert ticket.created_at == datetime(2026, 5, 1)
@@ -0,0 +1,81 @@
+# utils/asset_store.py
+import asyncio
+import os
+from pathlib import Path
+from uuid import uuid4
+
+from fastapi import UploadFile
+from mongoengine import NotUniqueError
+
+from core.models.asset import Asset
+from utils.image_service import ImageService
+from utils.upload_service import UploadService
+
+
+class AssetStore:
+    """
+    Content-addressed storage for public uploads.
+
+    Files are named by their SHA-256, so a URL always refers to the same bytes
+    and can be cached forever. Identical uploads resolve to the existing Asset.
+    """
+    BASE_DIR = Path("assets/cas")
+    # Outside BASE_DIR's mount but under assets/, so the final os.replace
+    # stays on one filesystem; hidden, so the /assets mount won't serve it
+    INCOMING_DIR = Path("assets/.incoming")
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    @classmethod
+    async def store(
+        cls,
+        file: UploadFile,
+        *,
+        default_ext: str = ".jpg",
+        max_bytes: int | None = None,
+    ) -> Asset:
+        ext = UploadService.extension(file, default=default_ext)
+        incoming = cls.INCOMING_DIR / f"{uuid4().hex}{ext}"
+
+        _, digest = await UploadService.save_hashed(
+            file=file,
+            destination=incoming,
+            max_bytes=max_bytes,
+        )
+
+        try:
+            existing = Asset.objects(sha256=digest).first()
+            if existing and Path(existing.path).exists():
+                return existing
+
+            final = cls.BASE_DIR / digest[:2] / f"{digest}{ext}"
+            size = await asyncio.to_thread(cls._move, incoming, final)
+
+            asset = existing or Asset(sha256=digest)
+            asset.path = final.as_posix()
+            asset.ext = ext
+            asset.content_type = file.content_type
+            asset.size_bytes = size
+            asset.variants = await ImageService.generate_derivatives(final)
+
+            try:
+                asset.save()
+            except NotUniqueError:
+                # Same bytes uploaded concurrently; the other request won
+                return Asset.objects(sha256=digest).first()
+
+            return asset
+        finally:
+            incoming.unlink(missing_ok=True)
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    @staticmethod
+    def _move(source: Path, destination: Path) -> int:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source, destination)
+        return destination.stat().st_size
@@ -0,0 +1,95 @@
+# utils/cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries also expire after `ttl_seconds`.
+
+    Sync FastAPI dependencies run in the threadpool, so every access is locked.
+
+    A value loaded while the same key is being invalidated may already be
+    stale. Take `generation()` before loading and pass it to `set()`: the set
+    is skipped if the key was invalidated in between.
+    """
+
+    def __init__(self, *, maxsize: int, ttl_seconds: float):
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Bumped by every invalidation; the latest one per key (bounded like
+        # the data) and the newest one no longer tracked
+        self._generation = 0
+        self._invalidated: OrderedDict[Hashable, int] = OrderedDict()
+        self._forgotten = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def set(self, key: Hashable, value: Any, *, generation: int | None = None) -> None:
+        with self._lock:
+            if generation is not None and max(self._invalidated.get(key, 0), self._forgotten) > generation:
+                return
+
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+            self._generation += 1
+            self._invalidated[key] = self._generation
+            self._invalidated.move_to_end(key)
+
+            while len(self._invalidated) > self._maxsize:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+            self._generation += 1
+            self._invalidated.clear()
+            self._forgotten = self._generation
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Stored fields of authenticated racers keyed by id; get_current_racer builds
+# a fresh Racer from them per request. Short TTL bounds staleness from writes
+# that bypass RacerController (admin tools, other processes).
+racer_cache = TTLCache(maxsize=1024, ttl_seconds=30)
+
+# Per-event analytics keyed by event id. Long enough to absorb dashboard
+# auto-refresh, short enough to feel live during an event.
+analytics_cache = TTLCache(maxsize=64, ttl_seconds=15)
+
+# Encoded bracket JSON keyed by (event id, class key or None for all classes).
+# Refreshed on every bracket broadcast; the TTL only covers writes that
+# don't broadcast.
+brackets_cache = TTLCache(maxsize=256, ttl_seconds=30)
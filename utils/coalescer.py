@@ -0,0 +1,91 @@
+# utils/coalescer.py
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+from utils.log import get_logger
+
+logger = get_logger("coalescer")
+
+
+class _Pending:
+    __slots__ = ("fn", "first_at", "last_at", "task")
+
+    def __init__(self, fn, now: float):
+        self.fn = fn
+        self.first_at = now
+        self.last_at = now
+        self.task: asyncio.Task | None = None
+
+
+class Coalescer:
+    """
+    Debounces async jobs per key: a job runs once `window` seconds pass
+    without another submit for the same key, and never later than
+    `max_delay` after the first pending submit. Only the latest submitted
+    job runs, so a burst of N updates costs one rebuild.
+    """
+
+    def __init__(self, *, window: float, max_delay: float):
+        self._pending: dict[Hashable, _Pending] = {}
+        self.configure(window=window, max_delay=max_delay)
+
+    def configure(self, *, window: float, max_delay: float) -> None:
+        self.window = window
+        self.max_delay = max(window, max_delay)
+
+    def submit(self, key: Hashable, fn: Callable[[], Awaitable[None]]) -> bool:
+        """
+        Schedule `fn` for `key`, replacing any job already pending for it.
+        Returns True if it was merged into a pending job.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+
+        if pending is not None:
+            pending.fn = fn
+            pending.last_at = loop.time()
+            return True
+
+        pending = self._pending[key] = _Pending(fn, loop.time())
+        pending.task = loop.create_task(self._run(key, pending))
+        return False
+
+    async def flush(self) -> None:
+        """
+        Run every pending job now, e.g. on shutdown.
+        """
+        for key, pending in list(self._pending.items()):
+            if pending.task is not None:
+                pending.task.cancel()
+            if self._pending.get(key) is pending:
+                del self._pending[key]
+                await self._call(key, pending.fn)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    async def _run(self, key: Hashable, pending: _Pending) -> None:
+        loop = asyncio.get_running_loop()
+
+        # Each submit pushes last_at forward; max_delay caps the total wait
+        while True:
+            deadline = min(pending.last_at + self.window, pending.first_at + self.max_delay)
+            delay = deadline - loop.time()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+
+        if self._pending.get(key) is pending:
+            del self._pending[key]
+            await self._call(key, pending.fn)
+
+    @staticmethod
+    async def _call(key: Hashable, fn: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await fn()
+        except Exception:
+            logger.exception("coalesced job failed", extra={"fields": {"key": str(key)}})
@@ -1,13 +1,16 @@
+from copy import deepcopy
+
 from fastapi import Depends, HTTPException, status, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
 
-from core.config.settings import Settings
+from core.config.settings import Settings, get_settings
 from core.models.event import Event
 from core.models.racer import Racer
+from server.base_models.auth import AuthContext
+from utils.cache import racer_cache
 
 security = HTTPBearer(auto_error=False)
-settings = Settings()
 
 
 def get_event(event_id: str) -> Event:
@@ -20,9 +23,13 @@ def get_event(event_id: str) -> Event:
     return event
 
 
-def get_current_racer(
+def get_auth_context(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> Racer:
+    settings: Settings = Depends(get_settings),
+) -> AuthContext:
+    """
+    Trusts the signed token claims. Use for endpoints that only need the racer id.
+    """
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -30,7 +37,6 @@ def get_current_racer(
         )
 
     token = credentials.credentials
-    settings = Settings()
 
     try:
         payload = jwt.decode(
@@ -47,10 +53,25 @@ def get_current_racer(
     if not racer_id:
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    racer = Racer.objects(id=racer_id).first()
+    return AuthContext(racer_id=racer_id, email=payload.get("email"))
+
+
+def get_current_racer(
+    auth: AuthContext = Depends(get_auth_context),
+) -> Racer:
+    # The cache holds the stored fields, never a Document: each request gets
+    # its own Racer to mutate without other requests seeing the changes
+    raw = racer_cache.get(auth.racer_id)
+    if raw is not None:
+        return Racer._from_son(deepcopy(raw))
+
+    # A save racing this read invalidates the key; don't cache what we read
+    generation = racer_cache.generation()
+    racer = Racer.objects(id=auth.racer_id).first()
     if not racer:
         raise HTTPException(status_code=401, detail="Racer not found")
 
+    racer_cache.set(auth.racer_id, deepcopy(racer.to_mongo().to_dict()), generation=generation)
     return racer
 
 def require_completed_profile(
@@ -68,6 +89,7 @@ def require_completed_profile(
 async def require_admin_key(
     request: Request,
     x_admin_key: str | None = Header(default=None),
+    settings: Settings = Depends(get_settings),
 ):
     # Allow CORS preflight requests
     if request.method == "OPTIONS":
@@ -1,10 +1,14 @@
 # core/services/email.py
 import smtplib
 from email.message import EmailMessage
-from logging import info
+import logging
 
 from pydantic import EmailStr
 from core.config.settings import Settings
+from utils.log import get_logger, log
+from utils.metrics import track_external
+
+logger = get_logger("email")
 
 
 class EmailService:
@@ -32,10 +36,10 @@ This code will expire in 10 minutes.
 If you did not request this, you can safely ignore this email.
 """
         )
-        print(f"Sending email to {email}")
+        log(logger, logging.INFO, "sending auth code email", to=email)
 
         # SMTP is blocking — acceptable for now
-        with smtplib.SMTP(self._host, self._port) as server:
+        with track_external("smtp", "auth_code"), smtplib.SMTP(self._host, self._port) as server:
             server.starttls()
             server.login(self._username, self._password)
             server.send_message(msg)
@@ -83,7 +87,7 @@ If you have any issues, just reply to this email.
 """
         )
 
-        with smtplib.SMTP(self._host, self._port) as server:
+        with track_external("smtp", "purchase_receipt"), smtplib.SMTP(self._host, self._port) as server:
             server.starttls()
             server.login(self._username, self._password)
             server.send_message(msg)
\ No newline at end of file
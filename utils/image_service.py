@@ -0,0 +1,136 @@
+# utils/image_service.py
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from utils.log import get_logger, log
+
+logger = get_logger("images")
+
+
+def _render_derivatives(source: str, widths: tuple[int, ...], fmt: str, quality: int) -> dict[str, str]:
+    """
+    Runs in a worker process: decode once, write one resized copy per width.
+    Returns {width: path} for every file written.
+    """
+    src = Path(source)
+    written = {}
+
+    with Image.open(src) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        if fmt == "JPEG" and img.mode == "RGBA":
+            img = img.convert("RGB")
+
+        for width in widths:
+            target_w = min(width, img.width)
+            target_h = max(1, round(img.height * target_w / img.width))
+
+            resized = img.resize((target_w, target_h), Image.Resampling.LANCZOS)
+
+            out = src.with_name(f"{src.stem}_{width}.{fmt.lower()}")
+            tmp = out.with_name(f".{out.name}.part")
+            try:
+                resized.save(tmp, fmt, quality=quality, optimize=True)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+            os.replace(tmp, out)
+
+            written[str(width)] = out.as_posix()
+
+    return written
+
+
+class ImageService:
+    WIDTHS = (64, 256, 1024)
+    AVATAR_WIDTH = 64
+    CARD_WIDTH = 256
+    FORMAT = "WEBP"
+    QUALITY = 80
+    MAX_WORKERS = 2
+
+    _pool: ProcessPoolExecutor | None = None
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    @classmethod
+    async def generate_derivatives(cls, source: Path) -> dict[str, str]:
+        """
+        Resize `source` to each of WIDTHS in the process pool.
+
+        Returns {"64": "/assets/.../profile_64.webp", ...}. Files Pillow cannot
+        decode (or refuses to, like decompression bombs) yield an empty dict so
+        callers fall back to the original.
+
+        A worker that dies (e.g. out of memory) breaks the whole pool; it is
+        replaced and the image retried once before giving up on it.
+        """
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(2):
+            pool = cls._get_pool()
+            try:
+                written = await loop.run_in_executor(
+                    pool,
+                    _render_derivatives,
+                    str(source),
+                    cls.WIDTHS,
+                    cls.FORMAT,
+                    cls.QUALITY,
+                )
+                break
+            except BrokenProcessPool as e:
+                cls._reset_pool(pool)
+                if attempt:
+                    log(logger, logging.WARNING, "image derivatives skipped", source=source, error=repr(e))
+                    return {}
+            except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+                log(logger, logging.WARNING, "image derivatives skipped", source=source, error=str(e))
+                return {}
+
+        return {width: f"/{path.lstrip('/')}" for width, path in written.items()}
+
+    @staticmethod
+    def pick(variants: dict[str, str] | None, width: int, fallback: str | None = None) -> str | None:
+        """
+        Smallest derivative at least `width` wide, else the largest available,
+        else `fallback` (usually the original upload).
+        """
+        if not variants:
+            return fallback
+
+        sizes = sorted(int(w) for w in variants)
+        chosen = next((w for w in sizes if w >= width), sizes[-1])
+        return variants[str(chosen)]
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=False, cancel_futures=True)
+            cls._pool = None
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor(max_workers=cls.MAX_WORKERS)
+        return cls._pool
+
+    @classmethod
+    def _reset_pool(cls, broken: ProcessPoolExecutor) -> None:
+        # Concurrent callers may all see the same breakage; replace it once
+        if cls._pool is broken:
+            cls._pool = None
+            broken.shutdown(wait=False, cancel_futures=True)
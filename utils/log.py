@@ -0,0 +1,130 @@
+# utils/log.py
+import copy
+import itertools
+import json
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+ROOT_LOGGER = "hydrodrags"
+
+# Below DEBUG: full payload dumps, off unless explicitly asked for
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ts, level, logger, event, then any fields.
+    """
+    converter = time.gmtime
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}Z",
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "event": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class KeyValueFormatter(logging.Formatter):
+    """
+    Human-readable variant for local development.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.name} | {record.getMessage()}"
+
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " | " + " ".join(f"{k}={v}" for k, v in fields.items())
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+class _StructuredQueueHandler(QueueHandler):
+    """
+    The stock prepare() bakes the traceback into the message. Keep the
+    message and traceback apart so formatters can emit them as fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+class Sampler:
+    """
+    Lets through one call in `every`, for events too frequent to log each time.
+    """
+
+    def __init__(self, every: int):
+        self.every = max(1, every)
+        self._counter = itertools.count()  # next() is atomic under the GIL
+
+    def __call__(self) -> bool:
+        return next(self._counter) % self.every == 0
+
+
+def configure_logging(*, level: str = "INFO", json_output: bool = True) -> None:
+    """
+    Route the app's loggers through a queue so callers never block on
+    stdout; a background listener thread does the formatting and writing.
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_output else KeyValueFormatter())
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(records, handler, respect_handler_level=False)
+    _listener.start()
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.handlers = [_StructuredQueueHandler(records)]
+    root.setLevel(level.upper())
+    root.propagate = False
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the listener thread.
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def log(logger: logging.Logger, level: int, event: str, **fields) -> None:
+    """
+    Structured log call. Checks the level first so a disabled call costs
+    one comparison; guard expensive field values with isEnabledFor as well.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": fields})
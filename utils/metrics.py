@@ -0,0 +1,299 @@
+# utils/metrics.py
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds. Covers sub-millisecond Mongo commands through slow PayPal calls.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Metric:
+    """
+    Minimal Prometheus metric: one value per label combination, rendered
+    in the text exposition format.
+    """
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+        REGISTRY.register(self)
+
+    def remove(self, **labels) -> None:
+        with self._lock:
+            self._values.pop(self._key(labels), None)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(key, self._snapshot(value)) for key, value in self._values.items()]
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for key, value in items:
+            lines.extend(self._render_value(dict(zip(self.labelnames, key)), value))
+        return lines
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _snapshot(self, value):
+        return value
+
+    def _render_value(self, labels: dict, value) -> list[str]:
+        return [f"{self.name}{_labels(labels)} {_number(value)}"]
+
+
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    TYPE = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = buckets
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            # [per-bucket counts..., sum, count]
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _snapshot(self, value):
+        return list(value)
+
+    def _render_value(self, labels: dict, value) -> list[str]:
+        *counts, total, observations = value
+
+        lines = [
+            f"{self.name}_bucket{_labels({**labels, 'le': _number(bound)})} {count}"
+            for bound, count in zip(self.buckets, counts)
+        ]
+        lines.append(f"{self.name}_bucket{_labels({**labels, 'le': '+Inf'})} {observations}")
+        lines.append(f"{self.name}_sum{_labels(labels)} {_number(total)}")
+        lines.append(f"{self.name}_count{_labels(labels)} {observations}")
+        return lines
+
+
+class MetricsRegistry:
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> None:
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+
+    def escape(value: str) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return str(value)
+
+
+REGISTRY = MetricsRegistry()
+
+
+# -------------------------
+# HTTP
+# -------------------------
+
+HTTP_REQUESTS = Counter(
+    "hydrodrags_http_requests_total",
+    "HTTP requests by route template and status.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "hydrodrags_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+HTTP_IN_FLIGHT = Gauge(
+    "hydrodrags_http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+
+# -------------------------
+# WebSockets
+# -------------------------
+
+WS_CONNECTIONS = Gauge(
+    "hydrodrags_ws_connections",
+    "Open WebSocket connections per channel.",
+    ("channel",),
+)
+WS_CONNECTIONS_REJECTED = Counter(
+    "hydrodrags_ws_connections_rejected_total",
+    "WebSocket connections turned away by a connection cap.",
+    ("reason",),
+)
+WS_CONNECTIONS_REAPED = Counter(
+    "hydrodrags_ws_connections_reaped_total",
+    "WebSocket connections closed by the server as dead or idle.",
+    ("reason",),
+)
+WS_BROADCAST_DURATION = Histogram(
+    "hydrodrags_ws_broadcast_duration_seconds",
+    "Time to fan one broadcast out to every subscriber of a channel.",
+)
+WS_MESSAGES_SENT = Counter(
+    "hydrodrags_ws_messages_sent_total",
+    "WebSocket messages delivered to clients.",
+)
+WS_MESSAGES_DROPPED = Counter(
+    "hydrodrags_ws_messages_dropped_total",
+    "WebSocket messages that could not be delivered.",
+)
+WS_BROADCASTS_COALESCED = Counter(
+    "hydrodrags_ws_broadcasts_coalesced_total",
+    "Broadcast requests merged into a pending one for the same topic.",
+    ("type",),
+)
+
+# -------------------------
+# MongoDB
+# -------------------------
+
+MONGO_COMMAND_DURATION = Histogram(
+    "hydrodrags_mongo_command_duration_seconds",
+    "MongoDB command latency by command name.",
+    ("command",),
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "hydrodrags_mongo_command_failures_total",
+    "MongoDB commands that returned an error.",
+    ("command",),
+)
+
+# -------------------------
+# External services
+# -------------------------
+
+EXTERNAL_CALL_DURATION = Histogram(
+    "hydrodrags_external_call_duration_seconds",
+    "Latency of calls to external services (PayPal, SMTP).",
+    ("service", "operation"),
+)
+EXTERNAL_CALL_ERRORS = Counter(
+    "hydrodrags_external_call_errors_total",
+    "Failed calls to external services.",
+    ("service", "operation"),
+)
+
+
+@contextmanager
+def track_external(service: str, operation: str):
+    """
+    Time an external call and count it as an error if it raises.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EXTERNAL_CALL_ERRORS.inc(service=service, operation=operation)
+        raise
+    finally:
+        EXTERNAL_CALL_DURATION.observe(time.perf_counter() - started, service=service, operation=operation)
+
+
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware recording request count, latency and in-flight
+    requests. Routes are labelled by template; unmatched paths share one
+    label so scanners can't explode the series count.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method=method, route=route)
+            HTTP_REQUESTS.inc(method=method, route=route, status=status)
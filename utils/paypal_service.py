@@ -1,23 +1,26 @@
 import httpx
 
-from utils.dependencies import settings
+from core.config.settings import get_settings
+from utils.metrics import track_external
 
 
 class PayPalService:
     def __init__(self):
+        settings = get_settings()
         self.base_url = settings.paypal_base_url
         self.client_id = settings.paypal_client_id
         self.secret = settings.paypal_secret
 
     async def _get_access_token(self) -> str:
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                f"{self.base_url}/v1/oauth2/token",
-                auth=(self.client_id, self.secret),
-                data={"grant_type": "client_credentials"},
-            )
-            r.raise_for_status()
-            return r.json()["access_token"]
+        with track_external("paypal", "oauth_token"):
+            async with httpx.AsyncClient() as client:
+                r = await client.post(
+                    f"{self.base_url}/v1/oauth2/token",
+                    auth=(self.client_id, self.secret),
+                    data={"grant_type": "client_credentials"},
+                )
+                r.raise_for_status()
+                return r.json()["access_token"]
 
     async def create_order(
         self,
@@ -46,28 +49,30 @@ class PayPalService:
             },
         }
 
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                f"{self.base_url}/v2/checkout/orders",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-            r.raise_for_status()
-            return r.json()
+        with track_external("paypal", "create_order"):
+            async with httpx.AsyncClient() as client:
+                r = await client.post(
+                    f"{self.base_url}/v2/checkout/orders",
+                    headers={
+                        "Authorization": f"Bearer {token}",
+                        "Content-Type": "application/json",
+                    },
+                    json=payload,
+                )
+                r.raise_for_status()
+                return r.json()
 
     async def capture_order(self, *, order_id: str) -> dict:
         token = await self._get_access_token()
 
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                f"{self.base_url}/v2/checkout/orders/{order_id}/capture",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-            )
-            r.raise_for_status()
-            return r.json()
\ No newline at end of file
+        with track_external("paypal", "capture_order"):
+            async with httpx.AsyncClient() as client:
+                r = await client.post(
+                    f"{self.base_url}/v2/checkout/orders/{order_id}/capture",
+                    headers={
+                        "Authorization": f"Bearer {token}",
+                        "Content-Type": "application/json",
+                    },
+                )
+                r.raise_for_status()
+                return r.json()
\ No newline at end of file
@@ -1,11 +1,56 @@
 # core/services/pdf_service.py
-from io import BytesIO
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image
+from PIL import Image, ImageOps
 from fastapi import UploadFile
 
+from utils.log import get_logger, log
+from utils.upload_service import UploadService
+
+logger = get_logger("pdf")
+
+
+class PDFQueueFullError(RuntimeError):
+    pass
+
+
+def _partial_path(output: str | Path) -> Path:
+    # Hidden, so the /assets mount won't serve a PDF that is still being written
+    output = Path(output)
+    return output.with_name(f".{output.name}.part")
+
+
+def _image_file_to_pdf(source: str, output: str, max_size: tuple[int, int], dpi: int) -> tuple[int, int]:
+    """
+    Runs in a worker process. Converts an image file to a single-page PDF,
+    downscaling anything larger than a page at `dpi`. Returns the final size.
+    """
+    with Image.open(source) as img:
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGB")
+
+        # Match the page orientation to the photo
+        page = max_size if img.height >= img.width else (max_size[1], max_size[0])
+        img.thumbnail(page, Image.Resampling.LANCZOS)
+
+        tmp = _partial_path(output)
+        try:
+            img.save(tmp, "PDF", resolution=dpi, quality=85)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        size = img.size
+
+    os.replace(tmp, output)
+    return size
+
 
 class PDFService:
     BASE_DIR = Path("assets")
@@ -13,6 +58,19 @@ class PDFService:
     ALLOWED_IMAGE_TYPES = {".jpg", ".jpeg", ".png"}
     PDF_EXT = ".pdf"
 
+    MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+    # US Letter at 200 DPI: plenty for a legible signature, a fraction of a 12MP photo
+    DPI = 200
+    MAX_PAGE_PIXELS = (1700, 2200)
+
+    MAX_WORKERS = 2       # processes doing conversions
+    MAX_PENDING = 32      # running + queued conversions before we shed load
+
+    _pool: ProcessPoolExecutor | None = None
+    _semaphore: asyncio.Semaphore | None = None
+    _pending = 0
+
     # -------------------------
     # Public API
     # -------------------------
@@ -29,18 +87,22 @@ class PDFService:
         """
         Save any supported upload as a PDF and return public path.
         """
+        ext = Path(file.filename).suffix.lower()
+        if ext != cls.PDF_EXT and ext not in cls.ALLOWED_IMAGE_TYPES:
+            raise ValueError("Unsupported file type for PDF service")
+
         target_dir = cls._ensure_dir(owner_type, owner_id)
         pdf_path = target_dir / f"{name}.pdf"
 
-        ext = Path(file.filename).suffix.lower()
-        contents = await file.read()
-
         if ext == cls.PDF_EXT:
-            pdf_path.write_bytes(contents)
-        elif ext in cls.ALLOWED_IMAGE_TYPES:
-            cls._image_bytes_to_pdf(contents, pdf_path)
+            await UploadService.save(file=file, destination=pdf_path, max_bytes=cls.MAX_UPLOAD_BYTES)
         else:
-            raise ValueError("Unsupported file type for PDF service")
+            upload_path = target_dir / f".{name}.upload{ext}"
+            await UploadService.save(file=file, destination=upload_path, max_bytes=cls.MAX_UPLOAD_BYTES)
+            try:
+                await cls._image_to_pdf(upload_path, pdf_path)
+            finally:
+                upload_path.unlink(missing_ok=True)
 
         return f"/{pdf_path.as_posix()}"
 
@@ -58,6 +120,12 @@ class PDFService:
         path = cls.BASE_DIR / owner_type / owner_id / f"{name}.pdf"
         return path if path.exists() else None
 
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._pool is not None:
+            cls._pool.shutdown(wait=False, cancel_futures=True)
+            cls._pool = None
+
     # -------------------------
     # Internal helpers
     # -------------------------
@@ -68,11 +136,71 @@ class PDFService:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @staticmethod
-    def _image_bytes_to_pdf(image_bytes: bytes, output_path: Path) -> None:
+    @classmethod
+    async def _image_to_pdf(cls, source: Path, output: Path) -> None:
         """
-        Convert image bytes to a single-page PDF.
+        Convert in the process pool. At most MAX_WORKERS conversions run at
+        once; further callers wait their turn, and beyond MAX_PENDING we refuse.
+
+        A worker that dies (e.g. out of memory) breaks the whole pool; it is
+        replaced and the conversion retried once.
         """
-        with Image.open(BytesIO(image_bytes)) as img:
-            img = img.convert("RGB")
-            img.save(output_path, "PDF")
\ No newline at end of file
+        if cls._pending >= cls.MAX_PENDING:
+            raise PDFQueueFullError("Waiver conversion is busy, please retry shortly")
+
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(cls.MAX_WORKERS)
+
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        cls._pending += 1
+
+        try:
+            async with cls._semaphore:
+                started_at = time.perf_counter()
+                for attempt in range(2):
+                    pool = cls._get_pool()
+                    try:
+                        width, height = await loop.run_in_executor(
+                            pool,
+                            _image_file_to_pdf,
+                            str(source),
+                            str(output),
+                            cls.MAX_PAGE_PIXELS,
+                            cls.DPI,
+                        )
+                        break
+                    except BrokenProcessPool:
+                        cls._reset_pool(pool)
+                        if attempt:
+                            raise
+        except BaseException:
+            # A worker killed mid-write can't clean up after itself
+            _partial_path(output).unlink(missing_ok=True)
+            raise
+        finally:
+            cls._pending -= 1
+
+        finished_at = time.perf_counter()
+        log(
+            logger,
+            logging.INFO,
+            "pdf convert",
+            output=output,
+            size=f"{width}x{height}",
+            wait_ms=round((started_at - queued_at) * 1000),
+            convert_ms=round((finished_at - started_at) * 1000),
+        )
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor(max_workers=cls.MAX_WORKERS)
+        return cls._pool
+
+    @classmethod
+    def _reset_pool(cls, broken: ProcessPoolExecutor) -> None:
+        # Concurrent callers may all see the same breakage; replace it once
+        if cls._pool is broken:
+            cls._pool = None
+            broken.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,35 @@
+# utils/phone.py
+import re
+
+DEFAULT_COUNTRY_CODE = "1"  # buyers are overwhelmingly US/Canada
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_phone(raw: str | None, default_country_code: str = DEFAULT_COUNTRY_CODE) -> str | None:
+    """
+    Best-effort E.164 ("+15551234567") for lookups.
+
+    Explicit "+" or "00" prefixes keep their country code; bare 10-digit
+    numbers get `default_country_code`, and 11-digit numbers starting with it
+    are taken as already including it. Returns None if nothing plausible is left.
+    """
+    if not raw:
+        return None
+
+    raw = raw.strip()
+    digits = _NON_DIGITS.sub("", raw)
+
+    if raw.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif len(digits) == 10:
+        digits = default_country_code + digits
+    elif not (len(digits) == 10 + len(default_country_code) and digits.startswith(default_country_code)):
+        return None
+
+    if not 8 <= len(digits) <= 15:
+        return None
+
+    return f"+{digits}"
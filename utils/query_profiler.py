@@ -0,0 +1,205 @@
+# utils/query_profiler.py
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from pymongo import monitoring
+
+from utils.log import get_logger, log
+from utils.metrics import MONGO_COMMAND_DURATION, MONGO_COMMAND_FAILURES
+
+logger = get_logger("db.profiler")
+
+
+class QueryStats:
+    """
+    Mongo commands issued while handling one request.
+    """
+
+    def __init__(self):
+        self.commands = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_command: str | None = None
+        self._lock = threading.Lock()  # to_thread / threadpool work shares this
+
+    def record(self, command: str, collection: str | None, duration_ms: float) -> None:
+        with self._lock:
+            self.commands += 1
+            self.total_ms += duration_ms
+
+            if duration_ms >= self.slowest_ms:
+                self.slowest_ms = duration_ms
+                self.slowest_command = f"{command} {collection}" if collection else command
+
+    def server_timing(self) -> str:
+        value = f'db;dur={self.total_ms:.1f};desc="{self.commands} commands"'
+        if self.slowest_command:
+            value += f', db-slowest;dur={self.slowest_ms:.1f};desc="{self.slowest_command}"'
+        return value
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+class CommandProfiler(monitoring.CommandListener):
+    """
+    PyMongo command listener. Every command feeds the latency metrics; it is
+    also charged to the request in whose context it ran, if any.
+    """
+
+    def __init__(self):
+        self._collections: dict[int, str | None] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        stats = _current.get()
+        if stats is not None:
+            self._collections[event.request_id] = _target_collection(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        MONGO_COMMAND_FAILURES.inc(command=event.command_name)
+        self._finish(event)
+
+    def _finish(self, event) -> None:
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1_000_000, command=event.command_name)
+
+        collection = self._collections.pop(event.request_id, None)
+
+        stats = _current.get()
+        if stats is not None:
+            stats.record(event.command_name, collection, event.duration_micros / 1000)
+
+
+def _target_collection(event: monitoring.CommandStartedEvent) -> str | None:
+    value = event.command.get(event.command_name)
+    return value if isinstance(value, str) else None
+
+
+class QueryProfiler:
+    """
+    Request-scoped Mongo instrumentation.
+
+    `listener` is passed to the client at connect time and
+    QueryProfilerMiddleware gives each HTTP request its own QueryStats. Each
+    request is reported in a Server-Timing header, kept in a short history
+    for the debug endpoint, and logged when it crosses the warning thresholds.
+    """
+    listener = CommandProfiler()
+
+    HISTORY_SIZE = 500
+
+    warn_commands = 20
+    warn_ms = 200.0
+
+    _history: deque = deque(maxlen=HISTORY_SIZE)
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    @classmethod
+    def configure(cls, *, warn_commands: int, warn_ms: float) -> None:
+        cls.warn_commands = warn_commands
+        cls.warn_ms = warn_ms
+
+    @classmethod
+    def record(cls, scope, status: int, stats: QueryStats, request_ms: float) -> None:
+        route = scope.get("route")
+
+        entry = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": getattr(route, "path", scope["path"]),
+            "status": status,
+            "commands": stats.commands,
+            "db_ms": round(stats.total_ms, 2),
+            "slowest_ms": round(stats.slowest_ms, 2),
+            "slowest_command": stats.slowest_command,
+            "request_ms": round(request_ms, 2),
+        }
+        cls._history.append(entry)
+
+        if stats.commands > cls.warn_commands or stats.total_ms > cls.warn_ms:
+            log(logger, logging.WARNING, "db heavy request", **entry)
+
+    @classmethod
+    def recent(cls, limit: int = 50) -> list[dict]:
+        return list(cls._history)[-limit:][::-1]
+
+    @classmethod
+    def by_route(cls) -> list[dict]:
+        """
+        History grouped by route template, worst average command count first.
+        """
+        routes: dict[str, dict] = {}
+
+        for entry in list(cls._history):
+            key = f"{entry['method']} {entry['route']}"
+            route = routes.setdefault(key, {
+                "route": key,
+                "requests": 0,
+                "commands": 0,
+                "max_commands": 0,
+                "db_ms": 0.0,
+            })
+            route["requests"] += 1
+            route["commands"] += entry["commands"]
+            route["max_commands"] = max(route["max_commands"], entry["commands"])
+            route["db_ms"] += entry["db_ms"]
+
+        summary = [
+            {
+                "route": r["route"],
+                "requests": r["requests"],
+                "avg_commands": round(r["commands"] / r["requests"], 1),
+                "max_commands": r["max_commands"],
+                "avg_db_ms": round(r["db_ms"] / r["requests"], 1),
+            }
+            for r in routes.values()
+        ]
+        return sorted(summary, key=lambda r: r["avg_commands"], reverse=True)
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._history.clear()
+
+
+class QueryProfilerMiddleware:
+    """
+    Plain ASGI middleware so the stats context spans the whole request,
+    including dependencies and the threadpool work they start.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", stats.server_timing().encode("latin-1", "replace")),
+                ]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            QueryProfiler.record(scope, status, stats, (time.perf_counter() - started) * 1000)
@@ -0,0 +1,102 @@
+# utils/upload_service.py
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+class UploadService:
+    BASE_DIR = Path("assets")
+
+    CHUNK_SIZE = 1024 * 1024
+    MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    @classmethod
+    async def save(
+        cls,
+        *,
+        file: UploadFile,
+        destination: Path,
+        max_bytes: int | None = None,
+    ) -> Path:
+        """
+        Stream an upload to `destination` without blocking the event loop.
+
+        Chunks go to a temp file in the destination directory, which is then
+        renamed into place, so readers never see a partially written file.
+        """
+        path, _ = await cls.save_hashed(file=file, destination=destination, max_bytes=max_bytes)
+        return path
+
+    @classmethod
+    async def save_hashed(
+        cls,
+        *,
+        file: UploadFile,
+        destination: Path,
+        max_bytes: int | None = None,
+    ) -> tuple[Path, str]:
+        """
+        Same as save(), also returning the SHA-256 hex digest of the contents.
+        """
+        digest = await asyncio.to_thread(
+            cls._stream_to_path,
+            file.file,
+            destination,
+            max_bytes or cls.MAX_IMAGE_BYTES,
+        )
+        return destination, digest
+
+    @staticmethod
+    def extension(file: UploadFile, default: str = ".jpg") -> str:
+        return Path(file.filename or "").suffix.lower() or default
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    @classmethod
+    def _stream_to_path(cls, source: BinaryIO, destination: Path, max_bytes: int) -> str:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        source.seek(0)
+
+        tmp = NamedTemporaryFile(
+            dir=destination.parent,
+            prefix=f".{destination.name}.",
+            suffix=".part",
+            delete=False,
+        )
+
+        try:
+            sha256 = hashlib.sha256()
+
+            with tmp:
+                written = 0
+                while chunk := source.read(cls.CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise UploadTooLargeError(
+                            f"Upload exceeds {max_bytes // (1024 * 1024)} MB limit"
+                        )
+                    sha256.update(chunk)
+                    tmp.write(chunk)
+
+            os.replace(tmp.name, destination)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+        return sha256.hexdigest()
+